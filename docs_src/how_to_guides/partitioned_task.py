@@ -0,0 +1,26 @@
+import json
+from pathlib import Path
+
+from pytask import PartitionedNode
+from pytask import Partitions
+from pytask import Product
+from typing_extensions import Annotated
+
+
+def task_count_rows(
+    partitions: Annotated[
+        Partitions, PartitionedNode(root_dir=Path("data"), pattern="day=*")
+    ],
+    path: Annotated[Path, Product] = Path("counts.json"),
+) -> None:
+    """Count the rows of each partition."""
+    counts = json.loads(path.read_text()) if partitions.is_incremental else {}
+
+    for partition in partitions.removed:
+        counts.pop(partition.name)
+    for partition in partitions.added + partitions.changed:
+        counts[partition.name] = sum(
+            len(file.read_text().splitlines()) for file in partition.glob("*.csv")
+        )
+
+    path.write_text(json.dumps(counts))
@@ -0,0 +1,85 @@
+"""Benchmark the write and read throughput of the options of the PickleNode.
+
+Run the script with ``python scripts/benchmark_pickle_node.py``. The payload is a
+dictionary with a large NumPy array, if NumPy is installed, or a bytearray, and a list of
+small objects. Install zstandard and lz4 to benchmark the compressions without falling back
+to gzip.
+
+"""
+
+from __future__ import annotations
+
+import argparse
+import tempfile
+import time
+from pathlib import Path
+from typing import Any
+
+from _pytask.pickle_utils import resolve_compression
+from pytask import PickleNode
+
+CONFIGURATIONS: list[dict[str, Any]] = [
+    {},
+    {"protocol": 5},
+    {"out_of_band": True},
+    {"compression": "gzip", "compression_level": 1},
+    {"compression": "lz4"},
+    {"compression": "zstd"},
+    {"compression": "zstd", "out_of_band": True},
+]
+
+
+def _create_payload(size: int) -> Any:
+    try:
+        import numpy as np
+    except ImportError:
+        array: Any = bytearray(size)
+        array[::7] = b"\x01" * len(array[::7])
+    else:
+        rng = np.random.default_rng(0)
+        array = rng.integers(0, 100, size // 8)
+    return {
+        "array": array,
+        "objects": [{"id": i, "name": str(i)} for i in range(10_000)],
+    }
+
+
+def _measure(func: Any, repetitions: int) -> float:
+    durations = []
+    for _ in range(repetitions):
+        start = time.perf_counter()
+        func()
+        durations.append(time.perf_counter() - start)
+    return min(durations)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--size", type=int, default=256, help="Payload size in MB.")
+    parser.add_argument("--repetitions", type=int, default=3)
+    args = parser.parse_args()
+
+    payload = _create_payload(args.size * 1024**2)
+
+    print(  # noqa: T201
+        f"{'Options':<50} {'Size (MB)':>10} {'Write (MB/s)':>13} {'Read (MB/s)':>12}"
+    )
+    with tempfile.TemporaryDirectory() as directory:
+        for configuration in CONFIGURATIONS:
+            node = PickleNode(path=Path(directory, "value.pkl"), **configuration)
+            write = _measure(lambda node=node: node.save(payload), args.repetitions)
+            read = _measure(lambda node=node: node.load(), args.repetitions)
+            file_size = node.path.stat().st_size / 1024**2
+
+            options = ", ".join(f"{k}={v!r}" for k, v in configuration.items())
+            compression = configuration.get("compression")
+            if resolve_compression(compression) != compression:
+                options += " (gzip)"
+            print(  # noqa: T201
+                f"{options or 'default':<50} {file_size:>10.1f} "
+                f"{args.size / write:>13.0f} {args.size / read:>12.0f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
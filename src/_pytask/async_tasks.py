@@ -0,0 +1,42 @@
+"""Contains hooks to execute tasks which are coroutine functions."""
+
+from __future__ import annotations
+
+from typing import Any
+
+import click
+
+from _pytask.async_utils import async_runner
+from _pytask.pluginmanager import hookimpl
+
+
+@hookimpl
+def pytask_extend_command_line_interface(cli: click.Group) -> None:
+    """Add the option to limit the number of concurrent coroutines."""
+    cli.commands["build"].params.append(
+        click.Option(
+            ["--max-async-tasks"],
+            type=click.IntRange(min=1),
+            default=10,
+            metavar="N",
+            help="Run at most N tasks defined with 'async def' at the same time.",
+        )
+    )
+
+
+@hookimpl
+def pytask_parse_config(config: dict[str, Any]) -> None:
+    """Parse the maximum number of concurrent coroutines."""
+    config["max_async_tasks"] = int(config.get("max_async_tasks") or 10)
+
+
+@hookimpl
+def pytask_post_parse(config: dict[str, Any]) -> None:
+    """Configure the runner."""
+    async_runner.max_concurrency = config["max_async_tasks"]
+
+
+@hookimpl
+def pytask_unconfigure() -> None:
+    """Stop the event loop."""
+    async_runner.stop()
@@ -0,0 +1,120 @@
+"""Contains utilities to execute tasks which are coroutine functions.
+
+Coroutines of tasks defined with ``async def`` run concurrently on one event loop in a
+background thread while other tasks are executed. A task is only finished when its
+coroutine is complete.
+
+"""
+
+from __future__ import annotations
+
+import asyncio
+import inspect
+import threading
+from typing import TYPE_CHECKING
+from typing import Any
+from typing import Coroutine
+
+from attrs import define
+from attrs import field
+
+if TYPE_CHECKING:
+    from concurrent.futures import Future
+
+    import networkx as nx
+
+    from _pytask.node_protocols import PTask
+
+
+__all__ = ["AsyncTaskRunner", "async_runner", "has_async_tasks", "is_async_task"]
+
+
+def is_async_task(task: PTask) -> bool:
+    """Check whether the function of a task is a coroutine function."""
+    return inspect.iscoroutinefunction(getattr(task, "function", None))
+
+
+def has_async_tasks(dag: nx.DiGraph) -> bool:
+    """Check whether any task in the DAG is a coroutine function."""
+    return any(
+        is_async_task(dag.nodes[signature]["task"])
+        for signature in dag.nodes
+        if "task" in dag.nodes[signature]
+    )
+
+
+@define
+class AsyncTaskRunner:
+    """Run coroutines of tasks on an event loop in a background thread.
+
+    Attributes
+    ----------
+    max_concurrency
+        The maximum number of coroutines which run at the same time.
+
+    """
+
+    max_concurrency: int = 10
+    _loop: asyncio.AbstractEventLoop | None = None
+    _thread: threading.Thread | None = None
+    _futures: dict[str, Future[Any]] = field(factory=dict)
+
+    @property
+    def is_started(self) -> bool:
+        return self._loop is not None
+
+    def start(self) -> None:
+        """Start the event loop."""
+        if self._loop is None:
+            self._loop = asyncio.new_event_loop()
+            self._thread = threading.Thread(
+                target=self._loop.run_forever, name="pytask-async", daemon=True
+            )
+            self._thread.start()
+
+    def stop(self) -> None:
+        """Stop the event loop after all coroutines are complete."""
+        if self._loop is None:
+            return
+        for future in self._futures.values():
+            future.exception()
+        self._futures.clear()
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        assert self._thread is not None
+        self._thread.join()
+        self._loop.close()
+        self._loop = None
+        self._thread = None
+
+    def is_full(self) -> bool:
+        """Check whether the maximum number of coroutines is running."""
+        return len(self.futures()) >= self.max_concurrency
+
+    def submit(self, task: PTask, coroutine: Coroutine[Any, Any, Any]) -> None:
+        """Run the coroutine of a task on the event loop."""
+        assert self._loop is not None
+        self._futures[task.signature] = asyncio.run_coroutine_threadsafe(
+            coroutine, self._loop
+        )
+
+    def is_running(self, task: PTask) -> bool:
+        """Check whether the coroutine of a task is not complete."""
+        future = self._futures.get(task.signature)
+        return future is not None and not future.done()
+
+    def is_complete(self, task: PTask) -> bool:
+        """Check whether the coroutine of a task is complete and has a result."""
+        future = self._futures.get(task.signature)
+        return future is not None and future.done()
+
+    def futures(self) -> list[Future[Any]]:
+        """Return the futures of all coroutines which are not complete."""
+        return [future for future in self._futures.values() if not future.done()]
+
+    def result(self, task: PTask) -> Any:
+        """Return the result of the coroutine of a task or raise its exception."""
+        return self._futures.pop(task.signature).result()
+
+
+async_runner = AsyncTaskRunner()
+"""AsyncTaskRunner: The runner which executes coroutines of tasks."""
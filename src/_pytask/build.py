@@ -70,6 +70,7 @@ def build(  # noqa: C901, PLR0912, PLR0913
     capture: Literal["fd", "no", "sys", "tee-sys"] | CaptureMethod = CaptureMethod.FD,
     check_casing_of_paths: bool = True,
     config: Path | None = None,
+    coordinator: str | None = None,
     database_url: str = "",
     debug_pytask: bool = False,
     disable_warnings: bool = False,
@@ -80,11 +81,18 @@ def build(  # noqa: C901, PLR0912, PLR0913
     force: bool = False,
     ignore: Iterable[str] = (),
     marker_expression: str = "",
+    max_async_tasks: int = 10,
     max_failures: float = float("inf"),
+    max_tasks_per_worker: int = 0,
+    max_worker_memory: int = 0,
     n_entries_in_table: int = 15,
     paths: Path | Iterable[Path] = (),
     pdb: bool = False,
     pdb_cls: str = "",
+    prefetch_size: int = 0,
+    python_node_budget: int = 0,
+    remote_cache_size: int = 0,
+    resources: dict[str, Any] | str | None = None,
     s: bool = False,
     show_capture: Literal["no", "stdout", "stderr", "all"]
     | ShowCapture = ShowCapture.ALL,
@@ -94,10 +102,14 @@ def build(  # noqa: C901, PLR0912, PLR0913
     sort_table: bool = True,
     stop_after_first_failure: bool = False,
     strict_markers: bool = False,
+    target: str | Iterable[str] = (),
     tasks: Callable[..., Any] | PTask | Iterable[Callable[..., Any] | PTask] = (),
     task_files: Iterable[str] = ("task_*.py",),
     trace: bool = False,
+    value_cache_size: int = 0,
     verbose: int = 1,
+    worker_processes: int = 0,
+    write_behind: int = 0,
     **kwargs: Any,
 ) -> Session:
     """Run pytask.
@@ -114,6 +126,9 @@ def build(  # noqa: C901, PLR0912, PLR0913
         Whether errors should be raised when file names have different casings.
     config
         A path to the configuration file.
+    coordinator
+        An address like ``"node01:5000"`` where workers started with ``pytask worker
+        --connect node01:5000`` connect to execute tasks.
     database_url
         An URL to the database that tracks the status of tasks.
     debug_pytask
@@ -134,8 +149,17 @@ def build(  # noqa: C901, PLR0912, PLR0913
         more info.
     marker_expression
         Same as ``-m`` on the command line. Select tasks via marker expressions.
+    max_async_tasks
+        The maximum number of tasks defined with ``async def`` which run at the same
+        time.
     max_failures
         Stop after some failures.
+    max_tasks_per_worker
+        The number of tasks after which a worker process is replaced. Workers are not
+        replaced with 0.
+    max_worker_memory
+        The memory in MB above which a worker process is replaced after a task. Workers
+        are not replaced with 0.
     n_entries_in_table
         How many entries to display in the table during the execution. Tasks which are
         running are always displayed.
@@ -147,6 +171,18 @@ def build(  # noqa: C901, PLR0912, PLR0913
     pdb_cls
         Start a custom debugger on errors. For example:
         ``--pdbcls=IPython.terminal.debugger:TerminalPdb``
+    prefetch_size
+        The size of dependencies of upcoming tasks in MB which are loaded in the
+        background. Prefetching is disabled with 0.
+    python_node_budget
+        The memory budget for values of :class:`~pytask.PythonNode` in MB. Values are
+        spilled to disk if they exceed the budget. Values are never spilled with 0.
+    remote_cache_size
+        The size of the local cache of remote dependencies in MB. The cache is disabled
+        with 0.
+    resources
+        The capacities of resources which are needed by tasks marked with
+        ``@pytask.mark.resources``, for example, ``{"memory": "64GB", "db": 4}``.
     s
         Shortcut for ``capture="no"``.
     show_capture
@@ -163,6 +199,9 @@ def build(  # noqa: C901, PLR0912, PLR0913
         Stop after the first failure.
     strict_markers
         Raise errors for unknown markers.
+    target
+        A product or a task id or a collection of them. Only the targets and the tasks
+        they depend on are collected and executed.
     tasks
         A task or a collection of tasks which can be callables or instances following
         {class}`~pytask.PTask`.
@@ -170,8 +209,17 @@ def build(  # noqa: C901, PLR0912, PLR0913
         A pattern to describe modules that contain tasks.
     trace
         Enter debugger in the beginning of each task.
+    value_cache_size
+        The size of the in-memory cache of values of :class:`~pytask.PickleNode` in MB.
+        The cache is disabled with 0.
     verbose
         Make pytask verbose (>= 0) or quiet (= 0).
+    worker_processes
+        The number of worker processes which execute tasks. Tasks are executed in the
+        main process with 0.
+    write_behind
+        The number of threads which save products of tasks in the background. Products
+        are saved immediately with 0.
 
     Returns
     -------
@@ -184,6 +232,7 @@ def build(  # noqa: C901, PLR0912, PLR0913
             "capture": capture,
             "check_casing_of_paths": check_casing_of_paths,
             "config": config,
+            "coordinator": coordinator,
             "database_url": database_url,
             "debug_pytask": debug_pytask,
             "disable_warnings": disable_warnings,
@@ -193,11 +242,18 @@ def build(  # noqa: C901, PLR0912, PLR0913
             "force": force,
             "ignore": ignore,
             "marker_expression": marker_expression,
+            "max_async_tasks": max_async_tasks,
             "max_failures": max_failures,
+            "max_tasks_per_worker": max_tasks_per_worker,
+            "max_worker_memory": max_worker_memory,
             "n_entries_in_table": n_entries_in_table,
             "paths": paths,
             "pdb": pdb,
             "pdb_cls": pdb_cls,
+            "prefetch_size": prefetch_size,
+            "python_node_budget": python_node_budget,
+            "remote_cache_size": remote_cache_size,
+            "resources": resources,
             "s": s,
             "show_capture": show_capture,
             "show_errors_immediately": show_errors_immediately,
@@ -206,10 +262,14 @@ def build(  # noqa: C901, PLR0912, PLR0913
             "sort_table": sort_table,
             "stop_after_first_failure": stop_after_first_failure,
             "strict_markers": strict_markers,
+            "target": target,
             "tasks": tasks,
             "task_files": task_files,
             "trace": trace,
+            "value_cache_size": value_cache_size,
             "verbose": verbose,
+            "worker_processes": worker_processes,
+            "write_behind": write_behind,
             **kwargs,
         }
 
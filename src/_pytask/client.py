@@ -0,0 +1,139 @@
+"""Contains a thin client for the build daemon started with ``pytask serve``.
+
+The module only imports the standard library so that requests are answered in
+milliseconds instead of paying the startup costs of pytask.
+
+"""
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import json
+import os
+import socket
+import sys
+import tempfile
+from pathlib import Path
+from typing import Any
+from typing import Sequence
+
+__all__ = [
+    "COMMANDS",
+    "SOCKET_NAME",
+    "find_socket",
+    "get_socket_path",
+    "main",
+    "request",
+]
+
+
+COMMANDS = ("build", "collect", "dag", "shutdown", "status")
+"""tuple[str, ...]: The commands understood by the daemon."""
+
+SOCKET_NAME = "pytask.sock"
+"""str: The name of the socket inside the ``.pytask`` folder of a project."""
+
+
+_MAX_SOCKET_PATH_LENGTH = 95
+"""int: The maximum length of the path to a socket in bytes.
+
+Paths of UNIX domain sockets are limited to 103 bytes on macOS and 107 bytes on Linux
+without the terminating null byte. The limit leaves room for the suffix with the process
+id of the temporary path which the daemon binds to.
+
+"""
+
+
+def get_socket_path(root: Path) -> Path:
+    """Get the path to the socket of the daemon of a project.
+
+    The socket is placed in the ``.pytask`` folder of the project. If the path is too
+    long for a UNIX domain socket, the socket is placed in the runtime or temporary
+    directory with a name derived from the project's root.
+
+    """
+    path = root / ".pytask" / SOCKET_NAME
+    if len(os.fsencode(path)) <= _MAX_SOCKET_PATH_LENGTH:
+        return path
+    directory = os.environ.get("XDG_RUNTIME_DIR") or tempfile.gettempdir()
+    digest = hashlib.sha256(os.fsencode(root)).hexdigest()[:16]
+    return Path(directory, f"pytask-{digest}.sock")
+
+
+def find_socket(path: Path | None = None) -> Path:
+    """Find the socket of a running daemon.
+
+    The socket is searched for the given directory or the current working directory
+    and all its parents. Sockets which are left over from daemons which did not shut
+    down properly refuse connections and are removed.
+
+    """
+    path = (Path.cwd() if path is None else Path(path)).resolve()
+    for directory in (path, *path.parents):
+        candidate = get_socket_path(directory)
+        if candidate.exists():
+            if _accepts_connections(candidate):
+                return candidate
+            candidate.unlink(missing_ok=True)
+    msg = f"No running daemon found for {path}. Start one with 'pytask serve'."
+    raise FileNotFoundError(msg)
+
+
+def _accepts_connections(path: Path) -> bool:
+    """Check whether a daemon listens at the socket."""
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as connection:
+        try:
+            connection.connect(str(path))
+        except (ConnectionRefusedError, FileNotFoundError):
+            return False
+    return True
+
+
+def request(
+    command: str, socket_path: Path | str | None = None, timeout: float | None = None
+) -> dict[str, Any]:
+    """Send a request to the daemon and return its response.
+
+    Parameters
+    ----------
+    command
+        One of ``"build"``, ``"collect"``, ``"dag"``, ``"status"``, or ``"shutdown"``.
+    socket_path
+        The path to the socket. By default, the socket is searched with
+        :func:`find_socket`.
+    timeout
+        Seconds to wait for the response. By default, wait until the daemon responds.
+
+    """
+    path = find_socket() if socket_path is None else Path(socket_path)
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as connection:
+        connection.settimeout(timeout)
+        connection.connect(str(path))
+        connection.sendall(json.dumps({"command": command}).encode() + b"\n")
+        with connection.makefile("rb") as file:
+            response = file.readline()
+    return json.loads(response)
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    """Send a request from the command line and print the response as JSON.
+
+    The exit code is the exit code of the daemon's response.
+
+    """
+    parser = argparse.ArgumentParser(
+        prog="python -m pytask.client", description="Talk to a 'pytask serve' daemon."
+    )
+    parser.add_argument("command", choices=COMMANDS)
+    parser.add_argument("--socket", type=Path, default=None, help="Path to the socket.")
+    args = parser.parse_args(argv)
+
+    try:
+        response = request(args.command, args.socket)
+    except OSError as e:
+        print(e, file=sys.stderr)  # noqa: T201
+        return 1
+
+    print(json.dumps(response, indent=2))  # noqa: T201
+    return int(response.get("exit_code", 0))
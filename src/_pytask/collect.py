@@ -14,7 +14,6 @@ from typing import Generator
 from typing import Iterable
 
 from rich.text import Text
-from upath import UPath
 
 from _pytask.collect_utils import create_name_of_python_node
 from _pytask.collect_utils import parse_dependencies_from_task_function
@@ -33,12 +32,14 @@ from _pytask.node_protocols import PPathNode
 from _pytask.node_protocols import PProvisionalNode
 from _pytask.node_protocols import PTask
 from _pytask.nodes import DirectoryNode
+from _pytask.nodes import PartitionedNode
 from _pytask.nodes import PathNode
 from _pytask.nodes import PythonNode
 from _pytask.nodes import Task
 from _pytask.nodes import TaskWithoutPath
 from _pytask.outcomes import CollectionOutcome
 from _pytask.outcomes import count_outcomes
+from _pytask.path import compile_path_patterns
 from _pytask.path import find_case_sensitive_path
 from _pytask.path import import_path
 from _pytask.path import shorten_path
@@ -46,12 +47,14 @@ from _pytask.pluginmanager import hookimpl
 from _pytask.reports import CollectionReport
 from _pytask.shared import find_duplicates
 from _pytask.shared import to_list
+from _pytask.target_utils import collect_modules_of_targets
 from _pytask.task_utils import COLLECTED_TASKS
 from _pytask.task_utils import task as task_decorator
 from _pytask.typing import is_task_function
 
 if TYPE_CHECKING:
     from _pytask.models import NodeInfo
+    from _pytask.path import PathPatternMatcher
     from _pytask.session import Session
 
 
@@ -89,9 +92,16 @@ def _collect_from_paths(session: Session) -> None:
     """Collect tasks from paths.
 
     Go through all paths, check if the path is ignored, and collect the file if not.
+    When targets are requested, only the task modules needed to build them are
+    collected.
 
     """
-    for path in _not_ignored_paths(session.config["paths"], session):
+    paths = _not_ignored_paths(session.config["paths"], session)
+    if session.config.get("target"):
+        collect_modules_of_targets(session, paths)
+        return
+
+    for path in paths:
         reports = session.hook.pytask_collect_file_protocol(
             session=session, path=path, reports=session.collection_reports
         )
@@ -173,7 +183,7 @@ def _collect_not_collected_tasks(session: Session) -> None:
 @hookimpl
 def pytask_ignore_collect(path: Path, config: dict[str, Any]) -> bool:
     """Ignore a path during the collection."""
-    return any(path.match(pattern) for pattern in config["ignore"])
+    return compile_path_patterns(tuple(config["ignore"]))(path)
 
 
 @hookimpl
@@ -205,7 +215,7 @@ def pytask_collect_file(
     session: Session, path: Path, reports: list[CollectionReport]
 ) -> list[CollectionReport] | None:
     """Collect a file."""
-    if any(path.match(pattern) for pattern in session.config["task_files"]):
+    if compile_path_patterns(tuple(session.config["task_files"]))(path):
         mod = import_path(path, session.config["root"])
 
         collected_reports = []
@@ -377,6 +387,8 @@ def pytask_collect_node(  # noqa: C901, PLR0912
         working directory for tasks defined in the REPL or in Jupyter notebooks.
 
     """
+    from upath import UPath
+
     node = node_info.value
 
     if isinstance(node, DirectoryNode):
@@ -391,6 +403,17 @@ def pytask_collect_node(  # noqa: C901, PLR0912
             )
             node.name = Path(short_root_dir, node.pattern).as_posix()
 
+    if isinstance(node, PartitionedNode):
+        if node.root_dir is None:
+            node.root_dir = path
+        elif not node.root_dir.is_absolute():
+            node.root_dir = path.joinpath(node.root_dir)
+        if not node.name:
+            short_root_dir = shorten_path(
+                node.root_dir, session.config["paths"] or (session.config["root"],)
+            )
+            node.name = Path(short_root_dir, node.pattern).as_posix()
+
     if isinstance(node, PProvisionalNode):
         return node
 
@@ -516,16 +539,70 @@ def _not_ignored_paths(
     directories, all subsequent files and folders are considered, but one level after
     another, so that files of ignored folders are not checked.
 
+    Directories are traversed with :func:`os.scandir` to reuse the type information of
+    each entry. If no plugin implements :func:`~pytask.hookspecs.pytask_ignore_collect`,
+    the ignore patterns are matched directly with a precompiled matcher and directories
+    whose children are all ignored, like ``.git/*``, are not entered at all.
+
     """
+    own_impls_only = all(
+        impl.plugin is sys.modules[__name__]
+        for impl in session.hook.pytask_ignore_collect.get_hookimpls()
+    )
+    matcher = (
+        compile_path_patterns(tuple(session.config["ignore"]))
+        if own_impls_only
+        else None
+    )
+
     for path in paths:
-        if not session.hook.pytask_ignore_collect(path=path, config=session.config):
+        if matcher is None:
+            is_ignored = session.hook.pytask_ignore_collect(
+                path=path, config=session.config
+            )
+        else:
+            is_ignored = matcher(path)
+
+        if not is_ignored:
             if path.is_dir():
-                files_in_dir = path.iterdir()
-                yield from _not_ignored_paths(files_in_dir, session)
+                yield from _scan_directory(path, path.parts, session, matcher)
             else:
                 yield path
 
 
+def _scan_directory(
+    path: Path,
+    parts: tuple[str, ...],
+    session: Session,
+    matcher: PathPatternMatcher | None,
+) -> Generator[Path, None, None]:
+    """Scan a directory recursively and yield not ignored files."""
+    if matcher is not None and matcher.matches_all_children(parts):
+        return
+
+    with os.scandir(path) as it:
+        entries = list(it)
+
+    for entry in entries:
+        entry_parts = (*parts, entry.name)
+        entry_path = path.joinpath(entry.name)
+
+        if matcher is None:
+            is_ignored = session.hook.pytask_ignore_collect(
+                path=entry_path, config=session.config
+            )
+        else:
+            is_ignored = matcher.match_parts(entry_parts)
+
+        if is_ignored:
+            continue
+
+        if entry.is_dir():
+            yield from _scan_directory(entry_path, entry_parts, session, matcher)
+        else:
+            yield entry_path
+
+
 @hookimpl(trylast=True)
 def pytask_collect_modify_tasks(tasks: list[PTask]) -> None:
     """Given all tasks, assign a short uniquely identifiable name to each task."""
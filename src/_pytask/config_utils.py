@@ -31,7 +31,9 @@ def set_defaults_from_config(
     # to this command. They might expect the defaults coming from their related
     # command-line options during parsing. Here, we add their defaults to the
     # configuration.
-    command_option_names = [option.name for option in context.command.params]
+    command_option_names = [
+        option.name for option in context.command.get_params(context)
+    ]
     commands = context.parent.command.commands  # type: ignore[union-attr]
     all_defaults_from_cli = {
         option.name: option.default
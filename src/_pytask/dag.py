@@ -6,7 +6,6 @@ import itertools
 import sys
 from typing import TYPE_CHECKING
 
-import networkx as nx
 from rich.text import Text
 from rich.tree import Tree
 
@@ -18,7 +17,7 @@ from _pytask.console import format_node_name
 from _pytask.console import format_task_name
 from _pytask.console import render_to_string
 from _pytask.exceptions import ResolvingDependenciesError
-from _pytask.mark import select_by_after_keyword
+from _pytask.mark import select_by_after_keywords
 from _pytask.mark import select_tasks_by_marks_and_expressions
 from _pytask.node_protocols import PNode
 from _pytask.node_protocols import PProvisionalNode
@@ -26,11 +25,14 @@ from _pytask.node_protocols import PTask
 from _pytask.nodes import PythonNode
 from _pytask.reports import DagReport
 from _pytask.shared import reduce_names_of_multiple_nodes
+from _pytask.target_utils import select_subgraph_of_targets
 from _pytask.tree_util import tree_map
 
 if TYPE_CHECKING:
     from pathlib import Path
 
+    import networkx as nx
+
     from _pytask.session import Session
 
 
@@ -56,12 +58,15 @@ def create_dag_from_session(session: Session) -> nx.DiGraph:
     _check_if_dag_has_cycles(dag)
     _check_if_tasks_have_the_same_products(dag, session.config["paths"])
     dag = _modify_dag(session=session, dag=dag)
+    if session.config.get("target"):
+        dag = select_subgraph_of_targets(session, dag)
     select_tasks_by_marks_and_expressions(session=session, dag=dag)
     return dag
 
 
 def _create_dag_from_tasks(tasks: list[PTask]) -> nx.DiGraph:
     """Create the DAG from tasks, dependencies and products."""
+    import networkx as nx
 
     def _add_dependency(
         dag: nx.DiGraph, task: PTask, node: PNode | PProvisionalNode
@@ -110,6 +115,15 @@ def _modify_dag(session: Session, dag: nx.DiGraph) -> nx.DiGraph:
         for task in session.tasks
         if "collection_id" in task.attributes
     }
+    # Resolve all expressions in one pass which shares the index of task names.
+    signatures_by_after = select_by_after_keywords(
+        session,
+        (
+            task.attributes["after"]
+            for task in session.tasks
+            if isinstance(task.attributes.get("after"), str)
+        ),
+    )
     for task in session.tasks:
         after = task.attributes.get("after")
         if isinstance(after, list):
@@ -118,9 +132,7 @@ def _modify_dag(session: Session, dag: nx.DiGraph) -> nx.DiGraph:
                 for successor in dag.successors(other_task.signature):
                     dag.add_edge(successor, task.signature)
         elif isinstance(after, str):
-            task_signature = task.signature
-            signatures = select_by_after_keyword(session, after)
-            signatures.discard(task_signature)
+            signatures = signatures_by_after[after] - {task.signature}
             for signature in signatures:
                 for successor in dag.successors(signature):
                     dag.add_edge(successor, task.signature)
@@ -129,6 +141,8 @@ def _modify_dag(session: Session, dag: nx.DiGraph) -> nx.DiGraph:
 
 def _check_if_dag_has_cycles(dag: nx.DiGraph) -> None:
     """Check if DAG has cycles."""
+    import networkx as nx
+
     try:
         cycles = nx.algorithms.cycles.find_cycle(dag)
     except nx.NetworkXNoCycle:
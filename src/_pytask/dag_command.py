@@ -5,10 +5,10 @@ from __future__ import annotations
 import enum
 import sys
 from pathlib import Path
+from typing import TYPE_CHECKING
 from typing import Any
 
 import click
-import networkx as nx
 from rich.text import Text
 
 from _pytask.click import ColoredCommand
@@ -32,6 +32,9 @@ from _pytask.shared import reduce_names_of_multiple_nodes
 from _pytask.shared import to_list
 from _pytask.traceback import Traceback
 
+if TYPE_CHECKING:
+    import networkx as nx
+
 
 class _RankDirection(enum.Enum):
     TB = "TB"
@@ -220,6 +223,8 @@ def _refine_dag(session: Session) -> nx.DiGraph:
 
 def _shorten_node_labels(dag: nx.DiGraph, paths: list[Path]) -> nx.DiGraph:
     """Shorten the node labels in the graph for a better experience."""
+    import networkx as nx
+
     node_names = dag.nodes
     short_names = reduce_names_of_multiple_nodes(node_names, dag, paths)
     short_names = [i.plain if isinstance(i, Text) else i for i in short_names]  # type: ignore[attr-defined]
@@ -236,6 +241,8 @@ def _clean_dag(dag: nx.DiGraph) -> nx.DiGraph:
 
 def _style_dag(dag: nx.DiGraph) -> nx.DiGraph:
     """Style the DAG."""
+    import networkx as nx
+
     shapes = {name: "hexagon" if "::task_" in name else "box" for name in dag.nodes}
     nx.set_node_attributes(dag, shapes, "shape")
     return dag
@@ -243,6 +250,8 @@ def _style_dag(dag: nx.DiGraph) -> nx.DiGraph:
 
 def _write_graph(dag: nx.DiGraph, path: Path, layout: str) -> None:
     """Write the graph to disk."""
+    import networkx as nx
+
     path.parent.mkdir(exist_ok=True, parents=True)
     graph = nx.nx_agraph.to_agraph(dag)
     graph.draw(path, prog=layout)
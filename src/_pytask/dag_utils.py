@@ -7,18 +7,22 @@ from typing import TYPE_CHECKING
 from typing import Generator
 from typing import Iterable
 
-import networkx as nx
 from attrs import define
 from attrs import field
 
 from _pytask.mark_utils import has_mark
+from _pytask.resources_utils import get_resources_of_task
 
 if TYPE_CHECKING:
+    import networkx as nx
+
     from _pytask.node_protocols import PTask
 
 
 def descending_tasks(task_name: str, dag: nx.DiGraph) -> Generator[str, None, None]:
     """Yield only descending tasks."""
+    import networkx as nx
+
     for descendant in nx.descendants(dag, task_name):
         if "task" in dag.nodes[descendant]:
             yield descendant
@@ -34,6 +38,8 @@ def task_and_descending_tasks(
 
 def preceding_tasks(task_name: str, dag: nx.DiGraph) -> Generator[str, None, None]:
     """Yield only preceding tasks."""
+    import networkx as nx
+
     for ancestor in nx.ancestors(dag, task_name):
         if "task" in dag.nodes[ancestor]:
             yield ancestor
@@ -47,6 +53,24 @@ def task_and_preceding_tasks(
     yield from preceding_tasks(task_name, dag)
 
 
+def tasks_and_preceding_tasks(task_names: Iterable[str], dag: nx.DiGraph) -> set[str]:
+    """Return the tasks and all their preceding tasks.
+
+    Instead of computing the ancestors of every task separately, the DAG is traversed
+    once in reverse starting from all tasks at the same time. Every node is visited at
+    most once which makes the selection linear in the size of the DAG.
+
+    """
+    visited = set(task_names)
+    stack = list(visited)
+    while stack:
+        for predecessor in dag.predecessors(stack.pop()):
+            if predecessor not in visited:
+                visited.add(predecessor)
+                stack.append(predecessor)
+    return {node for node in visited if "task" in dag.nodes[node]}
+
+
 def node_and_neighbors(dag: nx.DiGraph, node: str) -> Iterable[str]:
     """Yield node and neighbors which are first degree predecessors and successors.
 
@@ -73,23 +97,40 @@ class TopologicalSorter:
     priorities
         A dictionary of task names to a priority value. 1 for try first, 0 for the
         default priority and, -1 for try last.
+    resources
+        A dictionary of task names to the resources the tasks need. Tasks which are
+        missing do not need any resources.
+    capacities
+        A dictionary of resources to the available amounts. Tasks are only ready if
+        their resources fit into the capacities minus the resources of processing
+        tasks. Resources without capacities are unlimited.
 
     """
 
     dag: nx.DiGraph
     priorities: dict[str, int] = field(factory=dict)
+    resources: dict[str, dict[str, float]] = field(factory=dict)
+    capacities: dict[str, float] = field(factory=dict)
     _nodes_processing: set[str] = field(factory=set)
     _nodes_done: set[str] = field(factory=set)
+    _reserved: dict[str, dict[str, float]] = field(factory=dict)
 
     @classmethod
     def from_dag(cls, dag: nx.DiGraph) -> TopologicalSorter:
         """Instantiate from a DAG."""
+        import networkx as nx
+
         cls.check_dag(dag)
 
         tasks = [
             dag.nodes[node]["task"] for node in dag.nodes if "task" in dag.nodes[node]
         ]
         priorities = _extract_priorities_from_tasks(tasks)
+        resources = {
+            task.signature: get_resources_of_task(task)
+            for task in tasks
+            if has_mark(task, "resources")
+        }
 
         task_signatures = {task.signature for task in tasks}
         task_dict = {
@@ -97,7 +138,7 @@ class TopologicalSorter:
         }
         task_dag = nx.DiGraph(task_dict).reverse()
 
-        return cls(dag=task_dag, priorities=priorities)
+        return cls(dag=task_dag, priorities=priorities, resources=resources)
 
     @classmethod
     def from_dag_and_sorter(
@@ -107,10 +148,14 @@ class TopologicalSorter:
         new_sorter = cls.from_dag(dag)
         new_sorter.done(*sorter._nodes_done)
         new_sorter._nodes_processing = sorter._nodes_processing
+        new_sorter.capacities = sorter.capacities
+        new_sorter._reserved = sorter._reserved
         return new_sorter
 
     @staticmethod
     def check_dag(dag: nx.DiGraph) -> None:
+        import networkx as nx
+
         if not dag.is_directed():
             msg = "Only directed graphs have a topological order."
             raise ValueError(msg)
@@ -125,6 +170,15 @@ class TopologicalSorter:
 
     def get_ready(self, n: int = 1) -> list[str]:
         """Get up to ``n`` tasks which are ready."""
+        prioritized_nodes = self.peek_ready(n)
+        self._nodes_processing.update(prioritized_nodes)
+        for node in prioritized_nodes:
+            if node in self.resources:
+                self._reserved[node] = self.resources[node]
+        return prioritized_nodes
+
+    def peek_ready(self, n: int = 1) -> list[str]:
+        """Get up to ``n`` tasks which are ready without marking them as processing."""
         if not isinstance(n, int) or n < 1:
             msg = "'n' must be an integer greater or equal than 1."
             raise ValueError(msg)
@@ -132,13 +186,38 @@ class TopologicalSorter:
         ready_nodes = {
             v for v, d in self.dag.in_degree() if d == 0
         } - self._nodes_processing
-        prioritized_nodes = sorted(
-            ready_nodes, key=lambda x: self.priorities.get(x, 0)
-        )[-n:]
-
-        self._nodes_processing.update(prioritized_nodes)
-
-        return prioritized_nodes
+        prioritized_nodes = sorted(ready_nodes, key=lambda x: self.priorities.get(x, 0))
+        if not self.capacities or not self.resources:
+            return prioritized_nodes[-n:]
+        return self._select_fitting_nodes(prioritized_nodes, n)
+
+    def _select_fitting_nodes(self, prioritized_nodes: list[str], n: int) -> list[str]:
+        """Select the tasks with the highest priorities whose resources fit.
+
+        A task which needs more resources than the capacities is only selected if no
+        other task is processing so that it runs alone.
+
+        """
+        in_use: dict[str, float] = {}
+        for resources in self._reserved.values():
+            for name, amount in resources.items():
+                in_use[name] = in_use.get(name, 0) + amount
+
+        selected: list[str] = []
+        for node in reversed(prioritized_nodes):
+            resources = self.resources.get(node, {})
+            fits = all(
+                in_use.get(name, 0) + amount <= self.capacities[name]
+                for name, amount in resources.items()
+                if name in self.capacities
+            )
+            if fits or (not self._reserved and not selected):
+                selected.append(node)
+                for name, amount in resources.items():
+                    in_use[name] = in_use.get(name, 0) + amount
+                if len(selected) == n:
+                    break
+        return selected[::-1]
 
     def is_active(self) -> bool:
         """Indicate whether there are still tasks left."""
@@ -147,6 +226,8 @@ class TopologicalSorter:
     def done(self, *nodes: str) -> None:
         """Mark some tasks as done."""
         self._nodes_processing = self._nodes_processing - set(nodes)
+        for node in nodes:
+            self._reserved.pop(node, None)
         self.dag.remove_nodes_from(nodes)
         self._nodes_done.update(nodes)
 
@@ -11,17 +11,22 @@ import inspect
 import pickle
 from pathlib import Path
 from typing import Any
+from typing import Iterator
 
 from attrs import define
 from attrs import field
 
 from _pytask.config_utils import find_project_root_and_config
+from _pytask.data_catalog_utils import MANIFEST_NAME
+from _pytask.data_catalog_utils import CatalogManifest
+from _pytask.data_catalog_utils import flush_manifests
 from _pytask.exceptions import NodeNotCollectedError
 from _pytask.models import NodeInfo
 from _pytask.node_protocols import PNode
 from _pytask.node_protocols import PPathNode
 from _pytask.node_protocols import PProvisionalNode
 from _pytask.nodes import PickleNode
+from _pytask.pluginmanager import hookimpl
 from _pytask.pluginmanager import storage
 from _pytask.session import Session
 
@@ -49,7 +54,9 @@ class DataCatalog:
         :mod:`pickle` module.
     entries
         A collection of entries in the catalog. Entries can be :class:`~pytask.PNode` or
-        a :class:`DataCatalog` itself for nesting catalogs.
+        a :class:`DataCatalog` itself for nesting catalogs. Entries which were created
+        automatically in previous runs are added when they are requested for the first
+        time.
     name
         The name of the data catalog. Use it when you are working with multiple data
         catalogs that store data under the same keys.
@@ -67,6 +74,7 @@ class DataCatalog:
         factory=lambda *x: {"check_casing_of_paths": True}  # noqa: ARG005
     )
     _instance_path: Path = field(factory=_get_parent_path_of_data_catalog_module)
+    _manifest: CatalogManifest = field(init=False, eq=False, repr=False)
 
     def __attrs_post_init__(self) -> None:
         root_path, _ = find_project_root_and_config((self._instance_path,))
@@ -80,17 +88,42 @@ class DataCatalog:
         self._initialize()
 
     def _initialize(self) -> None:
-        """Initialize the data catalog with persisted nodes from previous runs."""
-        for path in self.path.glob("*-node.pkl"):  # type: ignore[union-attr]
+        """Initialize the manifest with persisted nodes from previous runs.
+
+        Nodes are only loaded when they are requested. Nodes which were stored in
+        separate files by previous versions are moved into the manifest.
+
+        """
+        self._manifest = CatalogManifest(self.path / MANIFEST_NAME)  # type: ignore[operator]
+        if self._manifest.exists():
+            return
+
+        paths = list(self.path.glob("*-node.pkl"))  # type: ignore[union-attr]
+        for path in paths:
             node = pickle.loads(path.read_bytes())  # noqa: S301
-            self.entries[node.name] = node
+            self._manifest.add(node.name, node)
+        if paths:
+            self._manifest.flush()
+            for path in paths:
+                path.unlink()
 
     def __getitem__(self, name: str) -> PNode | PProvisionalNode:
         """Allow to access entries with the squared brackets syntax."""
         if name not in self.entries:
-            self.add(name)
+            node = self._manifest.get(name)
+            if node is None:
+                self.add(name)
+            else:
+                self.entries[name] = node
         return self.entries[name]
 
+    def __contains__(self, name: str) -> bool:
+        return name in self.entries or self._manifest.get(name) is not None
+
+    def __iter__(self) -> Iterator[str]:
+        """Iterate over the names of all entries including persisted ones."""
+        return iter(sorted(set(self.entries).union(self._manifest.names())))
+
     def add(self, name: str, node: PNode | PProvisionalNode | None = None) -> None:
         """Add an entry to the data catalog."""
         assert isinstance(self.path, Path)
@@ -107,9 +140,7 @@ class DataCatalog:
                 )
             else:
                 self.entries[name] = self.default_node(name=name)  # type: ignore[call-arg]
-            self.path.joinpath(f"{filename}-node.pkl").write_bytes(
-                pickle.dumps(self.entries[name])
-            )
+            self._manifest.add(name, self.entries[name])
         elif isinstance(node, (PNode, PProvisionalNode)):
             self.entries[name] = node
         else:
@@ -126,3 +157,9 @@ class DataCatalog:
                 msg = f"{node!r} cannot be parsed."
                 raise NodeNotCollectedError(msg)
             self.entries[name] = collected_node
+
+
+@hookimpl
+def pytask_collect_modify_tasks() -> None:
+    """Write new entries of data catalogs after all task modules are imported."""
+    flush_manifests()
@@ -0,0 +1,134 @@
+"""Contains utilities for the data catalog.
+
+Entries of a data catalog which are created automatically are stored in a manifest, a
+SQLite database inside the directory of the catalog. An entry is only unpickled when it
+is requested for the first time, and new entries are written in batches.
+
+"""
+
+from __future__ import annotations
+
+import os
+import pickle
+import sqlite3
+import weakref
+from typing import TYPE_CHECKING
+from typing import Any
+
+from attrs import define
+from attrs import field
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+__all__ = ["MANIFEST_NAME", "CatalogManifest", "flush_manifests"]
+
+
+MANIFEST_NAME = "manifest.sqlite3"
+"""str: The name of the manifest inside the directory of a data catalog."""
+
+_MANIFESTS_WITH_PENDING_ENTRIES: weakref.WeakSet[CatalogManifest] = weakref.WeakSet()
+
+
+@define(eq=False)
+class CatalogManifest:
+    """A manifest which stores the pickled entries of a data catalog.
+
+    Attributes
+    ----------
+    path
+        The path to the SQLite database.
+    batch_size
+        The number of new entries which are collected before they are written.
+
+    """
+
+    path: Path
+    batch_size: int = 1_000
+    _pending: dict[str, bytes] = field(factory=dict, init=False)
+    _connection: sqlite3.Connection | None = field(default=None, init=False)
+    _pid: int | None = field(default=None, init=False)
+
+    def __attrs_post_init__(self) -> None:
+        # Write pending entries when the process exits.
+        weakref.finalize(self, _flush_pending, self.path, self._pending)
+
+    @property
+    def connection(self) -> sqlite3.Connection:
+        """Return a connection to the manifest which is not shared with forks."""
+        if self._connection is None or self._pid != os.getpid():
+            self._connection = _connect(self.path)
+            self._pid = os.getpid()
+        return self._connection
+
+    def exists(self) -> bool:
+        return self.path.exists()
+
+    def get(self, name: str) -> Any | None:
+        """Get an entry or ``None`` if the entry is not stored."""
+        if name in self._pending:
+            return pickle.loads(self._pending[name])  # noqa: S301
+        if not self.exists():
+            return None
+        row = self.connection.execute(
+            "SELECT node FROM entries WHERE name = ?", (name,)
+        ).fetchone()
+        return None if row is None else pickle.loads(row[0])  # noqa: S301
+
+    def names(self) -> list[str]:
+        """Return the names of all stored entries."""
+        names = set(self._pending)
+        if self.exists():
+            names.update(
+                name for (name,) in self.connection.execute("SELECT name FROM entries")
+            )
+        return sorted(names)
+
+    def add(self, name: str, node: Any) -> None:
+        """Add an entry which is written with the next batch."""
+        self._pending[name] = pickle.dumps(node)
+        _MANIFESTS_WITH_PENDING_ENTRIES.add(self)
+        if len(self._pending) >= self.batch_size:
+            self.flush()
+
+    def flush(self) -> None:
+        """Write all pending entries to the manifest."""
+        _write_entries(self.connection, self._pending)
+        self._pending.clear()
+        _MANIFESTS_WITH_PENDING_ENTRIES.discard(self)
+
+
+def flush_manifests() -> None:
+    """Write the pending entries of all manifests."""
+    for manifest in list(_MANIFESTS_WITH_PENDING_ENTRIES):
+        manifest.flush()
+
+
+def _connect(path: Path) -> sqlite3.Connection:
+    """Connect to a manifest and create the table if necessary."""
+    connection = sqlite3.connect(path, timeout=30, check_same_thread=False)
+    with connection:
+        connection.execute(
+            "CREATE TABLE IF NOT EXISTS entries (name TEXT PRIMARY KEY, node BLOB)"
+        )
+    return connection
+
+
+def _write_entries(connection: sqlite3.Connection, entries: dict[str, bytes]) -> None:
+    if entries:
+        with connection:
+            connection.executemany(
+                "INSERT OR REPLACE INTO entries (name, node) VALUES (?, ?)",
+                entries.items(),
+            )
+
+
+def _flush_pending(path: Path, pending: dict[str, bytes]) -> None:
+    """Write pending entries of a manifest which is garbage collected."""
+    if pending:
+        connection = _connect(path)
+        try:
+            _write_entries(connection, pending)
+        finally:
+            connection.close()
@@ -5,15 +5,16 @@ from __future__ import annotations
 from pathlib import Path
 from typing import Any
 
-from sqlalchemy.engine import make_url
-
-from _pytask.database_utils import create_database
 from _pytask.pluginmanager import hookimpl
 
 
 @hookimpl
 def pytask_parse_config(config: dict[str, Any]) -> None:
     """Parse the configuration."""
+    # sqlalchemy is imported here and not at the top of the module to keep the startup
+    # of the command line interface fast.
+    from sqlalchemy.engine import make_url
+
     # Set default.
     if not config["database_url"]:
         config["database_url"] = make_url(
@@ -42,4 +43,8 @@ def pytask_parse_config(config: dict[str, Any]) -> None:
 @hookimpl
 def pytask_post_parse(config: dict[str, Any]) -> None:
     """Post-parse the configuration."""
-    create_database(config["database_url"])
+    from _pytask.database_utils import create_database
+
+    # Only the coordinator uses the database. Workers would create it concurrently.
+    if config.get("command") != "worker":
+        create_database(config["database_url"])
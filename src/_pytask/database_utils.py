@@ -5,12 +5,15 @@ from __future__ import annotations
 from typing import TYPE_CHECKING
 
 from sqlalchemy import create_engine
+from sqlalchemy import delete
+from sqlalchemy import select
 from sqlalchemy.orm import DeclarativeBase
 from sqlalchemy.orm import Mapped
 from sqlalchemy.orm import mapped_column
 from sqlalchemy.orm import sessionmaker
 
 from _pytask.dag_utils import node_and_neighbors
+from _pytask.node_utils import get_states
 
 if TYPE_CHECKING:
     from _pytask.node_protocols import PNode
@@ -21,7 +24,13 @@ if TYPE_CHECKING:
 __all__ = [
     "BaseTable",
     "DatabaseSession",
+    "PartitionState",
+    "Runtime",
+    "State",
     "create_database",
+    "dispose_connections",
+    "get_partition_states",
+    "update_partition_states",
     "update_states_in_database",
 ]
 
@@ -43,6 +52,27 @@ class State(BaseTable):
     hash_: Mapped[str]
 
 
+class PartitionState(BaseTable):
+    """Represent the state of a partition of a node in relation to a task."""
+
+    __tablename__ = "partition_state"
+
+    task: Mapped[str] = mapped_column(primary_key=True)
+    node: Mapped[str] = mapped_column(primary_key=True)
+    partition: Mapped[str] = mapped_column(primary_key=True)
+    hash_: Mapped[str]
+
+
+class Runtime(BaseTable):
+    """Record of runtimes of tasks."""
+
+    __tablename__ = "runtime"
+
+    task: Mapped[str] = mapped_column(primary_key=True)
+    date: Mapped[float]
+    duration: Mapped[float]
+
+
 def create_database(url: str) -> None:
     """Create the database."""
     engine = create_engine(url)
@@ -50,6 +80,18 @@ def create_database(url: str) -> None:
     DatabaseSession.configure(bind=engine)
 
 
+def dispose_connections() -> None:
+    """Close the connections in the pool of the engine.
+
+    Processes which are forked afterwards do not inherit connections of the main
+    process. New connections are opened when the database is used again.
+
+    """
+    engine = DatabaseSession.kw.get("bind")
+    if engine is not None:
+        engine.dispose()
+
+
 def _create_or_update_state(first_key: str, second_key: str, hash_: str) -> None:
     """Create or update a state."""
     with DatabaseSession() as session:
@@ -63,10 +105,46 @@ def _create_or_update_state(first_key: str, second_key: str, hash_: str) -> None
 
 def update_states_in_database(session: Session, task_signature: str) -> None:
     """Update the state for each node of a task in the database."""
-    for name in node_and_neighbors(session.dag, task_signature):
-        node = session.dag.nodes[name].get("task") or session.dag.nodes[name]["node"]
-        hash_ = node.state()
-        _create_or_update_state(task_signature, node.signature, hash_)
+    nodes = [
+        session.dag.nodes[name].get("task") or session.dag.nodes[name]["node"]
+        for name in node_and_neighbors(session.dag, task_signature)
+    ]
+    for signature, hash_ in get_states(nodes).items():
+        # Nodes without a state do not exist and are always considered changed.
+        if hash_ is not None:
+            _create_or_update_state(task_signature, signature, hash_)
+
+
+def get_partition_states(task_signature: str, node_signature: str) -> dict[str, str]:
+    """Get the states of the partitions of a node in relation to a task."""
+    with DatabaseSession() as session:
+        rows = session.execute(
+            select(PartitionState.partition, PartitionState.hash_).where(
+                PartitionState.task == task_signature,
+                PartitionState.node == node_signature,
+            )
+        )
+        return dict(rows.all())
+
+
+def update_partition_states(
+    task_signature: str, node_signature: str, states: dict[str, str]
+) -> None:
+    """Replace the states of the partitions of a node in relation to a task."""
+    with DatabaseSession() as session:
+        session.execute(
+            delete(PartitionState).where(
+                PartitionState.task == task_signature,
+                PartitionState.node == node_signature,
+            )
+        )
+        session.add_all(
+            PartitionState(
+                task=task_signature, node=node_signature, partition=name, hash_=hash_
+            )
+            for name, hash_ in states.items()
+        )
+        session.commit()
 
 
 def has_node_changed(task: PTask, node: PTask | PNode, state: str | None) -> bool:
@@ -0,0 +1,148 @@
+"""Contains the coordinator and the worker for executing tasks on other machines."""
+
+from __future__ import annotations
+
+import sys
+from multiprocessing import AuthenticationError
+from typing import TYPE_CHECKING
+from typing import Any
+
+import click
+
+from _pytask.console import console
+from _pytask.dag import create_dag
+from _pytask.distributed_utils import connect
+from _pytask.distributed_utils import get_authkey
+from _pytask.distributed_utils import parse_address
+from _pytask.exceptions import CollectionError
+from _pytask.exceptions import ConfigurationError
+from _pytask.exceptions import ResolvingDependenciesError
+from _pytask.execute import execute_task_in_worker
+from _pytask.outcomes import ExitCode
+from _pytask.pluginmanager import hookimpl
+from _pytask.pluginmanager import storage
+from _pytask.session import Session
+from _pytask.traceback import Traceback
+from _pytask.watch import CommandWithBuildOptions
+from _pytask.worker_pool_utils import serve_tasks
+from _pytask.worker_pool_utils import worker_pool
+
+if TYPE_CHECKING:
+    from typing import NoReturn
+
+
+@hookimpl
+def pytask_extend_command_line_interface(cli: click.Group) -> None:
+    """Add the option to accept workers and the command to start a worker."""
+    cli.commands["build"].params.append(
+        click.Option(
+            ["--coordinator"],
+            type=str,
+            default=None,
+            metavar="HOST:PORT",
+            help="Listen at HOST:PORT for workers started with 'pytask worker "
+            "--connect HOST:PORT' on other machines and let them execute tasks.",
+        )
+    )
+    cli.add_command(worker_command)
+
+
+@hookimpl
+def pytask_parse_config(config: dict[str, Any]) -> None:
+    """Parse the addresses of the coordinator."""
+    for name in ("coordinator", "connect"):
+        if config.get(name):
+            config[name] = parse_address(config[name])
+            # Fail early if the key to authenticate workers is missing.
+            get_authkey()
+        else:
+            config[name] = None
+
+
+@hookimpl
+def pytask_post_parse(config: dict[str, Any]) -> None:
+    """Accept workers in the coordinator."""
+    if config["coordinator"] is not None and config.get("command") == "build":
+        worker_pool.listen(config["coordinator"], get_authkey())
+
+
+@hookimpl
+def pytask_unconfigure() -> None:
+    """Stop accepting workers."""
+    worker_pool.listen()
+
+
+@click.command(cls=CommandWithBuildOptions, name="worker")
+@click.option(
+    "--connect",
+    type=str,
+    required=True,
+    metavar="HOST:PORT",
+    help="The address of the coordinator started with 'pytask build --coordinator "
+    "HOST:PORT'.",
+)
+@click.option(
+    "--timeout",
+    type=click.FloatRange(min=0),
+    default=60,
+    help="Seconds to wait until the coordinator accepts the connection.",
+)
+def worker_command(**raw_config: Any) -> NoReturn:
+    """Execute tasks of a coordinator which runs on another machine.
+
+    The worker collects the project like ``pytask build`` and executes the tasks
+    which the coordinator sends until the coordinator is finished. The project
+    must be on a shared file system at the same path as for the coordinator. The
+    environment variable ``PYTASK_AUTHKEY`` must contain the same secret for the
+    coordinator and all workers.
+
+    """
+    pm = storage.get()
+    raw_config["command"] = "worker"
+
+    try:
+        config = pm.hook.pytask_configure(pm=pm, raw_config=raw_config)
+        session = Session.from_config(config)
+
+    except (ConfigurationError, Exception):
+        console.print(Traceback(sys.exc_info()))
+        session = Session(exit_code=ExitCode.CONFIGURATION_FAILED)
+
+    else:
+        _run_worker(session)
+        session.hook.pytask_unconfigure(session=session)
+
+    sys.exit(session.exit_code)
+
+
+def _run_worker(session: Session) -> None:
+    """Collect the project and execute tasks sent by the coordinator."""
+    try:
+        session.hook.pytask_log_session_header(session=session)
+        session.hook.pytask_collect(session=session)
+        session.dag = create_dag(session=session)
+
+        host, port = session.config["connect"]
+        connection = connect(
+            (host, port), get_authkey(), timeout=session.config["timeout"]
+        )
+        console.print()
+        console.rule(f"Connected to the coordinator at {host}:{port}", style="neutral")
+        with connection:
+            n_tasks = serve_tasks(
+                connection,
+                {task.signature: task for task in session.tasks},
+                execute_task_in_worker,
+            )
+        console.print(f"Executed {n_tasks} task{'' if n_tasks == 1 else 's'}.")
+
+    except CollectionError:
+        session.exit_code = ExitCode.COLLECTION_FAILED
+
+    except ResolvingDependenciesError:
+        session.exit_code = ExitCode.DAG_FAILED
+
+    except (AuthenticationError, EOFError, OSError):
+        # The coordinator is unreachable, rejected the worker, or closed the connection.
+        console.print(Traceback(sys.exc_info()))
+        session.exit_code = ExitCode.FAILED
@@ -0,0 +1,72 @@
+"""Contains utilities to execute tasks on workers on other machines.
+
+The process started with ``pytask build --coordinator host:port`` keeps the DAG, the
+scheduler, and the database. Workers started with ``pytask worker --connect host:port``
+collect the same project from a shared file system, connect to the coordinator over TCP,
+and execute the tasks they receive.
+
+Messages are pickled. Both sides authenticate each other with the shared key in the
+environment variable ``PYTASK_AUTHKEY``.
+
+"""
+
+from __future__ import annotations
+
+import os
+import time
+from multiprocessing.connection import Client
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from multiprocessing.connection import Connection
+
+
+__all__ = ["AUTHKEY_VARIABLE", "connect", "get_authkey", "parse_address"]
+
+
+AUTHKEY_VARIABLE = "PYTASK_AUTHKEY"
+"""str: The environment variable with the key shared by the coordinator and workers."""
+
+
+def parse_address(address: str) -> tuple[str, int]:
+    """Parse an address like ``"localhost:5000"`` into a host and a port."""
+    host, _, port = address.rpartition(":")
+    if not host or not port.isdigit():
+        msg = f"Cannot parse the address {address!r}. Use, for example, 'node01:5000'."
+        raise ValueError(msg)
+    return host.strip("[]"), int(port)
+
+
+def get_authkey() -> bytes:
+    """Get the key which authenticates workers and the coordinator."""
+    authkey = os.environ.get(AUTHKEY_VARIABLE, "")
+    if not authkey:
+        msg = (
+            f"Set the environment variable {AUTHKEY_VARIABLE} to the same secret for "
+            "the coordinator and all workers."
+        )
+        raise ValueError(msg)
+    return authkey.encode()
+
+
+def connect(address: tuple[str, int], authkey: bytes, timeout: float) -> Connection:
+    """Connect to the coordinator and retry until it accepts workers.
+
+    Raises
+    ------
+    ConnectionError
+        If the coordinator does not accept the connection within ``timeout`` seconds.
+
+    """
+    deadline = time.monotonic() + timeout
+    while True:
+        try:
+            return Client(address, family="AF_INET", authkey=authkey)
+        except ConnectionRefusedError:  # noqa: PERF203
+            if time.monotonic() > deadline:
+                msg = (
+                    f"The coordinator at {address[0]}:{address[1]} did not accept the "
+                    f"connection within {timeout} seconds."
+                )
+                raise ConnectionError(msg) from None
+            time.sleep(0.1)
@@ -19,6 +19,14 @@ class NodeLoadError(PytaskError):
     """Exception for nodes whose value could not be loaded."""
 
 
+class NodeSaveError(PytaskError):
+    """Exception for nodes whose value could not be saved."""
+
+
+class WorkerError(PytaskError):
+    """Exception for tasks which could not be executed by a worker."""
+
+
 class ConfigurationError(PytaskError):
     """Exception during the configuration."""
 
@@ -2,14 +2,26 @@
 
 from __future__ import annotations
 
+import asyncio
 import inspect
+import io
+import pickle
 import sys
 import time
+from concurrent.futures import FIRST_COMPLETED
+from concurrent.futures import wait
+from contextlib import redirect_stderr
+from contextlib import redirect_stdout
+from contextlib import suppress
+from traceback import format_exception
 from typing import TYPE_CHECKING
 from typing import Any
 
 from rich.text import Text
 
+from _pytask.async_utils import async_runner
+from _pytask.async_utils import has_async_tasks
+from _pytask.async_utils import is_async_task
 from _pytask.config import IS_FILE_SYSTEM_CASE_SENSITIVE
 from _pytask.console import console
 from _pytask.console import create_summary_panel
@@ -20,33 +32,50 @@ from _pytask.console import unify_styles
 from _pytask.dag_utils import TopologicalSorter
 from _pytask.dag_utils import descending_tasks
 from _pytask.dag_utils import node_and_neighbors
-from _pytask.database_utils import has_node_changed
-from _pytask.database_utils import update_states_in_database
 from _pytask.exceptions import ExecutionError
 from _pytask.exceptions import NodeLoadError
 from _pytask.exceptions import NodeNotFoundError
+from _pytask.exceptions import NodeSaveError
+from _pytask.fusion_utils import fused_values
 from _pytask.mark import Mark
 from _pytask.mark_utils import has_mark
 from _pytask.node_protocols import PNode
 from _pytask.node_protocols import PPathNode
 from _pytask.node_protocols import PProvisionalNode
 from _pytask.node_protocols import PTask
+from _pytask.node_utils import get_batched_states
+from _pytask.node_utils import get_states
+from _pytask.node_utils import has_batch_method
+from _pytask.node_utils import load_values
+from _pytask.nodes import PythonNode
 from _pytask.outcomes import Exit
 from _pytask.outcomes import SkippedUnchanged
 from _pytask.outcomes import TaskOutcome
 from _pytask.outcomes import WouldBeExecuted
 from _pytask.outcomes import count_outcomes
 from _pytask.pluginmanager import hookimpl
+from _pytask.prefetch_utils import prefetcher
 from _pytask.provisional_utils import collect_provisional_products
 from _pytask.reports import ExecutionReport
+from _pytask.reports import PendingReport
+from _pytask.traceback import _remove_internal_traceback_frames_from_exc_info
 from _pytask.traceback import remove_traceback_from_exc_info
 from _pytask.tree_util import tree_leaves
 from _pytask.tree_util import tree_map
 from _pytask.tree_util import tree_structure
 from _pytask.typing import is_task_generator
+from _pytask.typing import no_default
+from _pytask.worker_pool_utils import RemoteTraceback
+from _pytask.worker_pool_utils import worker_pool
+from _pytask.write_behind_utils import product_writer
 
 if TYPE_CHECKING:
     from _pytask.session import Session
+    from _pytask.traceback import OptionalExceptionInfo
+
+
+_PENDING_TASKS: set[str] = set()
+"""set[str]: The signatures of tasks which are pending and need to be finished."""
 
 
 @hookimpl
@@ -80,6 +109,9 @@ def pytask_execute_log_start(session: Session) -> None:
 def pytask_execute_build(session: Session) -> bool | None:
     """Execute tasks."""
     if isinstance(session.scheduler, TopologicalSorter):
+        if _has_pending_tasks(session):
+            return _execute_build_with_pending_tasks(session)
+
         while session.scheduler.is_active():
             task_name = session.scheduler.get_ready()[0]
             task = session.dag.nodes[task_name]["task"]
@@ -95,13 +127,206 @@ def pytask_execute_build(session: Session) -> bool | None:
     return None
 
 
+def _is_debugging(session: Session) -> bool:
+    return bool(session.config.get("pdb") or session.config.get("trace"))
+
+
+def _has_pending_tasks(session: Session) -> bool:
+    """Check whether tasks may be pending after they were executed.
+
+    Tasks are pending while their products are written in the background, while their
+    coroutines run, or while they are executed by worker processes. When a debugger is
+    used, coroutines are awaited immediately and tasks are executed in the main
+    process.
+
+    """
+    return bool(product_writer.n_workers) or (
+        not _is_debugging(session)
+        and (worker_pool.is_enabled or has_async_tasks(session.dag))
+    )
+
+
+def _execute_build_with_pending_tasks(session: Session) -> bool:
+    """Execute tasks while other tasks are pending.
+
+    A pending task is not done. Tasks depending on it are not ready until its coroutine
+    is complete, its products are written, it is torn down, and its report is
+    processed. Pending tasks are finished by calling the protocol again.
+
+    """
+    from _pytask.database_utils import dispose_connections
+
+    _PENDING_TASKS.clear()
+    pending_tasks: dict[str, PTask] = {}
+    # Workers are forked before other threads are started and without connections to
+    # the database.
+    if not _is_debugging(session):
+        if worker_pool.is_enabled:
+            dispose_connections()
+        worker_pool.start(
+            tasks={
+                signature: session.dag.nodes[signature]["task"]
+                for signature in session.scheduler.dag.nodes
+            },
+            function=execute_task_in_worker,
+        )
+    async_runner.start()
+    try:
+        while pending_tasks or (
+            session.scheduler.is_active() and not session.should_stop
+        ):
+            ready_tasks = (
+                []
+                if session.should_stop or not session.scheduler.is_active()
+                else session.scheduler.peek_ready()
+            )
+            can_execute = bool(ready_tasks) and not _is_blocked(
+                session.dag.nodes[ready_tasks[0]]["task"]
+            )
+            if not can_execute:
+                wait(
+                    async_runner.futures()
+                    + worker_pool.futures()
+                    + product_writer.futures(),
+                    return_when=FIRST_COMPLETED,
+                )
+
+            ready_to_finish = [
+                (task_name, task)
+                for task_name, task in pending_tasks.items()
+                if not _is_running(task)
+            ]
+            if can_execute:
+                task_name = session.scheduler.get_ready()[0]
+                ready_to_finish.append(
+                    (task_name, session.dag.nodes[task_name]["task"])
+                )
+
+            for task_name, task in ready_to_finish:
+                report = session.hook.pytask_execute_task_protocol(
+                    session=session, task=task
+                )
+                if isinstance(report, PendingReport):
+                    pending_tasks[task_name] = task
+                else:
+                    pending_tasks.pop(task_name, None)
+                    session.execution_reports.append(report)
+                    session.scheduler.done(task_name)
+    finally:
+        _PENDING_TASKS.clear()
+        async_runner.stop()
+        worker_pool.stop()
+    return True
+
+
+def _is_blocked(task: PTask) -> bool:
+    """Check whether a task has to wait for the event loop or a worker."""
+    if is_async_task(task):
+        return async_runner.is_full()
+    return worker_pool.can_execute(task) and worker_pool.is_full()
+
+
+def _collect_result(task: PTask) -> OptionalExceptionInfo | None:
+    """Collect the result of a task from the event loop or a worker.
+
+    Returns the exception info if the task failed in a worker.
+
+    """
+    if async_runner.is_complete(task):
+        exc_info = None
+        _save_return(task, async_runner.result(task))
+    elif worker_pool.is_complete(task):
+        exc_info = _process_worker_result(task, worker_pool.result(task))
+    else:
+        return None
+
+    # The duration of the task includes the coroutine or the worker.
+    if "duration" in task.attributes:
+        task.attributes["duration"] = (task.attributes["duration"][0], time.time())
+    return exc_info
+
+
+def _is_pending(task: PTask) -> bool:
+    """Check whether a task was executed, but its result is not collected yet."""
+    return (
+        async_runner.is_complete(task)
+        or worker_pool.is_complete(task)
+        or _is_running(task)
+    )
+
+
+def _is_running(task: PTask) -> bool:
+    """Check whether the coroutine, the worker, or the writes of a task are running."""
+    return (
+        async_runner.is_running(task)
+        or worker_pool.is_running(task)
+        or product_writer.is_writing(task)
+    )
+
+
+def _finish_pending_task(
+    session: Session, task: PTask
+) -> ExecutionReport | PendingReport:
+    """Finish a pending task and return its report unless it is still pending."""
+    if _is_running(task):
+        return PendingReport(task)
+    try:
+        exc_info = _collect_result(task)
+        if product_writer.is_writing(task):
+            return PendingReport(task)
+        if exc_info is None:
+            product_writer.result(task)
+            session.hook.pytask_execute_task_teardown(session=session, task=task)
+    except KeyboardInterrupt:  # pragma: no cover
+        short_exc_info = remove_traceback_from_exc_info(sys.exc_info())
+        report = ExecutionReport.from_task_and_exception(task, short_exc_info)
+        session.should_stop = True
+    except Exception:  # noqa: BLE001
+        report = ExecutionReport.from_task_and_exception(task, sys.exc_info())
+    else:
+        if exc_info is None:
+            report = ExecutionReport.from_task(task)
+        else:
+            report = ExecutionReport.from_task_and_exception(task, exc_info)
+    _PENDING_TASKS.discard(task.signature)
+    return _process_report(session, report)
+
+
+def _process_report(session: Session, report: ExecutionReport) -> ExecutionReport:
+    """Process and log the report of a task."""
+    if report.outcome != TaskOutcome.SUCCESS:
+        # Products which were saved before the task failed are not reported.
+        with suppress(NodeSaveError):
+            product_writer.result(report.task)
+    session.hook.pytask_execute_task_process_report(session=session, report=report)
+    session.hook.pytask_execute_task_log_end(
+        session=session, task=report.task, report=report
+    )
+    return report
+
+
 @hookimpl
-def pytask_execute_task_protocol(session: Session, task: PTask) -> ExecutionReport:
-    """Follow the protocol to execute each task."""
+def pytask_execute_task_protocol(
+    session: Session, task: PTask
+) -> ExecutionReport | PendingReport:
+    """Follow the protocol to execute each task.
+
+    Returns a :class:`~pytask.PendingReport` if the task is pending. The protocol is
+    called again for the task when its coroutine is complete, a worker executed it, or
+    its products are written. Then, the task is torn down and its report is processed.
+
+    """
+    if task.signature in _PENDING_TASKS:
+        return _finish_pending_task(session, task)
+
     session.hook.pytask_execute_task_log_start(session=session, task=task)
     try:
         session.hook.pytask_execute_task_setup(session=session, task=task)
         session.hook.pytask_execute_task(session=session, task=task)
+        if _is_pending(task):
+            _PENDING_TASKS.add(task.signature)
+            return PendingReport(task)
+        product_writer.result(task)
         session.hook.pytask_execute_task_teardown(session=session, task=task)
     except KeyboardInterrupt:  # pragma: no cover
         short_exc_info = remove_traceback_from_exc_info(sys.exc_info())
@@ -111,10 +336,7 @@ def pytask_execute_task_protocol(session: Session, task: PTask) -> ExecutionRepo
         report = ExecutionReport.from_task_and_exception(task, sys.exc_info())
     else:
         report = ExecutionReport.from_task(task)
-    session.hook.pytask_execute_task_process_report(session=session, report=report)
-    session.hook.pytask_execute_task_log_end(session=session, task=task, report=report)
-
-    return report
+    return _process_report(session, report)
 
 
 @hookimpl(trylast=True)
@@ -125,6 +347,8 @@ def pytask_execute_task_setup(session: Session, task: PTask) -> None:  # noqa: C
     2. Create the directory where the product will be placed.
 
     """
+    from _pytask.database_utils import has_node_changed
+
     if has_mark(task, "would_be_executed"):
         raise WouldBeExecuted
 
@@ -136,10 +360,18 @@ def pytask_execute_task_setup(session: Session, task: PTask) -> None:  # noqa: C
 
     if not needs_to_be_executed:
         predecessors = set(dag.predecessors(task.signature)) | {task.signature}
-        for node_signature in node_and_neighbors(dag, task.signature):
-            node = dag.nodes[node_signature].get("task") or dag.nodes[
-                node_signature
-            ].get("node")
+        nodes = [
+            dag.nodes[node_signature].get("task") or dag.nodes[node_signature]["node"]
+            for node_signature in node_and_neighbors(dag, task.signature)
+        ]
+        # Nodes whose types implement ``state_many`` are hashed with one call per type,
+        # except for local paths. All other nodes are hashed lazily to stop at the first
+        # changed node.
+        batched_states = get_batched_states(
+            [node for node in nodes if not isinstance(node, PProvisionalNode)]
+        )
+        for node in nodes:
+            node_signature = node.signature
 
             # Skip provisional nodes that are products since they do not have a state.
             if node_signature not in predecessors and isinstance(
@@ -147,7 +379,10 @@ def pytask_execute_task_setup(session: Session, task: PTask) -> None:  # noqa: C
             ):
                 continue
 
-            node_state = node.state()
+            if node_signature in batched_states:
+                node_state = batched_states[node_signature]
+            else:
+                node_state = node.state()
 
             if node_signature in predecessors and not node_state:
                 msg = f"{task.name!r} requires missing node {node.name!r}."
@@ -183,44 +418,222 @@ def _safe_load(node: PNode | PProvisionalNode, task: PTask, is_product: bool) ->
         raise NodeLoadError(msg) from e
 
 
+def _safe_load_many(
+    nodes: list[PNode | PProvisionalNode], task: PTask, is_product: bool
+) -> dict[int, Any]:
+    """Load all nodes whose types implement ``load_many`` with one call per type."""
+    nodes = [node for node in nodes if has_batch_method(node, "load_many")]
+    try:
+        return load_values(nodes, is_product=is_product)
+    except Exception as e:  # noqa: BLE001
+        msg = f"Exception while loading nodes of task {task.name!r}"
+        raise NodeLoadError(msg) from e
+
+
+def _load(
+    node: PNode | PProvisionalNode,
+    task: PTask,
+    is_product: bool,
+    values: dict[int, Any],
+) -> Any:
+    if id(node) in values:
+        return values[id(node)]
+    return _safe_load(node, task, is_product)
+
+
 @hookimpl(trylast=True)
 def pytask_execute_task(session: Session, task: PTask) -> bool:
     """Execute task."""
     if session.config["dry_run"]:
         raise WouldBeExecuted
 
+    if (
+        worker_pool.can_execute(task)
+        and not is_async_task(task)
+        and not is_task_generator(task)
+    ):
+        payload = _get_worker_payload(task)
+        if payload is not None:
+            worker_pool.submit(task, payload)
+            return True
+
     parameters = inspect.signature(task.function).parameters
 
+    # Values handed over from fused tasks or prefetched are not loaded again.
+    dependency_nodes: list[PNode | PProvisionalNode] = tree_leaves(
+        task.depends_on  # type: ignore[arg-type]
+    )
+    dependencies = fused_values.pop_many(dependency_nodes)
+    dependencies.update(prefetcher.pop_many(task.signature, dependency_nodes))
+    dependencies.update(
+        _safe_load_many(
+            [node for node in dependency_nodes if id(node) not in dependencies],
+            task,
+            False,
+        )
+    )
+    product_nodes: list[PNode | PProvisionalNode] = tree_leaves(
+        {k: v for k, v in task.produces.items() if k in parameters}  # type: ignore[arg-type]
+    )
+    products = _safe_load_many(product_nodes, task, True)
+
     kwargs = {}
     for name, value in task.depends_on.items():
-        kwargs[name] = tree_map(lambda x: _safe_load(x, task, False), value)
+        kwargs[name] = tree_map(lambda x: _load(x, task, False, dependencies), value)
 
     for name, value in task.produces.items():
         if name in parameters:
-            kwargs[name] = tree_map(lambda x: _safe_load(x, task, True), value)
+            kwargs[name] = tree_map(lambda x: _load(x, task, True, products), value)
 
     out = task.execute(**kwargs)
+    if inspect.iscoroutine(out):
+        if async_runner.is_started:
+            async_runner.submit(task, out)
+            return True
+        out = asyncio.run(out)
+
+    _save_return(task, out)
+    return True
+
+
+def _save_return(task: PTask, out: Any) -> None:
+    """Save the values returned by a task to the nodes of the return annotation."""
+    for node, value in _get_return_values(task, out):
+        product_writer.save(task, node, value)
+        fused_values.put(node, value)
+
+
+def _get_return_values(task: PTask, out: Any) -> list[tuple[PNode, Any]]:
+    """Match the values returned by a task with the nodes of the return annotation."""
+    if "return" not in task.produces:
+        return []
+
+    structure_out = tree_structure(out)
+    structure_return = tree_structure(task.produces["return"])
+
+    # strict must be false when none is leaf.
+    if not structure_return.is_prefix(structure_out, strict=False):
+        msg = (
+            f"The structure of the return annotation is not a subtree of the "
+            f"structure of the function return.\n\nFunction return: {structure_out}"
+            f"\n\nReturn annotation: {structure_return}"
+        )
+        raise ValueError(msg)
+
+    nodes = tree_leaves(task.produces["return"])
+    values = structure_return.flatten_up_to(out)
+    return [
+        (node, value)
+        for node, value in zip(nodes, values)
+        if not isinstance(node, PProvisionalNode)
+    ]
+
+
+def _get_worker_payload(task: PTask) -> bytes | None:
+    """Pickle the values of :class:`~pytask.PythonNode` dependencies for a worker.
+
+    Workers are forked before the values of products are known. Returns ``None`` if the
+    values cannot be pickled, and the task is executed in the main process.
 
-    if "return" in task.produces:
-        structure_out = tree_structure(out)
-        structure_return = tree_structure(task.produces["return"])
+    """
+    dependencies: list[PNode | PProvisionalNode] = tree_leaves(
+        task.depends_on  # type: ignore[arg-type]
+    )
+    values = {
+        node.signature: node.load()
+        for node in dependencies
+        if isinstance(node, PythonNode)
+    }
+    try:
+        return pickle.dumps(values)
+    except (AttributeError, TypeError, pickle.PicklingError):
+        return None
+
+
+def execute_task_in_worker(task: PTask, payload: bytes) -> dict[str, Any]:
+    """Execute a task in a worker process and return values for the main process.
+
+    Values of :class:`~pytask.PythonNode` products and the captured output are returned
+    since they would be lost in the worker.
+
+    """
+    values = pickle.loads(payload)  # noqa: S301
+    dependencies: list[PNode | PProvisionalNode] = tree_leaves(
+        task.depends_on  # type: ignore[arg-type]
+    )
+    for node in dependencies:
+        if isinstance(node, PythonNode) and node.signature in values:
+            node.value = values[node.signature]
+
+    kwargs = {}
+    for name, value in task.depends_on.items():
+        kwargs[name] = tree_map(lambda x: _safe_load(x, task, False), value)
+    parameters = inspect.signature(task.function).parameters
+    for name, value in task.produces.items():
+        if name in parameters:
+            kwargs[name] = tree_map(lambda x: _safe_load(x, task, True), value)
 
-        # strict must be false when none is leaf.
-        if not structure_return.is_prefix(structure_out, strict=False):
-            msg = (
-                f"The structure of the return annotation is not a subtree of the "
-                f"structure of the function return.\n\nFunction return: {structure_out}"
-                f"\n\nReturn annotation: {structure_return}"
+    stdout, stderr = io.StringIO(), io.StringIO()
+    exception, tb = None, ""
+    try:
+        with redirect_stdout(stdout), redirect_stderr(stderr):
+            out = task.execute(**kwargs)
+        for node, value in _get_return_values(task, out):
+            node.save(value)
+    except Exception as e:  # noqa: BLE001
+        # Tracebacks cannot be pickled and are sent as strings without pytask's frames.
+        exception = e
+        tb = "".join(
+            format_exception(
+                *_remove_internal_traceback_frames_from_exc_info(sys.exc_info())
             )
-            raise ValueError(msg)
+        )
 
-        nodes = tree_leaves(task.produces["return"])
-        values = structure_return.flatten_up_to(out)
-        for node, value in zip(nodes, values):
-            if not isinstance(node, PProvisionalNode):
-                node.save(value)
+    products: list[PNode | PProvisionalNode] = tree_leaves(
+        task.produces  # type: ignore[arg-type]
+    )
+    return {
+        "exception": exception,
+        "traceback": tb,
+        "products": {
+            node.signature: node.load()
+            for node in products
+            if exception is None
+            and isinstance(node, PythonNode)
+            and node.value is not no_default
+        },
+        "report_sections": [
+            ("call", key, content)
+            for key, content in (
+                ("stdout", stdout.getvalue()),
+                ("stderr", stderr.getvalue()),
+            )
+            if content
+        ],
+    }
 
-    return True
+
+def _process_worker_result(
+    task: PTask, result: dict[str, Any]
+) -> OptionalExceptionInfo | None:
+    """Save the values of products and the output of a task from a worker.
+
+    Returns the exception info if the task failed. The traceback from the worker is
+    attached as the cause of the exception.
+
+    """
+    task.report_sections.extend(result["report_sections"])
+    exception = result["exception"]
+    if exception is not None:
+        exception.__cause__ = RemoteTraceback(result["traceback"])
+        return (type(exception), exception, None)
+    products: list[PNode | PProvisionalNode] = tree_leaves(
+        task.produces  # type: ignore[arg-type]
+    )
+    for node in products:
+        if isinstance(node, PNode) and node.signature in result["products"]:
+            node.save(result["products"][node.signature])
+    return None
 
 
 @hookimpl(trylast=True)
@@ -230,7 +643,9 @@ def pytask_execute_task_teardown(session: Session, task: PTask) -> None:
         return
 
     collect_provisional_products(session, task)
-    missing_nodes = [node for node in tree_leaves(task.produces) if not node.state()]
+    nodes: list[PNode] = tree_leaves(task.produces)  # type: ignore[arg-type]
+    states = get_states(nodes)
+    missing_nodes = [node for node in nodes if not states[node.signature]]
     if missing_nodes:
         paths = session.config["paths"]
         files = [format_node_name(i, paths).plain for i in missing_nodes]
@@ -250,6 +665,8 @@ def pytask_execute_task_process_report(
     nodes in the database.
 
     """
+    from _pytask.database_utils import update_states_in_database
+
     task = report.task
     if report.outcome == TaskOutcome.SUCCESS:
         update_states_in_database(session, task.signature)
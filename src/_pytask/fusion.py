@@ -0,0 +1,56 @@
+"""Contains hooks to fuse chains of tasks."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+from typing import Any
+from typing import Generator
+
+from _pytask.dag_utils import TopologicalSorter
+from _pytask.fusion_utils import find_fused_nodes
+from _pytask.fusion_utils import fused_values
+from _pytask.outcomes import TaskOutcome
+from _pytask.pluginmanager import hookimpl
+
+if TYPE_CHECKING:
+    from _pytask.reports import ExecutionReport
+    from _pytask.session import Session
+
+
+FUSED_PRIORITY = 2
+"""int: The priority of consumers of fused tasks which is higher than ``try_first``."""
+
+
+@hookimpl
+def pytask_parse_config(config: dict[str, Any]) -> None:
+    """Add the marker to the configuration."""
+    config["markers"]["fuse"] = (
+        "Execute a task right before the fused task consuming its products and hand "
+        "over returned values in memory."
+    )
+
+
+@hookimpl(wrapper=True)
+def pytask_execute_build(session: Session) -> Generator[None, None, Any]:
+    """Find the fused products before the tasks are executed."""
+    fused_values.configure(nodes=find_fused_nodes(session.dag))
+    try:
+        return (yield)
+    finally:
+        fused_values.configure()
+
+
+@hookimpl
+def pytask_execute_task_process_report(
+    session: Session, report: ExecutionReport
+) -> None:
+    """Execute the consumers of a fused task next and drop values which were unused."""
+    fused_values.discard_consumed_by(report.task.signature)
+
+    if report.outcome == TaskOutcome.SUCCESS and isinstance(
+        session.scheduler, TopologicalSorter
+    ):
+        for node_signature in session.dag.successors(report.task.signature):
+            consumer = fused_values.nodes.get(node_signature)
+            if consumer is not None:
+                session.scheduler.priorities[consumer] = FUSED_PRIORITY
@@ -0,0 +1,112 @@
+"""Contains utilities to fuse chains of tasks.
+
+Tasks marked with ``@pytask.mark.fuse`` form a chain if a product of one task is only
+consumed by another fused task. The consumer is executed right after the producer, and
+the values returned by the producer are handed over in memory instead of being loaded
+from disk again. The products are still saved so that their states are recorded.
+
+Only products whose nodes set the class attribute ``loads_saved_value = True`` are
+handed over, like :class:`~pytask.PickleNode`. Other nodes load something different
+from the value which was saved, for example, a path or a lazily loaded table.
+
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+from typing import Any
+
+from attrs import define
+from attrs import field
+
+from _pytask.mark_utils import has_mark
+
+if TYPE_CHECKING:
+    import networkx as nx
+
+    from _pytask.node_protocols import PNode
+    from _pytask.node_protocols import PProvisionalNode
+
+
+__all__ = ["FusedValues", "find_fused_nodes", "fused_values"]
+
+
+def find_fused_nodes(dag: nx.DiGraph) -> dict[str, str]:
+    """Find the products which are handed over between fused tasks.
+
+    Returns
+    -------
+    dict[str, str]
+        A mapping from the signatures of products to the signatures of the only task
+        consuming them.
+
+    """
+    fused_nodes = {}
+    for signature in dag.nodes:
+        task = dag.nodes[signature].get("task")
+        if task is None or not has_mark(task, "fuse"):
+            continue
+
+        for node_signature in dag.successors(signature):
+            node = dag.nodes[node_signature]["node"]
+            if not getattr(node, "loads_saved_value", False):
+                continue
+            consumers = list(dag.successors(node_signature))
+            if len(consumers) == 1 and has_mark(
+                dag.nodes[consumers[0]]["task"], "fuse"
+            ):
+                fused_nodes[node_signature] = consumers[0]
+    return fused_nodes
+
+
+@define
+class FusedValues:
+    """The values which are handed over between fused tasks.
+
+    Attributes
+    ----------
+    nodes
+        A mapping from the signatures of fused products to the signatures of their
+        consumers.
+    values
+        The values of fused products which have not been consumed yet.
+
+    """
+
+    nodes: dict[str, str] = field(factory=dict)
+    values: dict[str, Any] = field(factory=dict)
+
+    def configure(self, nodes: dict[str, str] | None = None) -> None:
+        """Set the fused products and drop all values."""
+        self.nodes = nodes or {}
+        self.values.clear()
+
+    def put(self, node: PNode, value: Any) -> None:
+        """Keep the value of a product if it is fused."""
+        if node.signature in self.nodes:
+            self.values[node.signature] = value
+
+    def pop_many(self, nodes: list[PNode | PProvisionalNode]) -> dict[int, Any]:
+        """Take the values of nodes which were handed over.
+
+        The values are returned by the ids of the nodes like
+        :func:`~_pytask.node_utils.load_values`.
+
+        """
+        if not self.values:
+            return {}
+        return {
+            id(node): self.values.pop(node.signature)
+            for node in nodes
+            if node.signature in self.values
+        }
+
+    def discard_consumed_by(self, task_signature: str) -> None:
+        """Drop the values which were meant for a task."""
+        for node_signature, consumer in self.nodes.items():
+            if consumer == task_signature:
+                self.values.pop(node_signature, None)
+
+
+fused_values = FusedValues()
+"""FusedValues: The values which are handed over between fused tasks."""
@@ -26,6 +26,7 @@ if TYPE_CHECKING:
     from _pytask.outcomes import TaskOutcome
     from _pytask.reports import CollectionReport
     from _pytask.reports import ExecutionReport
+    from _pytask.reports import PendingReport
     from _pytask.session import Session
 
 
@@ -123,6 +124,10 @@ def pytask_ignore_collect(path: Path, config: dict[str, Any]) -> bool:
     This hook is indicates for each directory and file whether it should be ignored.
     This speeds up the collection.
 
+    If no plugin implements this hook, pytask skips the hook calls and matches the
+    patterns in the configuration value ``ignore`` directly which is much faster for
+    projects with many files.
+
     """
 
 
@@ -243,7 +248,9 @@ def pytask_execute_build(session: Session) -> Any:
 
 
 @hookspec(firstresult=True)
-def pytask_execute_task_protocol(session: Session, task: PTask) -> ExecutionReport:
+def pytask_execute_task_protocol(
+    session: Session, task: PTask
+) -> ExecutionReport | PendingReport:
     """Run the protocol for executing a test.
 
     This hook runs all stages of the execution process, setup, execution, and teardown
@@ -251,6 +258,11 @@ def pytask_execute_task_protocol(session: Session, task: PTask) -> ExecutionRepo
 
     Then, the exception or success is stored in a report and logged.
 
+    The hook returns a :class:`~pytask.PendingReport` if the task is pending because
+    its coroutine runs, a worker executes it, or its products are written in the
+    background. The hook is called again for the task when it can be finished. Then,
+    the task is torn down and its report is processed and logged.
+
     """
 
 
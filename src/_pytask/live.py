@@ -151,6 +151,9 @@ class LiveExecution:
     @hookimpl(wrapper=True)
     def pytask_execute_build(self) -> Generator[None, None, None]:
         """Wrap the execution with the live manager and yield a table at the end."""
+        # Start with an empty table since ``pytask watch`` executes tasks repeatedly.
+        self._reports.clear()
+        self._running_tasks.clear()
         self.live_manager.start()
         result = yield
         self.live_manager.stop(transient=True)
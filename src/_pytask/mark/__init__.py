@@ -2,18 +2,22 @@
 
 from __future__ import annotations
 
+import bisect
+import functools
 import sys
 from typing import TYPE_CHECKING
 from typing import AbstractSet
 from typing import Any
+from typing import Iterable
 
 import click
 from attrs import define
+from attrs import field
 from rich.table import Table
 
 from _pytask.click import ColoredCommand
 from _pytask.console import console
-from _pytask.dag_utils import task_and_preceding_tasks
+from _pytask.dag_utils import tasks_and_preceding_tasks
 from _pytask.exceptions import ConfigurationError
 from _pytask.mark.expression import Expression
 from _pytask.mark.expression import ParseError
@@ -43,6 +47,7 @@ __all__ = [
     "MarkGenerator",
     "ParseError",
     "select_by_after_keyword",
+    "select_by_after_keywords",
     "select_by_keyword",
     "select_by_mark",
     "select_tasks_by_marks_and_expressions",
@@ -163,28 +168,105 @@ def select_by_keyword(session: Session, dag: nx.DiGraph) -> set[str] | None:
         msg = f"Wrong expression passed to '-k': {keywordexpr}: {e}"
         raise ValueError(msg) from None
 
-    remaining: set[str] = set()
-    for task in session.tasks:
-        if keywordexpr and expression.evaluate(KeywordMatcher.from_task(task)):
-            remaining.update(task_and_preceding_tasks(task.signature, dag))
+    matches = (
+        task.signature
+        for task in session.tasks
+        if expression.evaluate(KeywordMatcher.from_task(task))
+    )
+    return tasks_and_preceding_tasks(matches, dag)
 
-    return remaining
+
+@define
+class KeywordIndex:
+    """An index to find the tasks whose keywords match an identifier.
+
+    The lowercased keywords of all tasks, as used by :class:`KeywordMatcher`, are joined
+    into one string. The tasks matching an identifier are found with fast substring
+    searches in this string instead of building a matcher for every task, and the
+    results are cached for identifiers used in multiple expressions.
+
+    """
+
+    signatures: list[str]
+    _text: str
+    _offsets: list[int]
+    _cache: dict[str, set[str]] = field(factory=dict)
+
+    @classmethod
+    def from_tasks(cls, tasks: Iterable[PTask]) -> KeywordIndex:
+        signatures = []
+        parts = []
+        offsets = []
+        position = 0
+        for task in tasks:
+            # Identifiers cannot contain newlines, so matches never span two keywords.
+            part = "".join(
+                f"{name.lower()}\n" for name in KeywordMatcher.from_task(task)._names
+            )
+            signatures.append(task.signature)
+            parts.append(part)
+            offsets.append(position)
+            position += len(part)
+        return cls(signatures, "".join(parts), offsets)
+
+    def __call__(self, subname: str) -> set[str]:
+        subname = subname.lower()
+        if subname in self._cache:
+            return self._cache[subname]
+
+        matches = set()
+        start = self._text.find(subname)
+        while start != -1:
+            i = bisect.bisect_right(self._offsets, start) - 1
+            matches.add(self.signatures[i])
+            # Continue the search with the keywords of the next task.
+            next_offset = (
+                self._offsets[i + 1] if i + 1 < len(self._offsets) else len(self._text)
+            )
+            start = self._text.find(subname, next_offset)
+
+        self._cache[subname] = matches
+        return matches
+
+
+@functools.lru_cache(maxsize=None)
+def _compile_expression(expression: str) -> Expression:
+    """Compile an expression once, even if it is used by many tasks."""
+    return Expression.compile_(expression)
 
 
 def select_by_after_keyword(session: Session, after: str) -> set[str]:
     """Select tasks defined by the after keyword."""
-    try:
-        expression = Expression.compile_(after)
-    except ParseError as e:
-        msg = f"Wrong expression passed to 'after': {after}: {e}"
-        raise ValueError(msg) from None
+    return select_by_after_keywords(session, [after])[after]
+
+
+def select_by_after_keywords(
+    session: Session, afters: Iterable[str]
+) -> dict[str, set[str]]:
+    """Select the tasks for multiple expressions of the after keyword at once.
+
+    The keyword index of all tasks is built once and shared by all expressions.
+
+    """
+    index: KeywordIndex | None = None
+    universe: set[str] = set()
+    selections: dict[str, set[str]] = {}
+    for after in afters:
+        if after in selections:
+            continue
+
+        try:
+            expression = _compile_expression(after)
+        except ParseError as e:
+            msg = f"Wrong expression passed to 'after': {after}: {e}"
+            raise ValueError(msg) from None
 
-    ancestors: set[str] = set()
-    for task in session.tasks:
-        if after and expression.evaluate(KeywordMatcher.from_task(task)):
-            ancestors.add(task.signature)
+        if index is None:
+            index = KeywordIndex.from_tasks(session.tasks)
+            universe = set(index.signatures)
+        selections[after] = expression.select(universe, index) if after else set()
 
-    return ancestors
+    return selections
 
 
 @define(slots=True)
@@ -218,32 +300,31 @@ def select_by_mark(session: Session, dag: nx.DiGraph) -> set[str] | None:
         msg = f"Wrong expression passed to '-m': {matchexpr}: {e}"
         raise ValueError(msg) from None
 
-    remaining: set[str] = set()
-    for task in session.tasks:
-        if expression.evaluate(MarkMatcher.from_task(task)):
-            remaining.update(task_and_preceding_tasks(task.signature, dag))
-
-    return remaining
+    matches = (
+        task.signature
+        for task in session.tasks
+        if expression.evaluate(MarkMatcher.from_task(task))
+    )
+    return tasks_and_preceding_tasks(matches, dag)
 
 
-def _deselect_others_with_mark(
-    session: Session, remaining: set[str], mark: Mark
-) -> None:
-    """Deselect tasks."""
-    for task in session.tasks:
-        if task.signature not in remaining:
-            task.markers.append(mark)
+def _deselect_others(session: Session, remaining: set[str]) -> None:
+    """Deselect all tasks which are not remaining."""
+    session.deselected.update(
+        task.signature for task in session.tasks if task.signature not in remaining
+    )
 
 
 def select_tasks_by_marks_and_expressions(session: Session, dag: nx.DiGraph) -> None:
-    """Modify the tasks which are executed with expressions and markers."""
+    """Modify the tasks which are executed with expressions and markers.
+
+    Deselected tasks are recorded in :attr:`~_pytask.session.Session.deselected`
+    instead of attaching a ``skip`` marker to each of them.
+
+    """
     remaining = select_by_keyword(session, dag)
     if remaining is not None:
-        _deselect_others_with_mark(
-            session, remaining, Mark("skip", (), {"reason": "Deselected by keyword."})
-        )
+        _deselect_others(session, remaining)
     remaining = select_by_mark(session, dag)
     if remaining is not None:
-        _deselect_others_with_mark(
-            session, remaining, Mark("skip", (), {"reason": "Deselected by mark."})
-        )
+        _deselect_others(session, remaining)
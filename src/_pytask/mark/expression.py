@@ -28,10 +28,12 @@ import ast
 import enum
 import re
 from typing import TYPE_CHECKING
+from typing import AbstractSet
 from typing import Callable
 from typing import Iterator
 from typing import Mapping
 from typing import Sequence
+from typing import TypeVar
 
 from attrs import define
 
@@ -43,6 +45,9 @@ if TYPE_CHECKING:
 __all__ = ["Expression", "ParseError"]
 
 
+T = TypeVar("T")
+
+
 class TokenType(enum.Enum):
     LPAREN = "left parenthesis"
     RPAREN = "right parenthesis"
@@ -205,10 +210,13 @@ class Expression:
 
     """
 
-    __slots__ = ("code",)
+    __slots__ = ("code", "tree")
 
-    def __init__(self, code: types.CodeType) -> None:
+    def __init__(
+        self, code: types.CodeType, tree: ast.Expression | None = None
+    ) -> None:
         self.code = code
+        self.tree = tree
 
     @classmethod
     def compile_(cls, input_: str) -> Expression:
@@ -226,7 +234,7 @@ class Expression:
             filename="<pytask match expression>",
             mode="eval",
         )
-        return cls(code)
+        return cls(code, astexpr)
 
     def evaluate(self, matcher: Callable[[str], bool]) -> bool:
         """Evaluate the match expression.
@@ -247,3 +255,51 @@ class Expression:
             self.code, {"__builtins__": {}}, MatcherAdapter(matcher)
         )
         return ret
+
+    def select(
+        self, universe: AbstractSet[T], matches: Callable[[str], AbstractSet[T]]
+    ) -> set[T]:
+        """Select all items of a universe for which the expression is true.
+
+        Instead of evaluating the expression for every item, the sets of items matched
+        by the identifiers are combined. ``and`` is an intersection, ``or`` a union, and
+        ``not`` the complement in the universe.
+
+        Parameters
+        ----------
+        universe : AbstractSet[T]
+            All items which can be selected.
+        matches : Callable[[str], AbstractSet[T]]
+            Given an identifier, should return all items of the universe it matches.
+
+        Returns
+        -------
+        set[T]
+            The items for which the expression is true.
+
+        """
+        if self.tree is None:  # pragma: no cover
+            msg = "The expression was not compiled with 'Expression.compile_'."
+            raise ValueError(msg)
+        return _select(self.tree.body, universe, matches)
+
+
+def _select(
+    node: ast.expr,
+    universe: AbstractSet[T],
+    matches: Callable[[str], AbstractSet[T]],
+) -> set[T]:
+    """Select the items of the universe for which a node of the expression is true."""
+    if isinstance(node, ast.Constant):
+        return set(universe) if node.value else set()
+    if isinstance(node, ast.Name):
+        return set(matches(node.id[len(IDENT_PREFIX) :]))
+    if isinstance(node, ast.UnaryOp):
+        return set(universe) - _select(node.operand, universe, matches)
+    if isinstance(node, ast.BoolOp):
+        selections = [_select(value, universe, matches) for value in node.values]
+        if isinstance(node.op, ast.And):
+            return set.intersection(*selections)
+        return set.union(*selections)
+    msg = f"Unknown node in expression: {ast.dump(node)}."  # pragma: no cover
+    raise ValueError(msg)  # pragma: no cover
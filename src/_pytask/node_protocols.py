@@ -18,7 +18,13 @@ __all__ = ["PNode", "PPathNode", "PProvisionalNode", "PTask", "PTaskWithPath"]
 
 @runtime_checkable
 class PNode(Protocol):
-    """Protocol for nodes."""
+    """Protocol for nodes.
+
+    Nodes can optionally implement the classmethods ``state_many(nodes)`` and
+    ``load_many(nodes, is_product)`` to compute the states or load the values of many
+    nodes of the same type at once. See :mod:`_pytask.node_utils`.
+
+    """
 
     name: str
 
@@ -0,0 +1,113 @@
+"""Contains utilities to compute states and load values of many nodes at once.
+
+Nodes can optionally implement the classmethods ``state_many(nodes)`` and
+``load_many(nodes, is_product)`` which receive a sequence of nodes of the same type and
+return the states or values in the same order. Nodes backed by databases or object
+stores can use them to answer all requests of a task with a single round trip. Nodes
+without these methods fall back to :meth:`~pytask.PNode.state` and
+:meth:`~pytask.PNode.load`.
+
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+from typing import Any
+from typing import Callable
+from typing import Iterable
+from typing import Sequence
+from typing import TypeVar
+
+from _pytask.node_protocols import PPathNode
+from _pytask.remote_utils import is_remote_path
+
+if TYPE_CHECKING:
+    from _pytask.node_protocols import PNode
+    from _pytask.node_protocols import PProvisionalNode
+    from _pytask.node_protocols import PTask
+
+
+__all__ = ["get_batched_states", "get_states", "has_batch_method", "load_values"]
+
+
+T = TypeVar("T")
+
+
+def has_batch_method(node: Any, name: str) -> bool:
+    """Check whether the type of a node implements a batch method."""
+    return callable(getattr(type(node), name, None))
+
+
+def _call_grouped_by_type(
+    nodes: Iterable[T],
+    name: str,
+    call_each: Callable[[T], Any],
+    **kwargs: Any,
+) -> dict[int, Any]:
+    """Call a batch method once per node type and map the ids of nodes to results."""
+    groups: dict[type, list[T]] = {}
+    for node in nodes:
+        groups.setdefault(type(node), []).append(node)
+
+    results: dict[int, Any] = {}
+    for type_, group in groups.items():
+        batch_method = getattr(type_, name, None)
+        if callable(batch_method):
+            values = list(batch_method(group, **kwargs))
+            if len(values) != len(group):
+                msg = (
+                    f"'{type_.__name__}.{name}' returned {len(values)} values for "
+                    f"{len(group)} nodes."
+                )
+                raise ValueError(msg)
+        else:
+            values = [call_each(node) for node in group]
+        results.update(zip(map(id, group), values))
+    return results
+
+
+def get_states(nodes: Iterable[PNode | PTask]) -> dict[str, str | None]:
+    """Compute the states of nodes and map their signatures to the states.
+
+    Nodes of the same type which implement ``state_many`` are handled with one call.
+
+    """
+    nodes = list(nodes)
+    states = _call_grouped_by_type(nodes, "state_many", lambda node: node.state())
+    return {node.signature: states[id(node)] for node in nodes}
+
+
+def load_values(
+    nodes: Iterable[PNode | PProvisionalNode], is_product: bool = False
+) -> dict[int, Any]:
+    """Load the values of nodes and map the ids of the nodes to the values.
+
+    Nodes of the same type which implement ``load_many`` are handled with one call.
+
+    """
+    return _call_grouped_by_type(
+        nodes,
+        "load_many",
+        lambda node: node.load(is_product=is_product),
+        is_product=is_product,
+    )
+
+
+def get_batched_states(nodes: Sequence[PNode | PTask]) -> dict[str, str | None]:
+    """Compute the states of all nodes whose types implement ``state_many``.
+
+    Nodes with local paths are left out as well since hashing their content is only
+    cheap when it stops at the first changed node. The states of all other nodes are
+    computed lazily.
+
+    """
+    return get_states(
+        node
+        for node in nodes
+        if has_batch_method(node, "state_many") and not _is_local_path_node(node)
+    )
+
+
+def _is_local_path_node(node: PNode | PTask) -> bool:
+    """Check whether a node is backed by a local path."""
+    return isinstance(node, PPathNode) and not is_remote_path(node.path)
@@ -4,25 +4,38 @@ from __future__ import annotations
 
 import hashlib
 import inspect
-import pickle
+import uuid
+from contextlib import contextmanager
 from contextlib import suppress
 from os import stat_result
 from pathlib import Path  # noqa: TCH003
+from typing import IO
 from typing import TYPE_CHECKING
 from typing import Any
 from typing import Callable
+from typing import ClassVar
+from typing import Generator
+from typing import Literal
+from typing import Sequence
 
 from attrs import define
 from attrs import field
-from upath._stat import UPathStatResult
+from attrs import fields
 
+from _pytask import pickle_utils
 from _pytask._hashlib import hash_value
+from _pytask.compat import import_optional_dependency
 from _pytask.node_protocols import PNode
 from _pytask.node_protocols import PPathNode
 from _pytask.node_protocols import PProvisionalNode
 from _pytask.node_protocols import PTask
 from _pytask.node_protocols import PTaskWithPath
 from _pytask.path import hash_path
+from _pytask.remote_utils import get_infos
+from _pytask.remote_utils import is_remote_path
+from _pytask.remote_utils import remote_file_cache
+from _pytask.spill_utils import SpilledValue
+from _pytask.spill_utils import spill_store
 from _pytask.typing import NoDefault
 from _pytask.typing import no_default
 
@@ -33,7 +46,11 @@ if TYPE_CHECKING:
 
 
 __all__ = [
+    "ArrayNode",
     "DirectoryNode",
+    "ParquetNode",
+    "PartitionedNode",
+    "Partitions",
     "PathNode",
     "PickleNode",
     "PythonNode",
@@ -186,9 +203,25 @@ class PathNode(PPathNode):
         """
         return _get_state(self.path)
 
-    def load(self, is_product: bool = False) -> Path:  # noqa: ARG002
-        """Load the value."""
-        return self.path
+    @classmethod
+    def state_many(cls, nodes: Sequence[PathNode]) -> list[str | None]:
+        """Calculate the states of many nodes.
+
+        The metadata of remote paths is requested concurrently.
+
+        """
+        return _get_states([node.path for node in nodes])
+
+    def load(self, is_product: bool = False) -> Path:
+        """Load the value.
+
+        Remote dependencies are replaced with local copies if the cache for remote
+        files is enabled.
+
+        """
+        if is_product:
+            return self.path
+        return remote_file_cache.get(self.path)
 
     def save(self, value: bytes | str) -> None:
         """Save strings or bytes to file."""
@@ -250,16 +283,29 @@ class PythonNode(PNode):
         return hashlib.sha256(raw_key.encode()).hexdigest()
 
     def load(self, is_product: bool = False) -> Any:
-        """Load the value."""
+        """Load the value.
+
+        Values which were spilled to disk are loaded into memory again.
+
+        """
         if is_product:
             return self
         if isinstance(self.value, PythonNode):
             return self.value.load()
+        if isinstance(self.value, SpilledValue):
+            return spill_store.restore(self)
+        spill_store.touch(self)
         return self.value
 
     def save(self, value: Any) -> None:
-        """Save the value."""
+        """Save the value.
+
+        If values of nodes exceed the memory budget, the least recently used values are
+        spilled to disk.
+
+        """
         self.value = value
+        spill_store.add(self)
 
     def state(self) -> str | None:
         """Calculate state of the node.
@@ -297,11 +343,43 @@ class PickleNode(PPathNode):
         Name of the node which makes it identifiable in the DAG.
     path
         The path to the file.
+    protocol
+        The pickle protocol. By default, :data:`pickle.DEFAULT_PROTOCOL` is used or 5 if
+        buffers are written out-of-band.
+    compression
+        Compress the pickle with ``"zstd"``, ``"lz4"``, or ``"gzip"``. zstd and lz4
+        fall back to gzip if their packages are not installed.
+    compression_level
+        The compression level. By default, the level of the compression library is
+        used.
+    out_of_band
+        Whether large buffers like the data of NumPy arrays are written after the
+        pickle without being copied. If the file is not compressed, the buffers are
+        mapped into memory when the file is loaded.
+    loads_saved_value
+        Whether :meth:`load` returns what was passed to :meth:`save` so that
+        ``@pytask.mark.fuse`` can hand over the value in memory.
 
     """
 
     path: Path
     name: str = ""
+    protocol: int | None = None
+    compression: Literal["zstd", "lz4", "gzip"] | None = None
+    compression_level: int | None = None
+    out_of_band: bool = False
+    loads_saved_value: ClassVar[bool] = True
+
+    def __getstate__(self) -> dict[str, Any]:
+        return {
+            attribute.name: getattr(self, attribute.name)
+            for attribute in fields(type(self))
+        }
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        # Nodes stored by data catalogs with previous versions lack newer attributes.
+        for attribute in fields(type(self)):
+            setattr(self, attribute.name, state.get(attribute.name, attribute.default))
 
     @property
     def signature(self) -> str:
@@ -320,15 +398,218 @@ class PickleNode(PPathNode):
     def state(self) -> str | None:
         return _get_state(self.path)
 
+    @classmethod
+    def state_many(cls, nodes: Sequence[PickleNode]) -> list[str | None]:
+        return _get_states([node.path for node in nodes])
+
+    def load(self, is_product: bool = False) -> Any:
+        """Load the value.
+
+        Compressed pickles and pickles with out-of-band buffers are recognized
+        automatically.
+
+        """
+        if is_product:
+            return self
+        if not pickle_utils.value_cache.max_size:
+            return pickle_utils.load(remote_file_cache.get(self.path))
+
+        signature = self.signature
+        state, size = _get_cache_key(self.path)
+        try:
+            return pickle_utils.value_cache.get(signature, state)
+        except KeyError:
+            value = pickle_utils.load(remote_file_cache.get(self.path))
+            pickle_utils.value_cache.put(signature, state, value, size)
+            return value
+
+    def save(self, value: Any) -> None:
+        with _open_for_replacing(self.path) as f, pickle_utils.open_compressed(
+            f, self.compression, self.compression_level
+        ) as stream:
+            pickle_utils.dump(
+                value, stream, protocol=self.protocol, out_of_band=self.out_of_band
+            )
+        if pickle_utils.value_cache.max_size:
+            state, size = _get_cache_key(self.path)
+            pickle_utils.value_cache.put(self.signature, state, value, size)
+
+
+@define
+class ArrayNode(PPathNode):
+    """A node for NumPy arrays stored in ``.npy`` files.
+
+    Dependencies are loaded as memory-mapped arrays. Only the parts of an array which
+    are accessed are read from disk and the pages are shared with other tasks and
+    processes reading the same file.
+
+    Attributes
+    ----------
+    name
+        Name of the node which makes it identifiable in the DAG.
+    path
+        The path to the file.
+    mmap_mode
+        The mode to map the array into memory. ``"r"`` opens the array read-only,
+        ``"r+"`` allows writing to the file, and ``"c"`` allows writing to the array in
+        memory without changing the file. With ``None``, the array is read into memory.
+        Remote files are always read into memory.
+
+    """
+
+    path: Path
+    name: str = ""
+    mmap_mode: Literal["r", "r+", "c"] | None = "r"
+
+    @property
+    def signature(self) -> str:
+        """The unique signature of the node."""
+        raw_key = str(hash_value(self.path))
+        return hashlib.sha256(raw_key.encode()).hexdigest()
+
+    @classmethod
+    def from_path(cls, path: Path) -> ArrayNode:
+        """Instantiate class from path to file."""
+        if not path.is_absolute():
+            msg = "Node must be instantiated from absolute path."
+            raise ValueError(msg)
+        return cls(name=path.as_posix(), path=path)
+
+    def state(self) -> str | None:
+        return _get_state(self.path)
+
+    @classmethod
+    def state_many(cls, nodes: Sequence[ArrayNode]) -> list[str | None]:
+        return _get_states([node.path for node in nodes])
+
+    def load(self, is_product: bool = False) -> Any:
+        if is_product:
+            return self
+
+        np: Any = import_optional_dependency("numpy")
+        path = remote_file_cache.get(self.path)
+        if self.mmap_mode is None or is_remote_path(path):
+            with path.open("rb") as f:
+                return np.load(f, allow_pickle=False)
+        return np.load(path, mmap_mode=self.mmap_mode, allow_pickle=False)
+
+    def save(self, value: Any) -> None:
+        """Save an array.
+
+        The array is written to disk in chunks without copying it in memory. Local
+        files are replaced at once so that tasks which mapped the previous array into
+        memory are not affected.
+
+        """
+        np: Any = import_optional_dependency("numpy")
+        with _open_for_replacing(self.path) as f:
+            np.save(f, value, allow_pickle=False)
+
+
+@define
+class ParquetNode(PPathNode):
+    """A node for tables stored in Parquet files.
+
+    Parquet files store tables column by column. When a dependency is loaded, only the
+    selected columns and the row groups which can contain rows matching the filters are
+    read.
+
+    Attributes
+    ----------
+    name
+        Name of the node which makes it identifiable in the DAG.
+    path
+        The path to the file.
+    columns
+        The columns which are loaded. All columns are loaded if it is ``None``.
+    filters
+        Filters on the rows which are loaded, either a
+        :class:`pyarrow.dataset.Expression` or a list of tuples like
+        ``[("year", ">=", 2020)]``. See :func:`pyarrow.parquet.read_table`.
+    lazy
+        Whether the dependency is loaded as a :class:`pyarrow.dataset.Scanner` which
+        reads the data only when it is materialized with ``to_table()``,
+        ``to_batches()``, or ``to_reader()``. By default, a :class:`pyarrow.Table` is
+        loaded.
+    compression
+        The compression codec used to save tables like ``"zstd"``, ``"snappy"``, or
+        ``"none"``.
+
+    """
+
+    path: Path
+    name: str = ""
+    columns: list[str] | None = None
+    filters: Any = None
+    lazy: bool = False
+    compression: str = "zstd"
+
+    @property
+    def signature(self) -> str:
+        """The unique signature of the node."""
+        raw_key = str(hash_value(self.path))
+        return hashlib.sha256(raw_key.encode()).hexdigest()
+
+    @classmethod
+    def from_path(cls, path: Path) -> ParquetNode:
+        """Instantiate class from path to file."""
+        if not path.is_absolute():
+            msg = "Node must be instantiated from absolute path."
+            raise ValueError(msg)
+        return cls(name=path.as_posix(), path=path)
+
+    def state(self) -> str | None:
+        return _get_state(self.path)
+
+    @classmethod
+    def state_many(cls, nodes: Sequence[ParquetNode]) -> list[str | None]:
+        return _get_states([node.path for node in nodes])
+
     def load(self, is_product: bool = False) -> Any:
         if is_product:
             return self
-        with self.path.open("rb") as f:
-            return pickle.load(f)  # noqa: S301
+
+        import_optional_dependency("pyarrow")
+        import pyarrow.parquet as pq
+
+        path = remote_file_cache.get(self.path)
+        kwargs: dict[str, Any] = {}
+        if is_remote_path(path):
+            source = path.path  # type: ignore[attr-defined]
+            kwargs["filesystem"] = path.fs  # type: ignore[attr-defined]
+        else:
+            source = str(path)
+
+        if self.lazy:
+            import pyarrow.dataset as ds
+
+            filters = (
+                None if self.filters is None else pq.filters_to_expression(self.filters)
+            )
+            dataset = ds.dataset(source, format="parquet", **kwargs)
+            return dataset.scanner(columns=self.columns, filter=filters)
+
+        return pq.read_table(
+            source,
+            columns=self.columns,
+            filters=self.filters,
+            memory_map=not kwargs,
+            **kwargs,
+        )
 
     def save(self, value: Any) -> None:
-        with self.path.open("wb") as f:
-            pickle.dump(value, f)
+        """Save a table.
+
+        Besides :class:`pyarrow.Table`, every object which can be converted with
+        :func:`pyarrow.table` like a :class:`pandas.DataFrame` can be saved.
+
+        """
+        pa: Any = import_optional_dependency("pyarrow")
+        import pyarrow.parquet as pq
+
+        table = value if isinstance(value, pa.Table) else pa.table(value)
+        with _open_for_replacing(self.path) as f:
+            pq.write_table(table, f, compression=self.compression)
 
 
 @define(kw_only=True)
@@ -370,6 +651,176 @@ class DirectoryNode(PProvisionalNode):
         return list(self.root_dir.glob(self.pattern))  # type: ignore[union-attr]
 
 
+@define
+class Partitions:
+    """The partitions of a :class:`PartitionedNode` loaded by a task.
+
+    The changes are relative to the partitions when the task was executed successfully
+    for the last time.
+
+    Attributes
+    ----------
+    root_dir
+        The directory containing the partitions.
+    paths
+        The paths of all partitions.
+    added
+        The paths of partitions which are new.
+    changed
+        The paths of partitions which were modified.
+    removed
+        The paths of partitions which were deleted.
+    is_incremental
+        Whether the changes can be applied to the products of the last execution. If
+        the task runs for the first time, if the task was modified, or if its products
+        changed, all partitions are reported as added and the products have to be
+        created from scratch.
+
+    """
+
+    root_dir: Path
+    paths: list[Path]
+    added: list[Path]
+    changed: list[Path]
+    removed: list[Path]
+    is_incremental: bool
+
+
+@define(kw_only=True)
+class PartitionedNode(PNode):
+    """A node for a dataset which is split into many partitions.
+
+    A partition is a file or a directory matching the pattern. pytask stores the state
+    of every partition for every task depending on the node. The task receives
+    :class:`Partitions` with the partitions which were added, changed, or removed since
+    its last execution and can update its products incrementally.
+
+    Attributes
+    ----------
+    name
+        The name of the node.
+    pattern
+        Patterns are the same as for :mod:`fnmatch`, with the addition of ``**`` which
+        means "this directory and all subdirectories, recursively".
+    root_dir
+        The pattern is interpreted relative to the path given by ``root_dir``. If
+        ``root_dir = None``, it is the directory where the path is defined.
+    previous_states
+        The states of the partitions when the task loading the node was executed
+        successfully for the last time. It is set by pytask before the task is executed
+        and is ``None`` if the products need to be created from scratch.
+
+    """
+
+    name: str = ""
+    pattern: str = "*"
+    root_dir: Path | None = None
+    previous_states: dict[str, str] | None = field(
+        default=None, init=False, eq=False, repr=False
+    )
+
+    @property
+    def signature(self) -> str:
+        """The unique signature of the node."""
+        raw_key = "".join(
+            str(hash_value(arg))
+            for arg in (type(self).__name__, self.root_dir, self.pattern)
+        )
+        return hashlib.sha256(raw_key.encode()).hexdigest()
+
+    def collect_partitions(self) -> list[Path]:
+        """Collect the paths of the partitions.
+
+        The method is not called ``collect`` since the node would be mistaken for a
+        :class:`~pytask.PProvisionalNode`.
+
+        """
+        return sorted(self.root_dir.glob(self.pattern))  # type: ignore[union-attr]
+
+    def partition_states(self) -> dict[str, str]:
+        """Map the paths of partitions relative to the root directory to their states.
+
+        The state of a directory is computed from the states of all files inside.
+
+        """
+        states = {}
+        for path in self.collect_partitions():
+            state: str | None
+            if path.is_dir():
+                files = sorted(child for child in path.rglob("*") if child.is_file())
+                raw_key = "".join(
+                    f"{file.relative_to(path).as_posix()}{_get_state(file)}"
+                    for file in files
+                )
+                state = hashlib.sha256(raw_key.encode()).hexdigest()
+            else:
+                state = _get_state(path)
+            if state is not None:
+                states[path.relative_to(self.root_dir).as_posix()] = state  # type: ignore[arg-type]
+        return states
+
+    def state(self) -> str | None:
+        """Calculate the state of the node from the states of all partitions."""
+        if not self.root_dir or not self.root_dir.exists():
+            return None
+        raw_key = "".join(f"{k}{v}" for k, v in self.partition_states().items())
+        return hashlib.sha256(raw_key.encode()).hexdigest()
+
+    def load(self, is_product: bool = False) -> Path | Partitions:
+        """Load the partitions and their changes or the root directory as a product."""
+        if is_product:
+            return self.root_dir  # type: ignore[return-value]
+
+        states = self.partition_states()
+        previous = self.previous_states or {}
+        return Partitions(
+            root_dir=self.root_dir,  # type: ignore[arg-type]
+            paths=[self.root_dir / name for name in states],  # type: ignore[operator]
+            added=[self.root_dir / name for name in states if name not in previous],  # type: ignore[operator]
+            changed=[
+                self.root_dir / name  # type: ignore[operator]
+                for name, state in states.items()
+                if name in previous and previous[name] != state
+            ],
+            removed=[
+                self.root_dir / name  # type: ignore[operator]
+                for name in previous
+                if name not in states
+            ],
+            is_incremental=self.previous_states is not None,
+        )
+
+    def save(self, value: Any) -> None:  # noqa: ARG002
+        """Partitions are written by tasks directly into the root directory."""
+        msg = (
+            "'PartitionedNode' cannot store return values of tasks. Use it as a "
+            "product and write the partitions into 'root_dir'."
+        )
+        raise TypeError(msg)
+
+
+@contextmanager
+def _open_for_replacing(path: Path) -> Generator[IO[bytes], None, None]:
+    """Open a file for writing which replaces the previous file at once.
+
+    Local files are written to a temporary file first so that readers which mapped the
+    previous file into memory are not affected. Remote files are written directly.
+
+    """
+    if is_remote_path(path):
+        with path.open("wb") as f:
+            yield f
+        return
+
+    temporary_path = path.with_name(f".{path.name}.{uuid.uuid4().hex}")
+    try:
+        with temporary_path.open("wb") as f:
+            yield f
+        temporary_path.replace(path)
+    finally:
+        temporary_path.unlink(missing_ok=True)
+
+
 def _get_state(path: Path) -> str | None:
     """Get state of a path.
 
@@ -384,7 +835,55 @@ def _get_state(path: Path) -> str | None:
     if isinstance(stat, stat_result):
         modification_time = stat.st_mtime
         return hash_path(path, modification_time)
+
+    from upath._stat import UPathStatResult
+
     if isinstance(stat, UPathStatResult):
-        return stat.as_info().get("ETag", "0")
+        etag = stat.as_info().get("ETag", "0")
+        remote_file_cache.record(path, etag)
+        return etag
     msg = "Unknown stat object."
     raise NotImplementedError(msg)
+
+
+def _get_cache_key(path: Path) -> tuple[str | None, int]:
+    """Get a cheap state and the size of a file to look up its value in a cache.
+
+    Unlike the state of the node, the key of local files is built from the metadata of
+    the file and does not require reading the content.
+
+    """
+    try:
+        stat = path.stat()
+    except FileNotFoundError:
+        return None, 0
+
+    if isinstance(stat, stat_result):
+        return f"{stat.st_ino}-{stat.st_mtime_ns}-{stat.st_size}", stat.st_size
+    return _get_state(path), stat.st_size
+
+
+def _get_states(paths: Sequence[Path]) -> list[str | None]:
+    """Get the states of many paths.
+
+    Local paths are handled one by one. Remote paths are grouped by their file system
+    and the metadata of all paths of a group is requested at once.
+
+    """
+    states: list[str | None] = [None] * len(paths)
+    remote: dict[int, list[int]] = {}
+    for i, path in enumerate(paths):
+        if is_remote_path(path):
+            remote.setdefault(id(path.fs), []).append(i)  # type: ignore[attr-defined]
+        else:
+            states[i] = _get_state(path)
+
+    for indices in remote.values():
+        fs = paths[indices[0]].fs  # type: ignore[attr-defined]
+        infos = get_infos(fs, [paths[i].path for i in indices])  # type: ignore[attr-defined]
+        for i, info in zip(indices, infos):
+            if info is not None:
+                etag = info.get("ETag", "0")
+                remote_file_cache.record(paths[i], etag)
+                states[i] = etag
+    return states
@@ -9,9 +9,6 @@ from typing import Iterable
 
 import click
 from click import Context
-from sqlalchemy.engine import URL
-from sqlalchemy.engine import make_url
-from sqlalchemy.exc import ArgumentError
 
 from _pytask.config_utils import set_defaults_from_config
 from _pytask.path import import_path
@@ -21,6 +18,7 @@ from _pytask.pluginmanager import storage
 
 if TYPE_CHECKING:
     from pluggy import PluginManager
+    from sqlalchemy.engine import URL
 
 
 _CONFIG_OPTION = click.Option(
@@ -94,6 +92,11 @@ def _database_url_callback(
     if value is None:
         return None
 
+    # sqlalchemy is imported here and not at the top of the module to keep the startup
+    # of the command line interface fast.
+    from sqlalchemy.engine import make_url
+    from sqlalchemy.exc import ArgumentError
+
     try:
         return make_url(value)
     except ArgumentError:
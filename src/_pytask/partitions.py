@@ -0,0 +1,84 @@
+"""Contains hooks to track the partitions of a :class:`~pytask.PartitionedNode`."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+from typing import Generator
+
+from _pytask.dag_utils import node_and_neighbors
+from _pytask.node_protocols import PProvisionalNode
+from _pytask.nodes import PartitionedNode
+from _pytask.outcomes import TaskOutcome
+from _pytask.pluginmanager import hookimpl
+from _pytask.tree_util import tree_leaves
+
+if TYPE_CHECKING:
+    from _pytask.node_protocols import PNode
+    from _pytask.node_protocols import PTask
+    from _pytask.reports import ExecutionReport
+    from _pytask.session import Session
+
+
+def _get_partitioned_nodes(task: PTask) -> list[PartitionedNode]:
+    nodes: list[PNode | PProvisionalNode] = tree_leaves(
+        task.depends_on  # type: ignore[arg-type]
+    )
+    return [node for node in nodes if isinstance(node, PartitionedNode)]
+
+
+@hookimpl(wrapper=True)
+def pytask_execute_task_setup(
+    session: Session, task: PTask
+) -> Generator[None, None, None]:
+    """Attach the previous states of partitions to nodes of tasks which are executed.
+
+    The previous states are only valid if the task and its products are unchanged.
+    Otherwise, the products need to be created from scratch.
+
+    """
+    result = yield
+
+    nodes = _get_partitioned_nodes(task)
+    if nodes:
+        from _pytask.database_utils import get_partition_states
+        from _pytask.database_utils import has_node_changed
+
+        # The task itself and its products without provisional nodes.
+        predecessors = set(session.dag.predecessors(task.signature))
+        task_and_products = [
+            session.dag.nodes[signature].get("task")
+            or session.dag.nodes[signature]["node"]
+            for signature in node_and_neighbors(session.dag, task.signature)
+            if signature not in predecessors
+            and not isinstance(
+                session.dag.nodes[signature].get("node"), PProvisionalNode
+            )
+        ]
+        is_incremental = not session.config["force"] and not any(
+            has_node_changed(task=task, node=node, state=node.state())
+            for node in task_and_products
+        )
+        for node in nodes:
+            node.previous_states = (
+                get_partition_states(task.signature, node.signature)
+                if is_incremental
+                else None
+            )
+
+    return result
+
+
+@hookimpl
+def pytask_execute_task_process_report(report: ExecutionReport) -> None:
+    """Store the states of partitions after a task was executed successfully."""
+    if report.outcome != TaskOutcome.SUCCESS:
+        return
+
+    nodes = _get_partitioned_nodes(report.task)
+    if nodes:
+        from _pytask.database_utils import update_partition_states
+
+        for node in nodes:
+            update_partition_states(
+                report.task.signature, node.signature, node.partition_states()
+            )
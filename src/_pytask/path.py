@@ -3,18 +3,27 @@
 from __future__ import annotations
 
 import contextlib
+import fnmatch
 import functools
 import importlib.util
 import os
+import re
 import sys
 from pathlib import Path
+from pathlib import PurePath
 from types import ModuleType
+from typing import Iterable
 from typing import Sequence
 
+from attrs import define
+from attrs import field
+
 from _pytask._hashlib import file_digest
 from _pytask.cache import Cache
 
 __all__ = [
+    "PathPatternMatcher",
+    "compile_path_patterns",
     "find_case_sensitive_path",
     "find_closest_ancestor",
     "find_common_ancestor",
@@ -22,6 +31,7 @@ __all__ = [
     "import_path",
     "relative_to",
     "shorten_path",
+    "unload_module",
 ]
 
 
@@ -147,6 +157,16 @@ def import_path(path: Path, root: Path) -> ModuleType:
     return mod
 
 
+def unload_module(path: Path, root: Path) -> None:
+    """Remove a module imported with :func:`import_path` from :obj:`sys.modules`.
+
+    Afterwards, :func:`import_path` executes the module again, for example, to collect
+    tasks from a module that has changed.
+
+    """
+    sys.modules.pop(_module_name_from_path(path, root), None)
+
+
 def _module_name_from_path(path: Path, root: Path) -> str:
     """Return a dotted module name based on the given path, anchored on root.
 
@@ -241,3 +261,116 @@ def hash_path(
     with path.open("rb") as f:
         hash_ = file_digest(f, digest)
     return hash_.hexdigest()
+
+
+def _translate_part(part: str) -> str:
+    r"""Translate a single part of a glob pattern to a regular expression.
+
+    :func:`fnmatch.translate` returns an expression like ``(?s:...)\Z``. The anchor is
+    removed so that the parts of a pattern can be joined into a single expression.
+
+    """
+    translated = fnmatch.translate(part)
+    return translated[:-2] if translated.endswith(r"\Z") else translated
+
+
+def _compile_parts(
+    patterns: Iterable[tuple[str, ...]], flags: int
+) -> dict[int, re.Pattern[str]]:
+    """Compile all patterns with the same number of parts into one expression."""
+    by_length: dict[int, list[str]] = {}
+    for parts in patterns:
+        expression = "/".join(_translate_part(part) for part in parts)
+        by_length.setdefault(len(parts), []).append(expression)
+    return {
+        length: re.compile("|".join(f"(?:{e})" for e in expressions) + r"\Z", flags)
+        for length, expressions in sorted(by_length.items())
+    }
+
+
+@define(frozen=True)
+class PathPatternMatcher:
+    """Match paths against many glob patterns at once.
+
+    The matcher follows the semantics of :meth:`pathlib.PurePath.match` which is applied
+    to each pattern. Relative patterns are matched from the right and absolute patterns
+    must match the whole path. Instead of evaluating the patterns one after another, all
+    patterns with the same number of parts are compiled into a single regular expression
+    which is applied to the same number of trailing parts of the path.
+
+    Attributes
+    ----------
+    relative
+        A mapping from the number of parts to the compiled relative patterns.
+    anchored
+        A mapping from the number of parts to the compiled absolute patterns.
+    children
+        A matcher for patterns like ``folder/*`` without the last part. If a directory
+        matches, all of its children are matched by the full patterns.
+
+    """
+
+    relative: dict[int, re.Pattern[str]] = field(factory=dict)
+    anchored: dict[int, re.Pattern[str]] = field(factory=dict)
+    children: PathPatternMatcher | None = None
+
+    @classmethod
+    def from_patterns(cls, patterns: Iterable[str]) -> PathPatternMatcher:
+        """Compile a matcher from glob patterns."""
+        flags = re.IGNORECASE if sys.platform == "win32" else 0
+
+        relative_parts = []
+        anchored_parts = []
+        for pattern in patterns:
+            if not pattern:
+                continue
+            pure_pattern = PurePath(pattern)
+            if pure_pattern.anchor:
+                anchored_parts.append(pure_pattern.parts)
+            else:
+                relative_parts.append(pure_pattern.parts)
+
+        parent_patterns = [
+            parts[:-1]
+            for parts in relative_parts
+            if len(parts) > 1 and parts[-1] == "*"
+        ]
+        children = (
+            cls(
+                relative=_compile_parts(parent_patterns, flags),
+                anchored={},
+                children=None,
+            )
+            if parent_patterns
+            else None
+        )
+        return cls(
+            relative=_compile_parts(relative_parts, flags),
+            anchored=_compile_parts(anchored_parts, flags),
+            children=children,
+        )
+
+    def match_parts(self, parts: tuple[str, ...]) -> bool:
+        """Match the parts of a path as returned by :attr:`pathlib.PurePath.parts`."""
+        n_parts = len(parts)
+        for length, expression in self.relative.items():
+            if length > n_parts:
+                break
+            if expression.match("/".join(parts[-length:])):
+                return True
+        anchored = self.anchored.get(n_parts)
+        return anchored is not None and bool(anchored.match("/".join(parts)))
+
+    def matches_all_children(self, parts: tuple[str, ...]) -> bool:
+        """Indicate whether every child of a directory is matched."""
+        return self.children is not None and self.children.match_parts(parts)
+
+    def __call__(self, path: PurePath) -> bool:
+        """Match a path."""
+        return self.match_parts(path.parts)
+
+
+@functools.lru_cache
+def compile_path_patterns(patterns: tuple[str, ...]) -> PathPatternMatcher:
+    """Compile and cache a matcher for a tuple of glob patterns."""
+    return PathPatternMatcher.from_patterns(patterns)
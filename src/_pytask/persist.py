@@ -6,9 +6,8 @@ from typing import TYPE_CHECKING
 from typing import Any
 
 from _pytask.dag_utils import node_and_neighbors
-from _pytask.database_utils import has_node_changed
-from _pytask.database_utils import update_states_in_database
 from _pytask.mark_utils import has_mark
+from _pytask.node_utils import get_states
 from _pytask.outcomes import Persisted
 from _pytask.outcomes import TaskOutcome
 from _pytask.pluginmanager import hookimpl
@@ -39,26 +38,20 @@ def pytask_execute_task_setup(session: Session, task: PTask) -> None:
     The decorator needs to be set and all nodes need to exist.
 
     """
+    from _pytask.database_utils import has_node_changed
+
     if has_mark(task, "persist"):
-        all_states = [
-            (
-                session.dag.nodes[name].get("task") or session.dag.nodes[name]["node"]
-            ).state()
+        nodes = [
+            session.dag.nodes[name].get("task") or session.dag.nodes[name]["node"]
             for name in node_and_neighbors(session.dag, task.signature)
         ]
-        all_nodes_exist = all(all_states)
+        states = get_states(nodes)
+        all_nodes_exist = all(states.values())
 
         if all_nodes_exist:
             any_node_changed = any(
-                has_node_changed(
-                    task=task,
-                    node=session.dag.nodes[name].get("task")
-                    or session.dag.nodes[name]["node"],
-                    state=state,
-                )
-                for name, state in zip(
-                    node_and_neighbors(session.dag, task.signature), all_states
-                )
+                has_node_changed(task=task, node=node, state=states[node.signature])
+                for node in nodes
             )
             if any_node_changed:
                 collect_provisional_products(session, task)
@@ -74,6 +67,8 @@ def pytask_execute_task_process_report(
     Do not return ``True`` so that states will be updated in database.
 
     """
+    from _pytask.database_utils import update_states_in_database
+
     if report.exc_info and isinstance(report.exc_info[1], Persisted):
         report.outcome = TaskOutcome.PERSISTENCE
         update_states_in_database(session, report.task.signature)
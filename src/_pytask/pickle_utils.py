@@ -0,0 +1,380 @@
+"""Contains utilities to write and read compressed pickles with out-of-band buffers.
+
+Pickles can be compressed with zstd, lz4, or gzip. zstd is provided by the standard
+library from Python 3.14 on or by :mod:`zstandard` and lz4 by :mod:`lz4`. If neither is
+installed, gzip is used instead. Compressed files are recognized by their magic number
+when they are loaded.
+
+With protocol 5, large buffers like the data of NumPy arrays can be written out-of-band
+(:pep:`574`). They are written directly from memory after the pickled object without
+being copied into the pickle. Files with out-of-band buffers start with
+:data:`OUT_OF_BAND_MAGIC` followed by a header with the length of the pickle and of each
+buffer. Every buffer starts at a multiple of :data:`ALIGNMENT` bytes. Uncompressed local
+files are mapped into memory when they are loaded, and the buffers are passed to the
+unpickled objects without copying them.
+
+Values which are saved or loaded can be kept in memory by :data:`value_cache` so that
+other tasks in the same process receive them without reading the file.
+
+"""
+
+from __future__ import annotations
+
+import copy
+import gzip
+import io
+import mmap
+import pickle
+import struct
+import sys
+import threading
+from collections import OrderedDict
+from contextlib import contextmanager
+from importlib import import_module
+from typing import IO
+from typing import TYPE_CHECKING
+from typing import Any
+from typing import Generator
+from typing import cast
+
+from attrs import define
+from attrs import field
+
+from _pytask.compat import import_optional_dependency
+from _pytask.remote_utils import is_remote_path
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+__all__ = [
+    "COMPRESSIONS",
+    "ValueCache",
+    "dump",
+    "load",
+    "open_compressed",
+    "resolve_compression",
+    "value_cache",
+]
+
+
+COMPRESSIONS = ("zstd", "lz4", "gzip")
+"""tuple[str, ...]: The supported compression formats."""
+
+OUT_OF_BAND_MAGIC = b"\xffPYTASK-OOB\x00"
+"""bytes: The start of files with out-of-band buffers.
+
+``0xff`` is no pickle opcode, so the files cannot be confused with pickles.
+
+"""
+
+ALIGNMENT = 64
+"""int: The alignment of out-of-band buffers in bytes."""
+
+MIN_OUT_OF_BAND_SIZE = 64 * 1024
+"""int: The minimum size of buffers in bytes which are written out-of-band."""
+
+_MAGIC_NUMBERS = {
+    b"\x28\xb5\x2f\xfd": "zstd",
+    b"\x04\x22\x4d\x18": "lz4",
+    b"\x1f\x8b": "gzip",
+}
+
+
+def _import_zstd() -> Any:
+    """Import the zstd module of the standard library or :mod:`zstandard`."""
+    if sys.version_info >= (3, 14):
+        return import_module("compression.zstd")
+    return import_optional_dependency("zstandard", errors="ignore")
+
+
+def _import_lz4() -> Any:
+    return import_optional_dependency("lz4.frame", errors="ignore")
+
+
+def resolve_compression(compression: str | None) -> str | None:
+    """Resolve the compression format to the one which is used.
+
+    Formats whose packages are not installed are replaced with gzip.
+
+    Raises
+    ------
+    ValueError
+        If the compression format is not supported.
+
+    """
+    if compression is None:
+        return None
+    if compression not in COMPRESSIONS:
+        msg = (
+            f"Compression {compression!r} is not supported. Use one of "
+            f"{', '.join(map(repr, COMPRESSIONS))}."
+        )
+        raise ValueError(msg)
+    if (compression == "zstd" and _import_zstd() is None) or (
+        compression == "lz4" and _import_lz4() is None
+    ):
+        return "gzip"
+    return compression
+
+
+@contextmanager
+def open_compressed(
+    f: IO[bytes], compression: str | None, level: int | None = None
+) -> Generator[IO[bytes], None, None]:
+    """Wrap a binary file with a stream which compresses the written data."""
+    compression = resolve_compression(compression)
+    if compression is None:
+        yield f
+        return
+
+    if compression == "zstd":
+        zstd = _import_zstd()
+        if zstd.__name__ == "zstandard":
+            compressor = zstd.ZstdCompressor(level=3 if level is None else level)
+            stream = compressor.stream_writer(f, closefd=False)
+        else:
+            stream = zstd.ZstdFile(f, mode="wb", level=level)
+    elif compression == "lz4":
+        lz4_frame = _import_lz4()
+        stream = lz4_frame.LZ4FrameFile(
+            f, mode="wb", compression_level=0 if level is None else level
+        )
+    else:
+        stream = gzip.GzipFile(
+            fileobj=f, mode="wb", compresslevel=6 if level is None else level
+        )
+
+    with stream:
+        yield stream
+
+
+def _peekable(f: IO[bytes]) -> IO[bytes]:
+    """Buffer a stream so that its first bytes can be peeked at."""
+    if hasattr(f, "peek"):
+        return f
+    # Streams without ``peek`` still implement the interface of raw streams.
+    return io.BufferedReader(cast(io.RawIOBase, f))
+
+
+def _detect_compression(f: IO[bytes]) -> str | None:
+    """Detect the compression format of a file from its magic number."""
+    head = f.peek(4)[:4]  # type: ignore[attr-defined]
+    return next(
+        (name for magic, name in _MAGIC_NUMBERS.items() if head.startswith(magic)),
+        None,
+    )
+
+
+def _open_decompressed(f: IO[bytes], compression: str | None) -> IO[bytes]:
+    """Wrap a binary file with a stream which decompresses the data."""
+    if compression == "zstd":
+        zstd = _import_zstd()
+        if zstd is None:
+            import_optional_dependency("zstandard")
+        if zstd.__name__ == "zstandard":
+            return zstd.ZstdDecompressor().stream_reader(f, closefd=False)
+        return zstd.ZstdFile(f, mode="rb")
+    if compression == "lz4":
+        return import_optional_dependency("lz4.frame").LZ4FrameFile(f, mode="rb")  # type: ignore[union-attr]
+    if compression == "gzip":
+        return gzip.GzipFile(fileobj=f, mode="rb")  # type: ignore[return-value]
+    return f
+
+
+def dump(
+    value: Any, f: IO[bytes], protocol: int | None = None, out_of_band: bool = False
+) -> None:
+    """Pickle a value into a binary file.
+
+    Raises
+    ------
+    ValueError
+        If buffers should be written out-of-band with a protocol lower than 5.
+
+    """
+    if not out_of_band:
+        pickle.dump(value, f, protocol=protocol)
+        return
+
+    if protocol is not None and protocol < 5:  # noqa: PLR2004
+        msg = f"Out-of-band buffers require pickle protocol 5, not {protocol}."
+        raise ValueError(msg)
+
+    buffers: list[memoryview] = []
+
+    def _collect_buffer(buffer: pickle.PickleBuffer) -> bool:
+        """Collect large contiguous buffers and keep all others in the pickle."""
+        try:
+            raw = buffer.raw()
+        except BufferError:
+            return True
+        if raw.nbytes < MIN_OUT_OF_BAND_SIZE:
+            return True
+        buffers.append(raw)
+        return False
+
+    payload = pickle.dumps(
+        value,
+        protocol=5 if protocol is None else protocol,
+        buffer_callback=_collect_buffer,
+    )
+
+    header = OUT_OF_BAND_MAGIC + struct.pack(
+        f"<QQ{len(buffers)}Q",
+        len(payload),
+        len(buffers),
+        *(buffer.nbytes for buffer in buffers),
+    )
+    f.write(header)
+    f.write(payload)
+    position = len(header) + len(payload)
+    for buffer in buffers:
+        padding = -position % ALIGNMENT
+        f.write(b"\x00" * padding)
+        f.write(buffer)
+        position += padding + buffer.nbytes
+
+
+def load(path: Path) -> Any:
+    """Load a pickle which might be compressed or contain out-of-band buffers."""
+    with path.open("rb") as file:
+        f = _peekable(file)
+        compression = _detect_compression(f)
+        stream = _peekable(_open_decompressed(f, compression))
+        head = stream.peek(len(OUT_OF_BAND_MAGIC))[: len(OUT_OF_BAND_MAGIC)]  # type: ignore[attr-defined]
+        if head != OUT_OF_BAND_MAGIC:
+            return pickle.load(stream)  # noqa: S301
+
+        if compression is None and not is_remote_path(path):
+            # Map the file into memory. Pages are copied only when objects are modified.
+            data = memoryview(mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_COPY))
+            payload, buffers = _split(data)
+        else:
+            header = stream.read(len(OUT_OF_BAND_MAGIC) + 16)
+            n_buffers = struct.unpack_from("<QQ", header, len(OUT_OF_BAND_MAGIC))[1]
+            header += stream.read(8 * n_buffers)
+            payload, buffers = _split(_read_into_buffer(stream, header))
+
+    return pickle.loads(payload, buffers=buffers)  # noqa: S301
+
+
+def _layout(header: bytes | memoryview) -> tuple[slice, list[slice]]:
+    """Compute the positions of the pickle and of the buffers from the header."""
+    offset = len(OUT_OF_BAND_MAGIC)
+    payload_size, n_buffers = struct.unpack_from("<QQ", header, offset)
+    offset += 16
+    sizes = struct.unpack_from(f"<{n_buffers}Q", header, offset)
+    offset += 8 * n_buffers
+
+    payload = slice(offset, offset + payload_size)
+    offset += payload_size
+    buffers = []
+    for size in sizes:
+        offset += -offset % ALIGNMENT
+        buffers.append(slice(offset, offset + size))
+        offset += size
+    return payload, buffers
+
+
+def _split(data: memoryview) -> tuple[memoryview, list[memoryview]]:
+    payload, buffers = _layout(data)
+    return data[payload], [data[buffer] for buffer in buffers]
+
+
+def _read_into_buffer(stream: IO[bytes], header: bytes) -> memoryview:
+    """Read the rest of a stream into a buffer which starts with the header."""
+    payload, buffers = _layout(header)
+    size = buffers[-1].stop if buffers else payload.stop
+    data = memoryview(bytearray(size))
+    data[: len(header)] = header
+
+    position = len(header)
+    while position < size:
+        n_bytes = stream.readinto(data[position:])  # type: ignore[attr-defined]
+        if not n_bytes:
+            msg = "The file with out-of-band buffers is truncated."
+            raise EOFError(msg)
+        position += n_bytes
+    return data
+
+
+@define
+class ValueCache:
+    """A size-bounded cache of values in memory with least-recently-used eviction.
+
+    Values are stored under the signature of their node together with a state of the
+    node. Only the latest state of a node is kept. The cache stores a copy of every
+    value and returns a new copy whenever a value is requested so that tasks which
+    modify their inputs do not affect each other. Copying a value in memory is still
+    cheaper than reading and unpickling the file. The cache can be used from multiple
+    threads.
+
+    Attributes
+    ----------
+    max_size
+        The maximum size of all values in bytes. The size of a value is approximated by
+        the size of its file. The cache is disabled with 0.
+    hits
+        The number of values which were found in the cache.
+    misses
+        The number of values which were not found in the cache.
+
+    """
+
+    max_size: int = 0
+    hits: int = 0
+    misses: int = 0
+    size: int = 0
+    _entries: OrderedDict[str, tuple[str, Any, int]] = field(factory=OrderedDict)
+    _lock: threading.RLock = field(factory=threading.RLock, repr=False)
+
+    def configure(self, max_size: int = 0) -> None:
+        """Enable the cache with a maximum size or disable it with 0."""
+        with self._lock:
+            self.max_size = max_size
+            self.hits = 0
+            self.misses = 0
+            self.size = 0
+            self._entries.clear()
+
+    def get(self, signature: str, state: str | None) -> Any:
+        """Get the value of a node with the given state.
+
+        Raises
+        ------
+        KeyError
+            If no value of the node with the state is cached.
+
+        """
+        with self._lock:
+            entry = self._entries.get(signature)
+            if entry is None or entry[0] != state:
+                self.misses += 1
+                raise KeyError(signature)
+            self.hits += 1
+            self._entries.move_to_end(signature)
+            return copy.deepcopy(entry[1])
+
+    def put(self, signature: str, state: str | None, value: Any, size: int) -> None:
+        """Store the value of a node and evict the least recently used values."""
+        with self._lock:
+            self.discard(signature)
+            if state is None or size > self.max_size:
+                return
+            self._entries[signature] = (state, copy.deepcopy(value), size)
+            self.size += size
+            while self.size > self.max_size:
+                _, (_, _, evicted_size) = self._entries.popitem(last=False)
+                self.size -= evicted_size
+
+    def discard(self, signature: str) -> None:
+        """Remove the value of a node."""
+        with self._lock:
+            entry = self._entries.pop(signature, None)
+            if entry is not None:
+                self.size -= entry[2]
+
+
+value_cache = ValueCache()
+"""ValueCache: The cache which keeps values of :class:`~pytask.PickleNode` in memory."""
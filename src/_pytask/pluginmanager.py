@@ -2,9 +2,16 @@
 
 from __future__ import annotations
 
+import hashlib
 import importlib
+import importlib.metadata
+import json
+import os
 import sys
+from pathlib import Path
+from typing import Any
 from typing import Iterable
+from weakref import WeakKeyDictionary
 
 from attrs import define
 from pluggy import HookimplMarker
@@ -13,8 +20,11 @@ from pluggy import PluginManager
 from _pytask import hookspecs
 
 __all__ = [
+    "PluginDistribution",
     "get_plugin_manager",
     "hookimpl",
+    "list_plugin_distributions",
+    "load_entry_points",
     "register_hook_impls_from_modules",
     "storage",
 ]
@@ -23,6 +33,24 @@ __all__ = [
 hookimpl = HookimplMarker("pytask")
 
 
+_DISABLE_PLUGIN_CACHE_VARIABLE = "PYTASK_DISABLE_PLUGIN_CACHE"
+"""str: Set this environment variable to a non-empty value to disable the cache."""
+
+
+@define(frozen=True)
+class PluginDistribution:
+    """The name and version of a distribution which provides plugins."""
+
+    project_name: str
+    version: str
+
+
+_PLUGIN_DISTRIBUTIONS: WeakKeyDictionary[
+    PluginManager, list[tuple[Any, PluginDistribution]]
+] = WeakKeyDictionary()
+"""The plugins registered from cached entry points and their distributions."""
+
+
 def register_hook_impls_from_modules(
     plugin_manager: PluginManager, module_names: Iterable[str]
 ) -> None:
@@ -36,6 +64,7 @@ def register_hook_impls_from_modules(
 def pytask_add_hooks(pm: PluginManager) -> None:
     """Add hooks."""
     builtin_hook_impl_modules = (
+        "_pytask.async_tasks",
         "_pytask.build",
         "_pytask.capture",
         "_pytask.clean",
@@ -44,29 +73,175 @@ def pytask_add_hooks(pm: PluginManager) -> None:
         "_pytask.config",
         "_pytask.dag",
         "_pytask.dag_command",
+        "_pytask.data_catalog",
         "_pytask.database",
         "_pytask.debugging",
+        "_pytask.distributed",
         "_pytask.provisional",
         "_pytask.execute",
+        "_pytask.fusion",
         "_pytask.live",
         "_pytask.logging",
         "_pytask.mark",
         "_pytask.nodes",
         "_pytask.parameters",
+        "_pytask.partitions",
         "_pytask.persist",
+        "_pytask.prefetch",
         "_pytask.profile",
+        "_pytask.remote_cache",
+        "_pytask.resources",
+        "_pytask.serve",
         "_pytask.skipping",
+        "_pytask.spill",
+        "_pytask.target",
         "_pytask.task",
+        "_pytask.value_cache",
         "_pytask.warnings",
+        "_pytask.watch",
+        "_pytask.worker_pool",
+        "_pytask.write_behind",
     )
     register_hook_impls_from_modules(pm, builtin_hook_impl_modules)
 
 
+def _get_cache_directory() -> Path:
+    """Get the user's cache directory for pytask."""
+    if sys.platform == "win32":  # pragma: no cover
+        base = os.environ.get("LOCALAPPDATA", Path.home() / "AppData" / "Local")
+    elif sys.platform == "darwin":  # pragma: no cover
+        base = Path.home() / "Library" / "Caches"
+    else:
+        base = os.environ.get("XDG_CACHE_HOME", Path.home() / ".cache")
+    return Path(base) / "pytask"
+
+
+def _compute_environment_fingerprint() -> str:
+    """Compute a fingerprint of the paths where distributions can be installed.
+
+    Installing, upgrading, or removing a distribution adds or removes a ``.dist-info``
+    folder or a ``.pth`` file and, thus, changes the modification time of the directory
+    on :obj:`sys.path`.
+
+    """
+    hash_ = hashlib.sha256(f"{sys.executable}{sys.version}".encode())
+    for entry in sys.path:
+        try:
+            modified = Path(entry or os.curdir).stat().st_mtime_ns
+        except OSError:
+            modified = 0
+        hash_.update(f"{entry}:{modified}".encode())
+    return hash_.hexdigest()
+
+
+def _discover_entry_points(group: str) -> list[dict[str, str]]:
+    """Discover the entry points of a group by scanning all distributions."""
+    return [
+        {
+            "name": ep.name,
+            "value": ep.value,
+            "distribution": dist.metadata["name"],
+            "version": dist.version,
+        }
+        for dist in importlib.metadata.distributions()
+        for ep in dist.entry_points
+        if ep.group == group
+    ]
+
+
+def _get_cache_path(group: str) -> Path:
+    """Get the path to the cache of entry points of the current interpreter."""
+    interpreter = hashlib.sha256(sys.executable.encode()).hexdigest()[:16]
+    return _get_cache_directory() / f"entry_points-{group}-{interpreter}.json"
+
+
+def _load_entry_points(group: str) -> list[dict[str, str]]:
+    """Load the entry points of a group from the cache or discover them.
+
+    The cache is stored per interpreter in the user's cache directory and invalidated
+    when the fingerprint of the environment changes. Failing to read or write the cache
+    is not an error and pytask falls back to the discovery.
+
+    """
+    if os.environ.get(_DISABLE_PLUGIN_CACHE_VARIABLE):
+        return _discover_entry_points(group)
+
+    path = _get_cache_path(group)
+    fingerprint = _compute_environment_fingerprint()
+
+    try:
+        cache: dict[str, Any] = json.loads(path.read_text())
+    except (OSError, ValueError):
+        cache = {}
+    if cache.get("fingerprint") == fingerprint:
+        return cache["entry_points"]
+
+    entry_points = _discover_entry_points(group)
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(
+            json.dumps({"fingerprint": fingerprint, "entry_points": entry_points})
+        )
+    except OSError:  # pragma: no cover
+        pass
+    return entry_points
+
+
+def _register_entry_points(
+    pm: PluginManager, group: str, entry_points: list[dict[str, str]]
+) -> None:
+    """Register the plugins of entry points which are not registered yet."""
+    for entry_point in entry_points:
+        if pm.get_plugin(entry_point["name"]) or pm.is_blocked(entry_point["name"]):
+            continue
+        ep = importlib.metadata.EntryPoint(
+            name=entry_point["name"], value=entry_point["value"], group=group
+        )
+        plugin = ep.load()
+        pm.register(plugin, name=ep.name)
+        # Record the distribution like pluggy does so that it is shown in the header.
+        distribution = PluginDistribution(
+            project_name=entry_point["distribution"], version=entry_point["version"]
+        )
+        _PLUGIN_DISTRIBUTIONS.setdefault(pm, []).append((plugin, distribution))
+
+
+def load_entry_points(pm: PluginManager, group: str) -> None:
+    """Register plugins from entry points.
+
+    This function mirrors :meth:`pluggy.PluginManager.load_setuptools_entrypoints` but
+    avoids scanning the metadata of all installed distributions on every start by
+    caching the discovered entry points. Set the environment variable
+    ``PYTASK_DISABLE_PLUGIN_CACHE`` to disable the cache.
+
+    If a cached entry point cannot be loaded, for example, because its distribution was
+    uninstalled without changing the fingerprint of the environment, the cache is
+    dropped and the entry points are discovered again.
+
+    """
+    try:
+        _register_entry_points(pm, group, _load_entry_points(group))
+    except (ImportError, AttributeError, KeyError):
+        if os.environ.get(_DISABLE_PLUGIN_CACHE_VARIABLE):
+            raise
+        _get_cache_path(group).unlink(missing_ok=True)
+        _register_entry_points(pm, group, _load_entry_points(group))
+
+
+def list_plugin_distributions(pm: PluginManager) -> list[tuple[Any, Any]]:
+    """List the registered plugins and the distributions which provide them.
+
+    The list contains plugins registered by pluggy and from the cached entry points.
+
+    """
+    return [*pm.list_plugin_distinfo(), *_PLUGIN_DISTRIBUTIONS.get(pm, [])]
+
+
 def get_plugin_manager() -> PluginManager:
     """Get the plugin manager."""
     pm = PluginManager("pytask")
     pm.add_hookspecs(hookspecs)
-    pm.load_setuptools_entrypoints("pytask")
+    load_entry_points(pm, "pytask")
 
     pm.register(sys.modules[__name__])
     pm.hook.pytask_add_hooks.call_historic(kwargs={"pm": pm})
@@ -99,8 +274,15 @@ class _PluginManagerStorage:
         return self._plugin_manager
 
     def get(self) -> PluginManager:
-        """Get the plugin manager."""
-        assert self._plugin_manager
+        """Get the plugin manager.
+
+        Since :mod:`pytask` imports its namespace lazily, no plugin manager might have
+        been created yet, for example, when a :class:`~pytask.DataCatalog` is used
+        outside of a pytask run. Then, a new plugin manager is created.
+
+        """
+        if self._plugin_manager is None:
+            return self.create()
         return self._plugin_manager
 
     def store(self, pm: PluginManager) -> None:
@@ -0,0 +1,119 @@
+"""Contains hooks to prefetch dependencies of upcoming tasks."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+from typing import Any
+from typing import Generator
+
+import click
+
+from _pytask.dag_utils import TopologicalSorter
+from _pytask.fusion_utils import fused_values
+from _pytask.outcomes import TaskOutcome
+from _pytask.pluginmanager import hookimpl
+from _pytask.prefetch_utils import prefetcher
+from _pytask.tree_util import tree_leaves
+
+if TYPE_CHECKING:
+    from _pytask.node_protocols import PNode
+    from _pytask.node_protocols import PProvisionalNode
+    from _pytask.node_protocols import PTask
+    from _pytask.reports import ExecutionReport
+    from _pytask.session import Session
+
+
+N_UPCOMING_TASKS = 2
+"""int: The number of upcoming tasks whose dependencies are prefetched."""
+
+_EXECUTED_TASKS: set[str] = set()
+"""set[str]: The signatures of tasks which were executed in the session."""
+
+
+@hookimpl
+def pytask_extend_command_line_interface(cli: click.Group) -> None:
+    """Add the option to enable prefetching."""
+    cli.commands["build"].params.append(
+        click.Option(
+            ["--prefetch-size"],
+            type=click.IntRange(min=0),
+            default=0,
+            metavar="MB",
+            help="Load dependencies of upcoming tasks in the background up to the "
+            "given size in MB. Prefetching is disabled with 0.",
+        )
+    )
+
+
+@hookimpl
+def pytask_parse_config(config: dict[str, Any]) -> None:
+    """Parse the size of prefetched values."""
+    config["prefetch_size"] = int(config.get("prefetch_size") or 0)
+
+
+@hookimpl
+def pytask_post_parse(config: dict[str, Any]) -> None:
+    """Start the prefetcher."""
+    _EXECUTED_TASKS.clear()
+    prefetcher.configure(max_size=config["prefetch_size"] * 1024**2)
+
+
+def _is_likely_executed(session: Session, task: PTask) -> bool:
+    """Check whether a task is likely executed.
+
+    Dependencies of tasks which are skipped because they are unchanged are not
+    prefetched. A task is likely executed if the task itself changed or if a preceding
+    task was executed in this session.
+
+    """
+    from _pytask.database_utils import has_node_changed
+
+    if session.config["force"] or has_node_changed(
+        task=task, node=task, state=task.state()
+    ):
+        return True
+    return any(
+        predecessor in _EXECUTED_TASKS
+        for node_signature in session.dag.predecessors(task.signature)
+        for predecessor in session.dag.predecessors(node_signature)
+    )
+
+
+@hookimpl(wrapper=True)
+def pytask_execute_task(session: Session) -> Generator[None, None, Any]:
+    """Prefetch the dependencies of upcoming tasks while a task is executed."""
+    if (
+        prefetcher.max_size
+        and not session.config["dry_run"]
+        and isinstance(session.scheduler, TopologicalSorter)
+    ):
+        for signature in reversed(session.scheduler.peek_ready(N_UPCOMING_TASKS)):
+            upcoming_task = session.dag.nodes[signature]["task"]
+            if _is_likely_executed(session, upcoming_task):
+                prefetcher.submit(
+                    upcoming_task.signature,
+                    [
+                        node
+                        for node in tree_leaves(upcoming_task.depends_on)
+                        if node.signature not in fused_values.nodes
+                    ],
+                )
+    return (yield)
+
+
+@hookimpl
+def pytask_execute_task_process_report(report: ExecutionReport) -> None:
+    """Drop prefetched values of tasks which were not executed."""
+    if report.outcome == TaskOutcome.SUCCESS:
+        _EXECUTED_TASKS.add(report.task.signature)
+    dependencies: list[PNode | PProvisionalNode] = tree_leaves(
+        report.task.depends_on  # type: ignore[arg-type]
+    )
+    prefetcher.discard(report.task.signature, dependencies)
+
+
+@hookimpl
+def pytask_unconfigure() -> None:
+    """Stop the prefetcher."""
+    _EXECUTED_TASKS.clear()
+    prefetcher.configure()
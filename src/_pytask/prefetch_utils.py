@@ -0,0 +1,264 @@
+"""Contains utilities to prefetch dependencies of upcoming tasks in the background.
+
+Values of dependencies are loaded in threads while other tasks are executed. Nodes
+whose :meth:`~pytask.PNode.load` only returns a path are not loaded, but their files are
+read into the page cache of the operating system.
+
+"""
+
+from __future__ import annotations
+
+import copy
+import os
+from concurrent.futures import Future
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import suppress
+from typing import TYPE_CHECKING
+from typing import Any
+
+from attrs import define
+from attrs import field
+
+from _pytask.node_protocols import PPathNode
+from _pytask.nodes import ArrayNode
+from _pytask.nodes import PathNode
+from _pytask.nodes import PickleNode
+from _pytask.remote_utils import is_remote_path
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from _pytask.node_protocols import PNode
+    from _pytask.node_protocols import PProvisionalNode
+
+
+__all__ = ["Prefetcher", "prefetcher"]
+
+
+_CHUNK_SIZE = 8 * 1024**2
+
+
+def warm_file(path: Path) -> None:
+    """Read a file into the page cache of the operating system."""
+    with path.open("rb") as f:
+        if hasattr(os, "posix_fadvise"):
+            os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_WILLNEED)
+            return
+        while f.read(_CHUNK_SIZE):
+            pass
+
+
+def _is_warmed(node: PPathNode) -> bool:
+    """Check whether the file of a node is warmed instead of loaded."""
+    return isinstance(node, PathNode) or (
+        isinstance(node, ArrayNode) and node.mmap_mode is not None
+    )
+
+
+def _is_compressed_pickle(node: PPathNode) -> bool:
+    """Check whether a node is a compressed pickle.
+
+    The size of the file of a compressed pickle says little about the size of the
+    value, and the value might not report its size after it is loaded.
+
+    """
+    return isinstance(node, PickleNode) and node.compression is not None
+
+
+def _get_loaded_size(value: Any) -> int | None:
+    """Get the size of a loaded value in memory if it can be determined cheaply.
+
+    NumPy arrays and Arrow tables report their size with ``nbytes`` and pandas objects
+    with ``memory_usage``.
+
+    """
+    nbytes = getattr(value, "nbytes", None)
+    if isinstance(nbytes, int):
+        return nbytes
+    memory_usage = getattr(value, "memory_usage", None)
+    if callable(memory_usage):
+        with suppress(TypeError, ValueError):
+            usage = memory_usage(deep=True)
+            return int(usage.sum() if hasattr(usage, "sum") else usage)
+    return None
+
+
+@define
+class _Prefetched:
+    """A value which is prefetched for upcoming tasks.
+
+    Attributes
+    ----------
+    future
+        The future which loads the value.
+    size
+        The size of the value. It is approximated by the size of its file until the
+        value is loaded.
+    consumers
+        The signatures of upcoming tasks which depend on the value.
+    is_measured
+        Whether the size was updated with the size of the loaded value.
+
+    """
+
+    future: Future[Any]
+    size: int
+    consumers: set[str] = field(factory=set)
+    is_measured: bool = False
+
+
+@define
+class Prefetcher:
+    """Load dependencies of upcoming tasks in background threads.
+
+    Values are shared by all upcoming tasks which depend on them and are only dropped
+    when no upcoming task needs them anymore.
+
+    Attributes
+    ----------
+    max_size
+        The maximum size of all prefetched values in bytes. The size of a value is
+        approximated by the size of its file until it is loaded and replaced by the size
+        of the loaded value if it can be determined. Compressed pickles are not
+        prefetched since their size is unknown. The prefetcher is disabled with 0.
+    n_workers
+        The number of threads.
+    size
+        The size of all prefetched values which have not been used.
+    hits
+        The number of values which were prefetched before they were needed.
+
+    """
+
+    max_size: int = 0
+    n_workers: int = 2
+    size: int = 0
+    hits: int = 0
+    _executor: ThreadPoolExecutor | None = None
+    _entries: dict[str, _Prefetched] = field(factory=dict)
+
+    def configure(self, max_size: int = 0, n_workers: int = 2) -> None:
+        """Start the threads or stop them and drop all values with ``max_size=0``."""
+        if self._executor is not None:
+            self.discard_all()
+            self._executor.shutdown(wait=True)
+            self._executor = None
+        self.max_size = max_size
+        self.n_workers = n_workers
+        self.size = 0
+        self.hits = 0
+        if max_size:
+            self._executor = ThreadPoolExecutor(
+                max_workers=n_workers, thread_name_prefix="pytask-prefetch"
+            )
+
+    def submit(self, consumer: str, nodes: list[PNode | PProvisionalNode]) -> None:
+        """Start loading the values of nodes which fit into the remaining size.
+
+        ``consumer`` is the signature of the upcoming task which depends on the nodes.
+
+        """
+        if self._executor is None:
+            return
+
+        self._update_sizes()
+        for node in nodes:
+            if (
+                not isinstance(node, PPathNode)
+                or is_remote_path(node.path)
+                or _is_compressed_pickle(node)
+            ):
+                continue
+            entry = self._entries.get(node.signature)
+            if entry is not None:
+                entry.consumers.add(consumer)
+                continue
+            try:
+                size = node.path.stat().st_size
+            except OSError:
+                continue
+            if _is_warmed(node):
+                size = 0
+            if self.size + size > self.max_size:
+                continue
+
+            if _is_warmed(node):
+                future = self._executor.submit(warm_file, node.path)
+            else:
+                future = self._executor.submit(node.load)
+            self._entries[node.signature] = _Prefetched(
+                future=future, size=size, consumers={consumer}
+            )
+            self.size += size
+
+    def _update_sizes(self) -> None:
+        """Replace the estimated sizes of loaded values with their actual sizes."""
+        for entry in self._entries.values():
+            if entry.is_measured or not entry.future.done():
+                continue
+            entry.is_measured = True
+            if entry.future.cancelled() or entry.future.exception() is not None:
+                continue
+            size = _get_loaded_size(entry.future.result())
+            if size is not None:
+                self.size += size - entry.size
+                entry.size = size
+
+    def pop_many(
+        self, consumer: str, nodes: list[PNode | PProvisionalNode]
+    ) -> dict[int, Any]:
+        """Take the prefetched values of nodes and wait until they are loaded.
+
+        Values which other upcoming tasks depend on are kept, and the consumer receives
+        a copy so that it cannot modify the values of the other tasks. Values which
+        could not be loaded are left out so that the errors are raised when the nodes
+        are loaded again.
+
+        """
+        if not self._entries:
+            return {}
+
+        values = {}
+        for node in nodes:
+            entry = self._entries.get(node.signature)
+            if entry is None:
+                continue
+            is_shared = not self._release(consumer, node.signature)
+            with suppress(Exception):
+                value = entry.future.result()
+                if not _is_warmed(node):  # type: ignore[arg-type]
+                    values[id(node)] = copy.deepcopy(value) if is_shared else value
+                self.hits += 1
+        return values
+
+    def discard(self, consumer: str, nodes: list[PNode | PProvisionalNode]) -> None:
+        """Drop the values of nodes unless other upcoming tasks depend on them."""
+        for node in nodes:
+            entry = self._entries.get(node.signature)
+            if entry is not None and self._release(consumer, node.signature):
+                entry.future.cancel()
+
+    def _release(self, consumer: str, signature: str) -> bool:
+        """Remove a consumer of a value and drop the value if it has no consumers.
+
+        Returns whether the value was dropped.
+
+        """
+        entry = self._entries[signature]
+        entry.consumers.discard(consumer)
+        if entry.consumers:
+            return False
+        del self._entries[signature]
+        self.size -= entry.size
+        return True
+
+    def discard_all(self) -> None:
+        """Drop all values."""
+        for entry in self._entries.values():
+            entry.future.cancel()
+        self._entries.clear()
+        self.size = 0
+
+
+prefetcher = Prefetcher()
+"""Prefetcher: The prefetcher which loads dependencies of upcoming tasks."""
@@ -14,16 +14,12 @@ from typing import Generator
 
 import click
 from rich.table import Table
-from sqlalchemy.orm import Mapped
-from sqlalchemy.orm import mapped_column
 
 from _pytask.click import ColoredCommand
 from _pytask.click import EnumChoice
 from _pytask.console import console
 from _pytask.console import format_task_name
 from _pytask.dag import create_dag
-from _pytask.database_utils import BaseTable
-from _pytask.database_utils import DatabaseSession
 from _pytask.exceptions import CollectionError
 from _pytask.exceptions import ConfigurationError
 from _pytask.node_protocols import PPathNode
@@ -48,16 +44,6 @@ class _ExportFormats(enum.Enum):
     CSV = "csv"
 
 
-class Runtime(BaseTable):
-    """Record of runtimes of tasks."""
-
-    __tablename__ = "runtime"
-
-    task: Mapped[str] = mapped_column(primary_key=True)
-    date: Mapped[float]
-    duration: Mapped[float]
-
-
 @hookimpl(tryfirst=True)
 def pytask_extend_command_line_interface(cli: click.Group) -> None:
     """Extend the command line interface."""
@@ -93,6 +79,9 @@ def pytask_execute_task_process_report(report: ExecutionReport) -> None:
 
 def _create_or_update_runtime(task_signature: str, start: float, end: float) -> None:
     """Create or update a runtime entry."""
+    from _pytask.database_utils import DatabaseSession
+    from _pytask.database_utils import Runtime
+
     with DatabaseSession() as session:
         runtime = session.get(Runtime, task_signature)
 
@@ -199,6 +188,9 @@ class DurationNameSpace:
 
 def _collect_runtimes(tasks: list[PTask]) -> dict[str, float]:
     """Collect runtimes."""
+    from _pytask.database_utils import DatabaseSession
+    from _pytask.database_utils import Runtime
+
     with DatabaseSession() as session:
         runtimes = [session.get(Runtime, task.signature) for task in tasks]
     return {task.name: r.duration for task, r in zip(tasks, runtimes) if r}
@@ -0,0 +1,110 @@
+"""Contains hooks for the local cache of remote files."""
+
+from __future__ import annotations
+
+import json
+from typing import TYPE_CHECKING
+from typing import Any
+from typing import Generator
+
+import click
+
+from _pytask.outcomes import TaskOutcome
+from _pytask.pluginmanager import hookimpl
+from _pytask.remote_utils import remote_file_cache
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from _pytask.node_protocols import PTask
+    from _pytask.session import Session
+
+
+STATISTICS_NAME = "remote_cache.json"
+"""str: The name of the file in the ``.pytask`` folder which stores the statistics."""
+
+
+@hookimpl
+def pytask_extend_command_line_interface(cli: click.Group) -> None:
+    """Add the option to enable the cache."""
+    cli.commands["build"].params.append(
+        click.Option(
+            ["--remote-cache-size"],
+            type=click.IntRange(min=0),
+            default=0,
+            metavar="MB",
+            help="Cache remote dependencies locally in a cache of the given size in "
+            "MB. The cache is disabled with 0.",
+        )
+    )
+
+
+@hookimpl
+def pytask_parse_config(config: dict[str, Any]) -> None:
+    """Parse the size of the cache."""
+    config["remote_cache_size"] = int(config.get("remote_cache_size") or 0)
+
+
+@hookimpl
+def pytask_post_parse(config: dict[str, Any]) -> None:
+    """Enable the cache."""
+    if config["remote_cache_size"]:
+        remote_file_cache.configure(
+            directory=config["root"] / ".pytask" / "remote_cache",
+            max_size=config["remote_cache_size"] * 1024**2,
+        )
+    else:
+        remote_file_cache.configure(directory=None)
+
+
+@hookimpl(wrapper=True)
+def pytask_execute_task(task: PTask) -> Generator[None, None, None]:
+    """Attach the hits and misses of the cache while loading values to the task."""
+    hits, misses = remote_file_cache.hits, remote_file_cache.misses
+    try:
+        return (yield)
+    finally:
+        task.attributes["remote_cache"] = {
+            "hits": remote_file_cache.hits - hits,
+            "misses": remote_file_cache.misses - misses,
+        }
+
+
+@hookimpl
+def pytask_unconfigure(session: Session) -> None:
+    """Store the statistics and disable the cache."""
+    remote_file_cache.configure(directory=None)
+
+    new = {
+        report.task.signature: statistics
+        for report in session.execution_reports
+        if report.outcome == TaskOutcome.SUCCESS
+        and (statistics := report.task.attributes.get("remote_cache"))
+        and statistics["hits"] + statistics["misses"]
+    }
+    if new:
+        path = session.config["root"] / ".pytask" / STATISTICS_NAME
+        statistics = {**_read_statistics(session.config["root"]), **new}
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(statistics))
+
+
+@hookimpl
+def pytask_profile_add_info_on_task(
+    session: Session, tasks: list[PTask], profile: dict[str, dict[str, Any]]
+) -> None:
+    """Add the hits and misses of the cache of the last execution to the profile."""
+    statistics = _read_statistics(session.config["root"])
+    for task in tasks:
+        entry = statistics.get(task.signature)
+        if entry:
+            profile[task.name]["Remote Cache (Hits/Misses)"] = (
+                f"{entry['hits']}/{entry['misses']}"
+            )
+
+
+def _read_statistics(root: Path) -> dict[str, dict[str, Any]]:
+    try:
+        return json.loads((root / ".pytask" / STATISTICS_NAME).read_text())
+    except (OSError, ValueError):
+        return {}
@@ -0,0 +1,244 @@
+"""Contains utilities for remote paths backed by :mod:`fsspec`.
+
+Requesting the metadata of remote files one after another is slow since every request
+waits for a round trip to the server. The functions in this module request the metadata
+of many files concurrently and use directory listings when many files in the same
+directory are requested.
+
+Remote files which are dependencies of tasks are downloaded whenever a task reads them.
+With the cache enabled via ``--remote-cache-size``, a remote dependency is downloaded
+once into ``.pytask/remote_cache`` and tasks receive the path to the local copy. The
+copies are keyed by the remote path and the ETag which is also used as the state of
+remote files. Thus, a changed remote file is downloaded again. When the cache grows
+larger than its size, the least recently used copies are removed.
+
+The ETags are recorded when pytask computes the states of remote files before a task
+is executed. Loading a cached dependency afterwards does not require another request.
+
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import os
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import suppress
+from pathlib import Path
+from typing import TYPE_CHECKING
+from typing import Any
+from typing import Sequence
+
+from attrs import define
+from attrs import field
+
+if TYPE_CHECKING:
+    from fsspec import AbstractFileSystem
+
+
+__all__ = ["RemoteFileCache", "get_infos", "is_remote_path", "remote_file_cache"]
+
+
+MAX_CONCURRENT_REQUESTS = 32
+"""int: The maximum number of concurrent requests to a file system."""
+
+MIN_FILES_FOR_LISTING = 16
+"""int: The number of requested files in a directory from which on it is listed."""
+
+
+def is_remote_path(path: Path) -> bool:
+    """Check whether a path is a remote path backed by :mod:`fsspec`."""
+    return getattr(path, "protocol", "") not in ("", "file", "local") and hasattr(
+        path, "fs"
+    )
+
+
+def get_infos(
+    fs: AbstractFileSystem, paths: Sequence[str]
+) -> list[dict[str, Any] | None]:
+    """Get the information about many files on the same file system.
+
+    The information is the same as returned by ``fs.info``. Missing files return
+    ``None``.
+
+    Directories with at least :data:`MIN_FILES_FOR_LISTING` requested files are listed
+    with a single request. The information about all other files is requested
+    concurrently, with coroutines for asynchronous file systems and threads otherwise.
+
+    """
+    infos: dict[str, dict[str, Any] | None] = {}
+
+    by_parent: dict[str, list[str]] = {}
+    for path in paths:
+        by_parent.setdefault(fs._parent(path), []).append(path)
+    for parent, children in by_parent.items():
+        if len(children) >= MIN_FILES_FOR_LISTING:
+            infos.update(_list_directory(fs, parent, children))
+
+    remaining = [path for path in dict.fromkeys(paths) if path not in infos]
+    if remaining:
+        if getattr(fs, "async_impl", False):
+            from fsspec.asyn import sync
+
+            results = sync(fs.loop, _get_infos_async, fs, remaining)
+        else:
+            with ThreadPoolExecutor(
+                max_workers=min(MAX_CONCURRENT_REQUESTS, len(remaining))
+            ) as executor:
+                results = list(
+                    executor.map(lambda path: _get_info(fs, path), remaining)
+                )
+        infos.update(zip(remaining, results))
+
+    return [infos[path] for path in paths]
+
+
+def _list_directory(
+    fs: AbstractFileSystem, parent: str, children: list[str]
+) -> dict[str, dict[str, Any]]:
+    """List a directory and return the information about the requested files.
+
+    Files which are not part of the listing are left out and requested separately
+    later.
+
+    """
+    try:
+        listing = fs.ls(parent, detail=True)
+    except FileNotFoundError:
+        return {}
+    by_name = {fs._strip_protocol(info["name"]).rstrip("/"): info for info in listing}
+    return {
+        child: by_name[stripped]
+        for child in children
+        if (stripped := fs._strip_protocol(child).rstrip("/")) in by_name
+    }
+
+
+def _get_info(fs: AbstractFileSystem, path: str) -> dict[str, Any] | None:
+    try:
+        return fs.info(path)
+    except FileNotFoundError:
+        return None
+
+
+async def _get_infos_async(
+    fs: AbstractFileSystem, paths: list[str]
+) -> list[dict[str, Any] | None]:
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
+
+    async def _get_info_async(path: str) -> dict[str, Any] | None:
+        async with semaphore:
+            try:
+                return await fs._info(path)
+            except FileNotFoundError:
+                return None
+
+    return await asyncio.gather(*(_get_info_async(path) for path in paths))
+
+
+@define
+class RemoteFileCache:
+    """A size-bounded cache of local copies of remote files.
+
+    Attributes
+    ----------
+    directory
+        The directory storing the copies. The cache is disabled if it is ``None``.
+    max_size
+        The maximum size of all copies in bytes.
+    hits
+        The number of remote files which were found in the cache.
+    misses
+        The number of remote files which were downloaded.
+    etags
+        The ETags of remote files recorded when their states were computed.
+
+    """
+
+    directory: Path | None = None
+    max_size: int = 0
+    hits: int = 0
+    misses: int = 0
+    etags: dict[str, str] = field(factory=dict)
+
+    def configure(self, directory: Path | None, max_size: int = 0) -> None:
+        """Enable the cache with a directory or disable it with ``None``."""
+        self.directory = directory
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self.etags.clear()
+
+    def record(self, path: Path, etag: str) -> None:
+        """Record the ETag of a remote file whose state was computed."""
+        if self.directory is not None:
+            self.etags[str(path)] = etag
+
+    def get(self, path: Path) -> Path:
+        """Get the path to a local copy of a remote file.
+
+        Local paths, remote files without an ETag, and all paths while the cache is
+        disabled are returned unchanged. The ETag is only requested if it was not
+        recorded while computing the state of the file.
+
+        """
+        if self.directory is None or not is_remote_path(path):
+            return path
+
+        etag = self.etags.get(str(path))
+        if etag is None:
+            try:
+                info = path.fs.info(path.path)  # type: ignore[attr-defined]
+            except FileNotFoundError:
+                return path
+            etag = info.get("ETag")
+        if not etag or etag == "0":
+            return path
+
+        key = hashlib.sha256(f"{path}\0{etag}".encode()).hexdigest()
+        local_path = self.directory / f"{key}{path.suffix}"
+
+        if local_path.exists():
+            self.hits += 1
+            # Mark the copy as recently used.
+            with suppress(OSError):
+                os.utime(local_path)
+            return local_path
+
+        self.misses += 1
+        self.directory.mkdir(parents=True, exist_ok=True)
+        temporary_path = self.directory / f".{uuid.uuid4().hex}.tmp"
+        try:
+            path.fs.get_file(path.path, str(temporary_path))  # type: ignore[attr-defined]
+            temporary_path.replace(local_path)
+        finally:
+            temporary_path.unlink(missing_ok=True)
+
+        self._evict(keep=local_path)
+        return local_path
+
+    def _evict(self, keep: Path) -> None:
+        """Remove the least recently used copies until the cache fits into its size."""
+        assert self.directory is not None
+        entries = []
+        for entry in os.scandir(self.directory):
+            if entry.name.startswith(".") or not entry.is_file():
+                continue
+            with suppress(FileNotFoundError):
+                stat = entry.stat()
+                entries.append((stat.st_mtime, stat.st_size, Path(entry.path)))
+
+        size = sum(entry[1] for entry in entries)
+        for _, file_size, local_path in sorted(entries):
+            if size <= self.max_size:
+                break
+            if local_path == keep:
+                continue
+            with suppress(FileNotFoundError):
+                local_path.unlink()
+            size -= file_size
+
+
+remote_file_cache = RemoteFileCache()
+"""RemoteFileCache: The cache used by nodes to load remote files."""
@@ -121,3 +121,16 @@ class ExecutionReport:
             ):
                 yield Rule(f"Captured {key} during {when}", style="default")
                 yield content
+
+
+@define
+class PendingReport:
+    """A report for a task which was executed but is not finished yet.
+
+    A task is pending while its coroutine runs, a worker executes it, or its products
+    are written in the background. The hook ``pytask_execute_task_protocol`` is called
+    again for the task when it can be finished.
+
+    """
+
+    task: PTask
@@ -0,0 +1,55 @@
+"""Contains hooks to schedule tasks by their resources."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+from typing import Any
+from typing import Generator
+
+import click
+
+from _pytask.dag_utils import TopologicalSorter
+from _pytask.pluginmanager import hookimpl
+from _pytask.resources_utils import get_default_capacities
+from _pytask.resources_utils import parse_resources
+
+if TYPE_CHECKING:
+    from _pytask.session import Session
+
+
+@hookimpl
+def pytask_extend_command_line_interface(cli: click.Group) -> None:
+    """Add the option to set the capacities of resources."""
+    cli.commands["build"].params.append(
+        click.Option(
+            ["--resources"],
+            type=str,
+            default=None,
+            metavar="NAME=AMOUNT,...",
+            help="Capacities of resources for tasks marked with "
+            "@pytask.mark.resources, for example, 'cpus=8,memory=64GB,db=4'. CPUs "
+            "and memory default to the machine's, other resources are unlimited.",
+        )
+    )
+
+
+@hookimpl
+def pytask_parse_config(config: dict[str, Any]) -> None:
+    """Parse the capacities and add the marker to the configuration."""
+    config["resources"] = {
+        **get_default_capacities(),
+        **parse_resources(config.get("resources") or {}),
+    }
+    config["markers"]["resources"] = (
+        "Declare the resources like CPUs, memory, or custom resources a task needs. "
+        "Tasks are only started if their resources are available. For example, "
+        "@pytask.mark.resources(cpus=4, memory='40GB')."
+    )
+
+
+@hookimpl(wrapper=True)
+def pytask_execute_build(session: Session) -> Generator[None, None, Any]:
+    """Set the capacities of the scheduler before the tasks are executed."""
+    if isinstance(session.scheduler, TopologicalSorter):
+        session.scheduler.capacities = session.config["resources"]
+    return (yield)
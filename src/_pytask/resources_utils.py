@@ -0,0 +1,102 @@
+"""Contains utilities for resources of tasks.
+
+Tasks declare the resources they need with ``@pytask.mark.resources``, for example,
+``@pytask.mark.resources(cpus=4, memory="40GB", db_connections=1)``. The scheduler only
+starts tasks whose resources fit into the remaining capacities.
+
+"""
+
+from __future__ import annotations
+
+import os
+import re
+from contextlib import suppress
+from typing import TYPE_CHECKING
+from typing import Any
+from typing import Mapping
+
+from _pytask.mark_utils import get_marks
+
+if TYPE_CHECKING:
+    from _pytask.node_protocols import PTask
+
+
+__all__ = [
+    "get_default_capacities",
+    "get_resources_of_task",
+    "parse_resources",
+]
+
+
+_MEMORY_UNITS = {"": 1, "K": 1024, "M": 1024**2, "G": 1024**3, "T": 1024**4}
+_MEMORY_PATTERN = re.compile(
+    r"^\s*(\d+(?:\.\d+)?)\s*([KMGT]?)(?:i?B)?\s*$", re.IGNORECASE
+)
+
+
+def parse_memory(value: float | str) -> float:
+    """Parse an amount of memory in bytes.
+
+    Numbers are interpreted as MB. Strings may have units like ``"512MB"`` or
+    ``"40GB"``.
+
+    """
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        return float(value) * 1024**2
+    match = _MEMORY_PATTERN.match(str(value))
+    if match is None:
+        msg = f"Cannot parse the amount of memory {value!r}. Use, for example, '40GB'."
+        raise ValueError(msg)
+    number, unit = match.groups()
+    return float(number) * _MEMORY_UNITS[unit.upper()]
+
+
+def parse_resources(resources: Mapping[str, Any] | str) -> dict[str, float]:
+    """Parse resources from a mapping or a string like ``"cpus=8,memory=64GB"``."""
+    if isinstance(resources, str):
+        pairs = [pair.split("=", 1) for pair in resources.split(",") if pair.strip()]
+        if any(len(pair) != 2 for pair in pairs):  # noqa: PLR2004
+            msg = (
+                f"Cannot parse the resources {resources!r}. Use, for example, "
+                "'cpus=8,memory=64GB'."
+            )
+            raise ValueError(msg)
+        resources = {name.strip(): value.strip() for name, value in pairs}
+
+    parsed = {}
+    for name, value in resources.items():
+        if name == "memory":
+            parsed[name] = parse_memory(value)
+            continue
+        try:
+            parsed[name] = float(value)
+        except (TypeError, ValueError):
+            msg = (
+                f"The amount of the resource {name!r} must be a number, not {value!r}."
+            )
+            raise ValueError(msg) from None
+    return parsed
+
+
+def get_resources_of_task(task: PTask) -> dict[str, float]:
+    """Get the resources of a task from its markers."""
+    resources: dict[str, Any] = {}
+    for mark in get_marks(task, "resources"):
+        if mark.args:
+            msg = (
+                f"The resources of task {task.name!r} must be passed as keyword "
+                "arguments like '@pytask.mark.resources(cpus=2, memory=\"4GB\")'."
+            )
+            raise ValueError(msg)
+        resources.update(mark.kwargs)
+    return parse_resources(resources)
+
+
+def get_default_capacities() -> dict[str, float]:
+    """Get the number of CPUs and the physical memory of the machine."""
+    capacities = {"cpus": float(os.cpu_count() or 1)}
+    with suppress(AttributeError, OSError, ValueError):
+        capacities["memory"] = float(
+            os.sysconf("SC_PAGE_SIZE") * os.sysconf("SC_PHYS_PAGES")
+        )
+    return capacities
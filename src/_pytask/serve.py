@@ -0,0 +1,299 @@
+"""Contains the implementation of ``pytask serve``."""
+
+from __future__ import annotations
+
+import json
+import os
+import socket
+import sys
+from contextlib import suppress
+from pathlib import Path
+from typing import TYPE_CHECKING
+from typing import Any
+
+import click
+from attrs import define
+from attrs import field
+
+from _pytask.client import get_socket_path
+from _pytask.console import console
+from _pytask.exceptions import ConfigurationError
+from _pytask.node_protocols import PTaskWithPath
+from _pytask.outcomes import ExitCode
+from _pytask.pluginmanager import hookimpl
+from _pytask.pluginmanager import storage
+from _pytask.session import Session
+from _pytask.traceback import Traceback
+from _pytask.watch import CommandWithBuildOptions
+from _pytask.watch import WatchedProject
+from _pytask.watch import build_incrementally
+from _pytask.watch import classify_changes
+from _pytask.watch import find_source_paths
+from _pytask.watch import find_watched_directories
+from _pytask.watch_utils import create_watcher
+
+if TYPE_CHECKING:
+    from typing import NoReturn
+
+    from _pytask.watch_utils import Watcher
+
+
+@hookimpl(tryfirst=True)
+def pytask_extend_command_line_interface(cli: click.Group) -> None:
+    """Extend the command line interface."""
+    cli.add_command(serve_command)
+
+
+@click.command(cls=CommandWithBuildOptions, name="serve")
+@click.option(
+    "--polling",
+    is_flag=True,
+    default=False,
+    help="Poll the file system for changes instead of using inotify.",
+)
+@click.option(
+    "--socket",
+    "socket_path",
+    type=click.Path(dir_okay=False, path_type=Path),
+    default=None,
+    help="Path to the socket. [default: .pytask/pytask.sock in the project's root or "
+    "a file in the temporary directory if this path is too long]",
+)
+def serve_command(**raw_config: Any) -> NoReturn:
+    """Start a daemon which answers build requests of clients.
+
+    The daemon keeps the collected tasks and the DAG in memory. Clients send
+    requests over a UNIX domain socket, for example, with
+    ``python -m pytask.client build``. If nothing has changed since the last
+    request, the daemon responds in milliseconds.
+
+    """
+    pm = storage.get()
+    raw_config["command"] = "serve"
+
+    if not hasattr(socket, "AF_UNIX"):  # pragma: no cover
+        msg = "'pytask serve' requires UNIX domain sockets."
+        raise click.UsageError(msg)
+
+    try:
+        config = pm.hook.pytask_configure(pm=pm, raw_config=raw_config)
+        session = Session.from_config(config)
+
+    except (ConfigurationError, Exception):
+        console.print(Traceback(sys.exc_info()))
+        session = Session(exit_code=ExitCode.CONFIGURATION_FAILED)
+
+    else:
+        socket_path = config["socket_path"] or get_socket_path(config["root"])
+        watcher = create_watcher(polling=config["polling"], delay=0)
+        daemon = Daemon(config=config, watcher=watcher)
+        try:
+            daemon.serve(socket_path)
+        except OSError:
+            console.print(Traceback(sys.exc_info()))
+            daemon.session.exit_code = ExitCode.FAILED
+        finally:
+            watcher.close()
+        session = daemon.session
+        session.hook.pytask_unconfigure(session=session)
+
+    sys.exit(session.exit_code)
+
+
+@define(kw_only=True)
+class Daemon:
+    """A daemon which keeps a project in memory and answers requests.
+
+    Changes to files are recorded by a watcher and are only processed when a client
+    requests a build, the tasks, or the DAG.
+
+    Parameters
+    ----------
+    config
+        The configuration of the project.
+    watcher
+        The watcher which records changed files.
+    project
+        The tasks and the DAG kept in memory.
+    session
+        The session of the last build.
+    modules
+        Changed task modules which have not been executed yet.
+    paths
+        Changed dependencies which have not been executed yet.
+
+    """
+
+    config: dict[str, Any]
+    watcher: Watcher
+    project: WatchedProject = field(factory=WatchedProject)
+    session: Session = field(factory=Session)
+    modules: set[Path] = field(factory=set)
+    paths: set[Path] = field(factory=set)
+    _sources: set[Path] = field(factory=set)
+
+    def serve(self, socket_path: Path) -> None:
+        """Build the project and answer requests until a shutdown is requested."""
+        self.session = build_incrementally(
+            self.config, self.project, modules=None, paths=set()
+        )
+        self._watch()
+
+        # Bind to a temporary path and move the socket into place when it accepts
+        # connections so that clients never find a socket which refuses them.
+        temporary_path = socket_path.with_name(f"{socket_path.name}.{os.getpid()}")
+        temporary_path.unlink(missing_ok=True)
+        server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        try:
+            server.bind(str(temporary_path))
+            server.listen()
+            temporary_path.replace(socket_path)
+            console.print()
+            console.rule(f"Listening on {socket_path}", style="neutral")
+
+            should_stop = False
+            while not should_stop:
+                connection, _ = server.accept()
+                with connection, connection.makefile("rwb") as file:
+                    line = file.readline()
+                    # Clients check whether the daemon is running by connecting.
+                    if not line:
+                        continue
+                    try:
+                        command = json.loads(line)["command"]
+                    except (KeyError, TypeError, ValueError):
+                        response = {"error": "Send a JSON object with a 'command'."}
+                    else:
+                        response = self.handle(command)
+                        should_stop = command == "shutdown"
+                    # Clients which disconnected do not receive a response.
+                    with suppress(OSError):
+                        file.write(json.dumps(response).encode() + b"\n")
+                        file.flush()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            server.close()
+            temporary_path.unlink(missing_ok=True)
+            socket_path.unlink(missing_ok=True)
+
+    def handle(self, command: str) -> dict[str, Any]:
+        """Handle a request and return the response."""
+        if command == "build":
+            return self._build()
+        if command == "collect":
+            return self._collect()
+        if command == "dag":
+            return self._dag()
+        if command == "status":
+            return self._status()
+        if command == "shutdown":
+            return {"exit_code": int(self.session.exit_code)}
+        return {"error": f"Unknown command {command!r}."}
+
+    def _build(self) -> dict[str, Any]:
+        """Execute the tasks affected by changes since the last build."""
+        self._record_changes()
+        if self.session.exit_code != ExitCode.OK:
+            # Retry all tasks after a failure. Tasks which succeeded are skipped since
+            # they are unchanged.
+            self.modules |= self.project.modules
+        if not self.modules and not self.paths:
+            return {"exit_code": int(self.session.exit_code), "reports": []}
+
+        self.session = build_incrementally(
+            self.config, self.project, modules=self.modules, paths=self.paths
+        )
+        self.modules, self.paths = set(), set()
+        self._watch()
+        return {
+            "exit_code": int(self.session.exit_code),
+            "reports": [
+                {"task": report.task.name, "outcome": report.outcome.name.lower()}
+                for report in self.session.execution_reports
+            ],
+        }
+
+    def _collect(self) -> dict[str, Any]:
+        """Return the tasks of the project."""
+        self._refresh()
+        return {
+            "exit_code": int(self.session.exit_code),
+            "tasks": [
+                {
+                    "name": task.name,
+                    "path": str(task.path) if isinstance(task, PTaskWithPath) else None,
+                }
+                for task in self.project.tasks
+            ],
+        }
+
+    def _dag(self) -> dict[str, Any]:
+        """Return the nodes and edges of the DAG."""
+        self._refresh()
+        dag = self.project.dag
+        if dag is None:
+            return {"exit_code": int(self.session.exit_code), "nodes": [], "edges": []}
+
+        def _name(signature: str) -> str:
+            data = dag.nodes[signature]
+            return data["task"].name if "task" in data else data["node"].name
+
+        return {
+            "exit_code": int(self.session.exit_code),
+            "nodes": [
+                {"name": _name(signature), "is_task": "task" in data}
+                for signature, data in dag.nodes(data=True)
+            ],
+            "edges": [[_name(source), _name(target)] for source, target in dag.edges],
+        }
+
+    def _status(self) -> dict[str, Any]:
+        """Return information about the daemon."""
+        self._record_changes()
+        return {
+            "exit_code": int(self.session.exit_code),
+            "pid": os.getpid(),
+            "root": str(self.config["root"]),
+            "n_tasks": len(self.project.tasks),
+            "n_pending_changes": len(self.modules) + len(self.paths),
+        }
+
+    def _refresh(self) -> None:
+        """Collect changed modules without executing tasks.
+
+        The changes remain pending so that the next build executes affected tasks.
+
+        """
+        self._record_changes()
+        if self.modules:
+            session = build_incrementally(
+                self.config,
+                self.project,
+                modules=self.modules,
+                paths=self.paths,
+                execute=False,
+            )
+            if session.exit_code != ExitCode.OK:
+                self.session = session
+            self._watch()
+
+    def _record_changes(self) -> None:
+        """Record files which changed since the last request."""
+        changed = self.watcher.wait(timeout=0)
+        # Watch new directories before they are searched for new modules so that no
+        # file created inside them is missed.
+        if any(path.is_dir() for path in changed):
+            self._watch()
+        modules, paths = classify_changes(
+            changed, self.config, self.project, self._sources
+        )
+        self.modules |= modules
+        self.paths |= paths
+
+    def _watch(self) -> None:
+        """Update the watched directories after tasks were collected."""
+        self._sources = find_source_paths(self.project)
+        self.watcher.watch(
+            find_watched_directories(self.config, self.project, self._sources)
+        )
@@ -5,7 +5,6 @@ from __future__ import annotations
 from typing import TYPE_CHECKING
 from typing import Any
 
-import networkx as nx
 from attrs import define
 from attrs import field
 from pluggy import HookRelay
@@ -13,6 +12,8 @@ from pluggy import HookRelay
 from _pytask.outcomes import ExitCode
 
 if TYPE_CHECKING:
+    import networkx as nx
+
     from _pytask.node_protocols import PTask
     from _pytask.reports import CollectionReport
     from _pytask.reports import DagReport
@@ -20,6 +21,13 @@ if TYPE_CHECKING:
     from _pytask.warnings_utils import WarningReport
 
 
+def _create_empty_dag() -> nx.DiGraph:
+    """Create an empty DAG while importing :mod:`networkx` only when needed."""
+    import networkx as nx
+
+    return nx.DiGraph()
+
+
 @define(kw_only=True)
 class Session:
     """The session of pytask.
@@ -36,6 +44,8 @@ class Session:
         Holds all hooks collected by pytask.
     tasks
         List of collected tasks.
+    deselected
+        Signatures of tasks which were deselected with expressions or markers.
     dag_reports
         Reports for resolving dependencies failed.
     execution_reports
@@ -51,9 +61,10 @@ class Session:
 
     config: dict[str, Any] = field(factory=dict)
     collection_reports: list[CollectionReport] = field(factory=list)
-    dag: nx.DiGraph = field(factory=nx.DiGraph)
+    dag: nx.DiGraph = field(factory=_create_empty_dag)
     hook: HookRelay = field(factory=HookRelay)
     tasks: list[PTask] = field(factory=list)
+    deselected: set[str] = field(factory=set)
     dag_report: DagReport | None = None
     execution_reports: list[ExecutionReport] = field(factory=list)
     exit_code: ExitCode = ExitCode.OK
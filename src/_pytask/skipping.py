@@ -56,7 +56,7 @@ def pytask_execute_task_setup(session: Session, task: PTask) -> None:
         collect_provisional_products(session, task)
         raise SkippedUnchanged
 
-    is_skipped = has_mark(task, "skip")
+    is_skipped = task.signature in session.deselected or has_mark(task, "skip")
     if is_skipped:
         raise Skipped
 
@@ -96,6 +96,10 @@ def pytask_execute_task_process_report(
         if isinstance(report.exc_info[1], Skipped):
             report.outcome = TaskOutcome.SKIP
 
+            # All tasks depending on a deselected task are deselected as well.
+            if task.signature in session.deselected:
+                return True
+
             for descending_task_name in descending_tasks(task.signature, session.dag):
                 descending_task = session.dag.nodes[descending_task_name]["task"]
                 descending_task.markers.append(
@@ -0,0 +1,134 @@
+"""Contains hooks to release and spill values of :class:`~pytask.PythonNode`."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+from typing import Any
+from typing import Generator
+
+import click
+
+from _pytask.nodes import PythonNode
+from _pytask.outcomes import TaskOutcome
+from _pytask.pluginmanager import hookimpl
+from _pytask.spill_utils import spill_store
+from _pytask.tree_util import tree_leaves
+
+if TYPE_CHECKING:
+    from _pytask.node_protocols import PTask
+    from _pytask.reports import ExecutionReport
+    from _pytask.session import Session
+
+
+SPILL_DIRECTORY = "spill"
+"""str: The name of the folder in ``.pytask`` which stores spilled values."""
+
+_FINISHED_TASKS: set[str] = set()
+"""set[str]: The signatures of tasks which have been executed in the session."""
+
+_PRODUCED_NODES: dict[int, PythonNode] = {}
+"""dict[int, PythonNode]: The nodes whose values were saved in the session."""
+
+_CONSUMERS: dict[int, set[str]] = {}
+"""dict[int, set[str]]: The signatures of tasks depending on a node."""
+
+
+def _get_python_nodes(tree: Any) -> list[PythonNode]:
+    """Get the nodes which hold the values of dependencies.
+
+    Dependencies which are products of other tasks wrap the node of the product.
+
+    """
+    return [
+        node.value if isinstance(node.value, PythonNode) else node
+        for node in tree_leaves(tree)
+        if isinstance(node, PythonNode)
+    ]
+
+
+@hookimpl
+def pytask_extend_command_line_interface(cli: click.Group) -> None:
+    """Add the option to set the memory budget."""
+    cli.commands["build"].params.append(
+        click.Option(
+            ["--python-node-budget"],
+            type=click.IntRange(min=0),
+            default=0,
+            metavar="MB",
+            help="Spill values of PythonNodes to disk if they need more memory than "
+            "the budget in MB. Values are never spilled with 0.",
+        )
+    )
+
+
+@hookimpl
+def pytask_parse_config(config: dict[str, Any]) -> None:
+    """Parse the memory budget."""
+    config["python_node_budget"] = int(config.get("python_node_budget") or 0)
+
+
+@hookimpl
+def pytask_post_parse(config: dict[str, Any]) -> None:
+    """Configure the store."""
+    _FINISHED_TASKS.clear()
+    _PRODUCED_NODES.clear()
+    _CONSUMERS.clear()
+    spill_store.configure(
+        directory=config["root"] / ".pytask" / SPILL_DIRECTORY,
+        max_size=config["python_node_budget"] * 1024**2,
+    )
+
+
+@hookimpl
+def pytask_collect_modify_tasks(tasks: list[PTask]) -> None:
+    """Collect the tasks depending on nodes.
+
+    The hook is called again when task generators add tasks.
+
+    """
+    _CONSUMERS.clear()
+    for task in tasks:
+        for node in _get_python_nodes(task.depends_on):
+            _CONSUMERS.setdefault(id(node), set()).add(task.signature)
+
+
+@hookimpl(wrapper=True)
+def pytask_execute_task_process_report(
+    session: Session, report: ExecutionReport
+) -> Generator[None, Any, Any]:
+    """Release values of nodes after all tasks depending on them are finished.
+
+    Only values of products which were saved in this session are released. Values of
+    products without dependents are kept. Values are never released by long-running
+    commands like ``pytask watch`` since tasks of the next build may depend on them
+    while the tasks producing them are skipped.
+
+    """
+    result = yield
+    if session.config.get("command") != "build":
+        return result
+
+    task = report.task
+    _FINISHED_TASKS.add(task.signature)
+    if report.outcome == TaskOutcome.SUCCESS:
+        _PRODUCED_NODES.update(
+            (id(node), node) for node in _get_python_nodes(task.produces)
+        )
+
+    for node in _get_python_nodes(task.depends_on):
+        if id(node) in _PRODUCED_NODES and _FINISHED_TASKS.issuperset(
+            _CONSUMERS.get(id(node), ())
+        ):
+            spill_store.release(node)
+            del _PRODUCED_NODES[id(node)]
+
+    return result
+
+
+@hookimpl
+def pytask_unconfigure() -> None:
+    """Disable the store."""
+    _FINISHED_TASKS.clear()
+    _PRODUCED_NODES.clear()
+    _CONSUMERS.clear()
+    spill_store.configure()
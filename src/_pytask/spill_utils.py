@@ -0,0 +1,185 @@
+"""Contains utilities to spill values of :class:`~pytask.PythonNode` to disk.
+
+Values of products are kept in memory until the tasks depending on them are finished.
+If the values need more memory than the budget, the least recently used values are
+pickled to temporary files and loaded again when they are requested.
+
+"""
+
+from __future__ import annotations
+
+import pickle
+import sys
+import tempfile
+import weakref
+from collections import OrderedDict
+from contextlib import suppress
+from pathlib import Path
+from typing import TYPE_CHECKING
+from typing import Any
+
+from attrs import define
+from attrs import field
+
+from _pytask import pickle_utils
+from _pytask.typing import no_default
+
+if TYPE_CHECKING:
+    from _pytask.nodes import PythonNode
+
+
+__all__ = ["SpillStore", "SpilledValue", "estimate_size", "spill_store"]
+
+
+def estimate_size(value: Any) -> int:
+    """Estimate the memory used by a value in bytes.
+
+    Arrays report their size with ``nbytes`` and pandas objects with ``memory_usage``.
+    Containers are traversed. For all other objects, :func:`sys.getsizeof` is used.
+
+    """
+    return _estimate_size(value, set())
+
+
+def _estimate_size(value: Any, seen: set[int]) -> int:
+    if id(value) in seen:
+        return 0
+    seen.add(id(value))
+
+    memory_usage = getattr(value, "memory_usage", None)
+    if callable(memory_usage) and type(value).__module__.startswith("pandas"):
+        usage = memory_usage(deep=True)
+        return int(getattr(usage, "sum", lambda: usage)())
+    nbytes = getattr(value, "nbytes", None)
+    if isinstance(nbytes, int):
+        return nbytes
+
+    size = sys.getsizeof(value)
+    if isinstance(value, dict):
+        size += sum(
+            _estimate_size(k, seen) + _estimate_size(v, seen) for k, v in value.items()
+        )
+    elif isinstance(value, (list, tuple, set, frozenset)):
+        size += sum(_estimate_size(item, seen) for item in value)
+    return size
+
+
+@define(eq=False)
+class SpilledValue:
+    """A value which was spilled to a temporary file.
+
+    The file is removed when the object is garbage collected.
+
+    """
+
+    path: Path
+
+    def __attrs_post_init__(self) -> None:
+        weakref.finalize(self, _remove_file, self.path)
+
+
+def _remove_file(path: Path) -> None:
+    with suppress(OSError):
+        path.unlink()
+
+
+@define
+class SpillStore:
+    """A store which spills values of nodes to disk when they exceed a memory budget.
+
+    Attributes
+    ----------
+    directory
+        The directory for the spilled values.
+    max_size
+        The memory budget for all values in bytes. Values are not spilled with 0.
+    size
+        The estimated memory used by all values in memory.
+    n_spilled
+        The number of values which were spilled.
+    n_restored
+        The number of values which were loaded again after they were spilled.
+
+    """
+
+    directory: Path | None = None
+    max_size: int = 0
+    size: int = 0
+    n_spilled: int = 0
+    n_restored: int = 0
+    _entries: OrderedDict[int, tuple[PythonNode, int]] = field(factory=OrderedDict)
+
+    def configure(self, directory: Path | None = None, max_size: int = 0) -> None:
+        """Enable the store with a directory and a budget or disable it."""
+        self.directory = directory
+        self.max_size = max_size
+        self.size = 0
+        self.n_spilled = 0
+        self.n_restored = 0
+        self._entries.clear()
+
+    def add(self, node: PythonNode) -> None:
+        """Add the value of a node and spill values if the budget is exceeded."""
+        if not self.max_size:
+            return
+        self.discard(node)
+        size = estimate_size(node.value)
+        self._entries[id(node)] = (node, size)
+        self.size += size
+        self._spill(keep=node)
+
+    def touch(self, node: PythonNode) -> None:
+        """Mark the value of a node as recently used."""
+        if id(node) in self._entries:
+            self._entries.move_to_end(id(node))
+
+    def restore(self, node: PythonNode) -> Any:
+        """Load a spilled value into memory again."""
+        spilled = node.value
+        assert isinstance(spilled, SpilledValue)
+        node.value = pickle_utils.load(spilled.path)
+        self.n_restored += 1
+        self.add(node)
+        return node.value
+
+    def release(self, node: PythonNode) -> None:
+        """Release the value of a node which is not needed anymore."""
+        self.discard(node)
+        node.value = no_default
+
+    def discard(self, node: PythonNode) -> None:
+        """Stop tracking the value of a node."""
+        entry = self._entries.pop(id(node), None)
+        if entry is not None:
+            self.size -= entry[1]
+
+    def _spill(self, keep: PythonNode) -> None:
+        """Spill the least recently used values until the budget is met."""
+        assert self.directory is not None
+        for node, _ in list(self._entries.values()):
+            if self.size <= self.max_size:
+                break
+            if node is keep:
+                continue
+            self.discard(node)
+            self.directory.mkdir(parents=True, exist_ok=True)
+            with tempfile.NamedTemporaryFile(
+                dir=self.directory, suffix=".pkl", delete=False
+            ) as f:
+                path = Path(f.name)
+                try:
+                    pickle_utils.dump(node.value, f, out_of_band=True)
+                except (pickle.PicklingError, AttributeError, TypeError):
+                    # Values which cannot be pickled stay in memory.
+                    spilled = None
+                else:
+                    spilled = SpilledValue(path)
+            if spilled is None:
+                _remove_file(path)
+            else:
+                node.value = spilled
+                self.n_spilled += 1
+
+
+spill_store = SpillStore()
+"""SpillStore: The store which spills values of :class:`~pytask.PythonNode` to disk."""
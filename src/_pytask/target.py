@@ -0,0 +1,31 @@
+"""Contains hooks to build only the targets requested with ``--target``."""
+
+from __future__ import annotations
+
+from typing import Any
+
+import click
+
+from _pytask.pluginmanager import hookimpl
+from _pytask.shared import to_list
+
+
+@hookimpl
+def pytask_extend_command_line_interface(cli: click.Group) -> None:
+    """Add the option to select targets."""
+    cli.commands["build"].params.append(
+        click.Option(
+            ["--target"],
+            metavar="PRODUCT_OR_TASK",
+            multiple=True,
+            type=str,
+            help="Build only a product or a task and the tasks it depends on. Products "
+            "are given as paths and tasks as ids like 'task_module.py::task_example'.",
+        )
+    )
+
+
+@hookimpl
+def pytask_parse_config(config: dict[str, Any]) -> None:
+    """Parse the targets."""
+    config["target"] = [str(target) for target in to_list(config.get("target") or [])]
@@ -0,0 +1,318 @@
+"""Contains utilities to build only the targets requested with ``--target``."""
+
+from __future__ import annotations
+
+import itertools
+import json
+import os
+import sys
+from pathlib import Path
+from typing import TYPE_CHECKING
+from typing import Any
+from typing import Iterable
+
+from attrs import define
+from attrs import field
+
+from _pytask.dag_utils import node_and_neighbors
+from _pytask.dag_utils import tasks_and_preceding_tasks
+from _pytask.node_protocols import PNode
+from _pytask.node_protocols import PPathNode
+from _pytask.node_protocols import PProvisionalNode
+from _pytask.node_protocols import PTask
+from _pytask.node_protocols import PTaskWithPath
+from _pytask.outcomes import CollectionOutcome
+from _pytask.path import compile_path_patterns
+from _pytask.tree_util import tree_leaves
+
+if TYPE_CHECKING:
+    import networkx as nx
+
+    from _pytask.session import Session
+
+
+__all__ = [
+    "ProductIndex",
+    "collect_modules_of_targets",
+    "parse_target",
+    "select_subgraph_of_targets",
+]
+
+
+INDEX_NAME = "product_index.json"
+"""str: The name of the file in the ``.pytask`` folder which stores the index."""
+
+
+def parse_target(target: str) -> tuple[Path, str | None]:
+    """Parse a target.
+
+    A target is either a path to a product or a task id like
+    ``task_module.py::task_example``. Returns the path of the product or the module and
+    the name of the task which is ``None`` for products.
+
+    """
+    if "::" in target:
+        module, name = target.split("::", 1)
+        return Path(module).resolve(), name
+    return Path(target).resolve(), None
+
+
+@define
+class ProductIndex:
+    """An index of the products of the tasks in each task module.
+
+    The index is stored in ``.pytask/product_index.json`` and updated whenever modules
+    are collected to build targets. It allows finding the modules needed to build a
+    target without importing every task module. The entry of a module is only used while
+    the modification time of the module is unchanged.
+
+    Products can also be declared in other local modules which are imported by task
+    modules. If one of these sources changes, the whole index is outdated.
+
+    """
+
+    path: Path
+    modules: dict[str, dict[str, Any]] = field(factory=dict)
+    sources: dict[str, int | None] = field(factory=dict)
+
+    @classmethod
+    def from_root(cls, root: Path) -> ProductIndex:
+        """Load the index of a project."""
+        path = root / ".pytask" / INDEX_NAME
+        try:
+            data = json.loads(path.read_text())
+            return cls(path=path, modules=data["modules"], sources=data["sources"])
+        except (OSError, ValueError, KeyError, TypeError):
+            return cls(path=path)
+
+    def save(self) -> None:
+        """Store the index."""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.path.write_text(
+            json.dumps({"modules": self.modules, "sources": self.sources})
+        )
+
+    def is_stale(self, module: Path) -> bool:
+        """Check whether the entry of a module is missing or outdated."""
+        entry = self.modules.get(module.as_posix())
+        return entry is None or entry["mtime_ns"] != _get_mtime_ns(module)
+
+    def is_outdated(self) -> bool:
+        """Check whether a local module imported by task modules has changed."""
+        return any(
+            _get_mtime_ns(Path(source)) != mtime_ns
+            for source, mtime_ns in self.sources.items()
+        )
+
+    def find_module_of_product(self, path: Path) -> Path | None:
+        """Find the module which contains the task producing a path."""
+        posix = path.as_posix()
+        for module, entry in self.modules.items():
+            if posix in entry["paths"]:
+                return Path(module)
+        return None
+
+    def find_producers(self) -> dict[str, Path]:
+        """Map the signatures of products to the modules producing them."""
+        return {
+            signature: Path(module)
+            for module, entry in self.modules.items()
+            for signature in entry["products"]
+        }
+
+    def update(
+        self,
+        modules: Iterable[Path],
+        tasks: Iterable[PTask],
+        sources: dict[str, int | None],
+    ) -> None:
+        """Replace the entries of collected modules and drop deleted modules.
+
+        Modules without tasks receive an empty entry so that they are not collected
+        again while they are unchanged.
+
+        """
+        for module in modules:
+            self.modules[module.as_posix()] = {
+                "mtime_ns": _get_mtime_ns(module),
+                "products": [],
+                "paths": [],
+            }
+
+        for task in tasks:
+            if not isinstance(task, PTaskWithPath):
+                continue
+            entry = self.modules.get(task.path.as_posix())
+            if entry is None:
+                continue
+
+            products: list[PNode | PProvisionalNode] = tree_leaves(
+                task.produces  # type: ignore[arg-type]
+            )
+            entry["products"].extend(
+                node.signature for node in products if isinstance(node.signature, str)
+            )
+            entry["paths"].extend(
+                node.path.as_posix() for node in products if isinstance(node, PPathNode)
+            )
+
+        for name in [name for name in self.modules if not Path(name).exists()]:
+            del self.modules[name]
+
+        self.sources.update(sources)
+
+
+def _get_mtime_ns(path: Path) -> int | None:
+    try:
+        return path.stat().st_mtime_ns
+    except OSError:
+        return None
+
+
+def _find_imported_sources(root: Path, modules: set[Path]) -> dict[str, int | None]:
+    """Find local modules other than task modules which were imported.
+
+    Installed packages are ignored even if the environment is inside the project.
+
+    """
+    prefix = f"{root}{os.sep}"
+    sources = {}
+    for module in list(sys.modules.values()):
+        file = getattr(module, "__file__", None)
+        if not isinstance(file, str) or not file.startswith(prefix):
+            continue
+        path = Path(file)
+        if path not in modules and "site-packages" not in path.parts:
+            sources[path.as_posix()] = _get_mtime_ns(path)
+    return sources
+
+
+def collect_modules_of_targets(session: Session, paths: Iterable[Path]) -> None:
+    """Collect only the task modules which are needed to build the targets.
+
+    The modules containing the targets are looked up in the index. Afterwards, the
+    modules producing the dependencies of the collected tasks are collected until all
+    preceding tasks are found. New and modified modules are always collected since their
+    entries in the index are outdated. If a target cannot be found in the index, a
+    task depends on other tasks in ways which are not recorded, or a local module
+    imported by task modules has changed, all modules are collected.
+
+    Finally, the index is updated with the collected modules.
+
+    """
+    is_task_module = compile_path_patterns(tuple(session.config["task_files"]))
+    modules = {path for path in paths if is_task_module(path)}
+    index = ProductIndex.from_root(session.config["root"])
+
+    if index.is_outdated():
+        index.sources.clear()
+        pending = modules
+    else:
+        pending = {module for module in modules if index.is_stale(module)}
+        for target in session.config["target"]:
+            path, name = parse_target(target)
+            module = path if name is not None else index.find_module_of_product(path)
+            if module not in modules:
+                pending = modules
+                break
+            pending.add(module)
+
+    producers = index.find_producers()
+    collected: set[Path] = set()
+    failed: set[Path] = set()
+    tasks: list[PTask] = []
+    while pending:
+        new_tasks: list[PTask] = []
+        for module in sorted(pending):
+            reports = session.hook.pytask_collect_file_protocol(
+                session=session, path=module, reports=session.collection_reports
+            )
+            if reports:
+                session.collection_reports.extend(reports)
+                new_tasks.extend(
+                    report.node
+                    for report in reports
+                    if report.outcome == CollectionOutcome.SUCCESS
+                    and isinstance(report.node, PTask)
+                )
+                if any(report.outcome == CollectionOutcome.FAIL for report in reports):
+                    failed.add(module)
+        tasks.extend(new_tasks)
+        collected |= pending
+        pending = (
+            _find_modules_of_dependencies(new_tasks, producers, modules) - collected
+        )
+
+    # Modules which failed are not recorded and collected again in the next run.
+    index.update(
+        collected - failed,
+        tasks,
+        _find_imported_sources(session.config["root"], modules),
+    )
+    index.save()
+
+
+def _find_modules_of_dependencies(
+    tasks: list[PTask], producers: dict[str, Path], modules: set[Path]
+) -> set[Path]:
+    """Find the modules producing the dependencies of tasks."""
+    needed = set()
+    for task in tasks:
+        dependencies: list[PNode | PProvisionalNode] = tree_leaves(
+            task.depends_on  # type: ignore[arg-type]
+        )
+
+        # Tasks depending on other tasks via ``after`` or on provisional nodes can
+        # depend on tasks in any module.
+        if task.attributes.get("after") or any(
+            isinstance(node, PProvisionalNode) for node in dependencies
+        ):
+            return modules
+
+        for node in dependencies:
+            module = producers.get(node.signature)
+            if module in modules:
+                needed.add(module)
+    return needed
+
+
+def select_subgraph_of_targets(session: Session, dag: nx.DiGraph) -> nx.DiGraph:
+    """Reduce the DAG and the tasks to the targets and their preceding tasks.
+
+    Raises
+    ------
+    ValueError
+        If a target is neither a product of a task nor a task.
+
+    """
+    seeds: set[str] = set()
+    for target in session.config["target"]:
+        path, name = parse_target(target)
+        if name is None:
+            signatures = {
+                predecessor
+                for signature, data in dag.nodes(data=True)
+                if isinstance(data.get("node"), PPathNode) and data["node"].path == path
+                for predecessor in dag.predecessors(signature)
+            }
+        else:
+            signatures = {
+                task.signature
+                for task in session.tasks
+                if isinstance(task, PTaskWithPath)
+                and task.path == path
+                and getattr(task, "base_name", task.name) == name
+            }
+        if not signatures:
+            msg = f"The target {target!r} is neither a product of a task nor a task."
+            raise ValueError(msg)
+        seeds |= signatures
+
+    selected = tasks_and_preceding_tasks(seeds, dag)
+    session.tasks = [task for task in session.tasks if task.signature in selected]
+    nodes = set(
+        itertools.chain.from_iterable(
+            node_and_neighbors(dag, signature) for signature in selected
+        )
+    )
+    return dag.subgraph(nodes).copy()
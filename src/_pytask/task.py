@@ -7,6 +7,7 @@ from typing import Any
 from typing import Callable
 
 from _pytask.console import format_strings_as_flat_tree
+from _pytask.path import compile_path_patterns
 from _pytask.pluginmanager import hookimpl
 from _pytask.shared import find_duplicates
 from _pytask.task_utils import COLLECTED_TASKS
@@ -35,7 +36,7 @@ def pytask_collect_file(
 ) -> list[CollectionReport] | None:
     """Collect a file."""
     if (
-        any(path.match(pattern) for pattern in session.config["task_files"])
+        compile_path_patterns(tuple(session.config["task_files"]))(path)
         and COLLECTED_TASKS[path]
     ):
         # Remove tasks from the global to avoid re-collection if programmatic interface
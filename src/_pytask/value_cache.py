@@ -0,0 +1,62 @@
+"""Contains hooks for the in-memory cache of values."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+from typing import Any
+from typing import Generator
+
+import click
+
+from _pytask.pickle_utils import value_cache
+from _pytask.pluginmanager import hookimpl
+
+if TYPE_CHECKING:
+    from _pytask.node_protocols import PTask
+
+
+@hookimpl
+def pytask_extend_command_line_interface(cli: click.Group) -> None:
+    """Add the option to enable the cache."""
+    cli.commands["build"].params.append(
+        click.Option(
+            ["--value-cache-size"],
+            type=click.IntRange(min=0),
+            default=0,
+            metavar="MB",
+            help="Keep values of pickle nodes in memory in a cache of the given size "
+            "in MB. The cache is disabled with 0.",
+        )
+    )
+
+
+@hookimpl
+def pytask_parse_config(config: dict[str, Any]) -> None:
+    """Parse the size of the cache."""
+    config["value_cache_size"] = int(config.get("value_cache_size") or 0)
+
+
+@hookimpl
+def pytask_post_parse(config: dict[str, Any]) -> None:
+    """Enable the cache."""
+    value_cache.configure(max_size=config["value_cache_size"] * 1024**2)
+
+
+@hookimpl(wrapper=True)
+def pytask_execute_task(task: PTask) -> Generator[None, None, None]:
+    """Attach the hits and misses of the cache while loading values to the task."""
+    hits, misses = value_cache.hits, value_cache.misses
+    try:
+        return (yield)
+    finally:
+        if value_cache.max_size:
+            task.attributes["value_cache"] = {
+                "hits": value_cache.hits - hits,
+                "misses": value_cache.misses - misses,
+            }
+
+
+@hookimpl
+def pytask_unconfigure() -> None:
+    """Disable the cache and release the values."""
+    value_cache.configure(max_size=0)
@@ -0,0 +1,395 @@
+"""Contains the implementation of ``pytask watch``."""
+
+from __future__ import annotations
+
+import itertools
+import os
+import sys
+from pathlib import Path
+from typing import TYPE_CHECKING
+from typing import Any
+from typing import Iterable
+
+import click
+from attrs import define
+from attrs import field
+
+from _pytask.build import build_command
+from _pytask.click import ColoredCommand
+from _pytask.console import console
+from _pytask.dag import create_dag
+from _pytask.dag_utils import descending_tasks
+from _pytask.dag_utils import node_and_neighbors
+from _pytask.exceptions import CollectionError
+from _pytask.exceptions import ConfigurationError
+from _pytask.exceptions import ExecutionError
+from _pytask.exceptions import ResolvingDependenciesError
+from _pytask.node_protocols import PPathNode
+from _pytask.node_protocols import PTask
+from _pytask.node_protocols import PTaskWithPath
+from _pytask.outcomes import ExitCode
+from _pytask.path import compile_path_patterns
+from _pytask.path import unload_module
+from _pytask.pluginmanager import hookimpl
+from _pytask.pluginmanager import storage
+from _pytask.session import Session
+from _pytask.traceback import Traceback
+from _pytask.watch_utils import create_watcher
+
+if TYPE_CHECKING:
+    from typing import NoReturn
+
+    import networkx as nx
+
+    from _pytask.mark import Mark
+    from _pytask.watch_utils import Watcher
+
+
+@hookimpl(tryfirst=True)
+def pytask_extend_command_line_interface(cli: click.Group) -> None:
+    """Extend the command line interface."""
+    cli.add_command(watch_command)
+
+
+class CommandWithBuildOptions(ColoredCommand):
+    """A command which accepts its own options and all options of ``pytask build``.
+
+    The options of ``pytask build`` are looked up when the command is invoked so that
+    options added by plugins are available, too.
+
+    """
+
+    def get_params(self, ctx: click.Context) -> list[click.Parameter]:
+        names = {param.name for param in self.params}
+        params = self.params + [
+            param for param in build_command.params if param.name not in names
+        ]
+        help_option = self.get_help_option(ctx)
+        return params if help_option is None else [*params, help_option]
+
+
+@define(kw_only=True)
+class WatchedProject:
+    """The state of a project which is kept in memory between builds.
+
+    Parameters
+    ----------
+    dag
+        The DAG of the last successful build.
+    markers
+        The markers of each task after the collection. Markers like ``skip`` or
+        ``skip_ancestor_failed`` are added while a DAG is created or tasks are executed
+        and need to be removed before the next build.
+    modules
+        The task modules of the project including modules which failed to be collected.
+    tasks
+        All collected tasks.
+
+    """
+
+    dag: nx.DiGraph | None = None
+    markers: dict[str, list[Mark]] = field(factory=dict)
+    modules: set[Path] = field(factory=set)
+    tasks: list[PTask] = field(factory=list)
+
+
+@click.command(cls=CommandWithBuildOptions, name="watch")
+@click.option(
+    "--delay",
+    type=click.FloatRange(min=0),
+    default=0.2,
+    help="Seconds to wait for further changes before tasks are executed.",
+)
+@click.option(
+    "--polling",
+    is_flag=True,
+    default=False,
+    help="Poll the file system for changes instead of using inotify.",
+)
+def watch_command(**raw_config: Any) -> NoReturn:
+    """Build the project and rebuild it whenever files change.
+
+    pytask keeps the collected tasks and the DAG in memory and watches task
+    modules and files which are dependencies. When files change, only the
+    changed modules are collected again and only the affected tasks and their
+    descendants are executed.
+
+    """
+    pm = storage.get()
+    raw_config["command"] = "watch"
+
+    try:
+        config = pm.hook.pytask_configure(pm=pm, raw_config=raw_config)
+        session = Session.from_config(config)
+
+    except (ConfigurationError, Exception):
+        console.print(Traceback(sys.exc_info()))
+        session = Session(exit_code=ExitCode.CONFIGURATION_FAILED)
+
+    else:
+        watcher = create_watcher(polling=config["polling"], delay=config["delay"])
+        try:
+            session = watch(config, watcher)
+        finally:
+            watcher.close()
+        session.hook.pytask_unconfigure(session=session)
+
+    sys.exit(session.exit_code)
+
+
+def watch(config: dict[str, Any], watcher: Watcher) -> Session:
+    """Build the project and rebuild it on changes until the user interrupts.
+
+    Returns the session of the last build.
+
+    """
+    project = WatchedProject()
+    session = build_incrementally(config, project, modules=None, paths=set())
+
+    try:
+        while True:
+            sources = find_source_paths(project)
+            watcher.watch(find_watched_directories(config, project, sources))
+            console.print()
+            console.rule("Waiting for changes", style="neutral")
+
+            modules: set[Path] = set()
+            paths: set[Path] = set()
+            while not modules and not paths:
+                changed = watcher.wait()
+                # Watch new directories before they are searched for new modules so
+                # that no file created inside them is missed.
+                if any(path.is_dir() for path in changed):
+                    watcher.watch(find_watched_directories(config, project, sources))
+                modules, paths = classify_changes(changed, config, project, sources)
+
+            session = build_incrementally(config, project, modules=modules, paths=paths)
+    except KeyboardInterrupt:
+        pass
+
+    return session
+
+
+def build_incrementally(
+    config: dict[str, Any],
+    project: WatchedProject,
+    modules: set[Path] | None,
+    paths: set[Path],
+    execute: bool = True,
+) -> Session:
+    """Collect the changed modules and execute the affected tasks.
+
+    If ``modules`` is ``None``, the whole project is collected and executed. If
+    ``execute`` is ``False``, the tasks are only collected and the DAG is created.
+
+    """
+    session = Session.from_config(config)
+    try:
+        if modules is None:
+            session.hook.pytask_log_session_header(session=session)
+        _collect(session, project, modules)
+        session.dag = create_dag(session=session)
+        project.dag = session.dag
+        if execute:
+            if modules is not None:
+                _select_affected_tasks(session, modules, paths)
+            session.hook.pytask_execute(session=session)
+
+    except CollectionError:
+        session.exit_code = ExitCode.COLLECTION_FAILED
+
+    except ResolvingDependenciesError:
+        session.exit_code = ExitCode.DAG_FAILED
+
+    except ExecutionError:
+        session.exit_code = ExitCode.FAILED
+
+    except OSError:
+        # Files might be changed or removed while the project is built.
+        console.print(Traceback(sys.exc_info()))
+        session.exit_code = ExitCode.FAILED
+
+    return session
+
+
+def _collect(
+    session: Session, project: WatchedProject, modules: set[Path] | None
+) -> None:
+    """Collect tasks from changed modules and reuse all other tasks."""
+    if modules is None:
+        collection = session
+    else:
+        for module in modules:
+            unload_module(module, session.config["root"])
+        project.modules -= modules
+        project.tasks = [
+            task
+            for task in project.tasks
+            if not (isinstance(task, PTaskWithPath) and task.path in modules)
+        ]
+        for task in project.tasks:
+            task.markers = list(project.markers[task.signature])
+
+        existing_modules = sorted(module for module in modules if module.exists())
+        collection = Session.from_config({**session.config, "paths": existing_modules})
+
+    try:
+        # Skip the collection if only files which are dependencies have changed.
+        if modules is None or collection.config["paths"]:
+            collection.hook.pytask_collect(session=collection)
+    finally:
+        project.tasks.extend(collection.tasks)
+        project.markers.update(
+            {task.signature: list(task.markers) for task in collection.tasks}
+        )
+        project.modules |= {
+            report.node.path
+            for report in collection.collection_reports
+            if isinstance(report.node, (PTaskWithPath, PPathNode))
+        }
+        session.tasks = list(project.tasks)
+        session.collection_reports = collection.collection_reports
+
+
+def find_affected_tasks(
+    dag: nx.DiGraph, modules: Iterable[Path], paths: Iterable[Path]
+) -> set[str]:
+    """Find tasks affected by changed modules and files.
+
+    Tasks are affected if they are defined in a changed module, depend on a changed
+    file, or are descendants of such tasks.
+
+    """
+    modules = set(modules)
+    paths = set(paths)
+
+    affected = set()
+    for signature, data in dag.nodes(data=True):
+        if "task" in data:
+            task = data["task"]
+            if isinstance(task, PTaskWithPath) and task.path in modules:
+                affected.add(signature)
+        elif isinstance(data.get("node"), PPathNode) and data["node"].path in paths:
+            affected.update(
+                successor
+                for successor in dag.successors(signature)
+                if "task" in dag.nodes[successor]
+            )
+
+    for signature in list(affected):
+        affected.update(descending_tasks(signature, dag))
+    return affected
+
+
+def _select_affected_tasks(
+    session: Session, modules: set[Path], paths: set[Path]
+) -> None:
+    """Reduce the DAG to the affected tasks, their dependencies, and products."""
+    affected = find_affected_tasks(session.dag, modules, paths)
+    nodes = set(
+        itertools.chain.from_iterable(
+            node_and_neighbors(session.dag, signature) for signature in affected
+        )
+    )
+    session.dag = session.dag.subgraph(nodes).copy()
+    session.tasks = [task for task in session.tasks if task.signature in affected]
+
+
+def find_source_paths(project: WatchedProject) -> set[Path]:
+    """Find local files which are dependencies and not produced by any task."""
+    if project.dag is None:
+        return set()
+    return {
+        data["node"].path
+        for signature, data in project.dag.nodes(data=True)
+        if isinstance(data.get("node"), PPathNode)
+        and project.dag.in_degree(signature) == 0
+        and _is_local_path(data["node"].path)
+    }
+
+
+def _is_local_path(path: Path) -> bool:
+    """Check whether a path is on the local file system.
+
+    Remote :class:`upath.UPath` have a protocol like ``"s3"``.
+
+    """
+    return isinstance(path, Path) and not getattr(path, "protocol", "")
+
+
+def find_watched_directories(
+    config: dict[str, Any], project: WatchedProject, sources: set[Path]
+) -> set[Path]:
+    """Find the directories which need to be watched.
+
+    The directories of the paths passed to pytask and all their subdirectories which
+    are not ignored are watched to detect new task modules.
+
+    """
+    directories = {path.parent for path in itertools.chain(project.modules, sources)}
+    for path in config["paths"]:
+        if path.is_dir():
+            directories |= _scan_not_ignored(path, config)[0]
+        else:
+            directories.add(path.parent)
+    return directories
+
+
+def _scan_not_ignored(
+    directory: Path, config: dict[str, Any]
+) -> tuple[set[Path], set[Path]]:
+    """Find all directories and files in a directory which are not ignored."""
+    directories = set()
+    files = set()
+    for root, dirnames, filenames in os.walk(directory):
+        directories.add(Path(root))
+        dirnames[:] = [
+            name
+            for name in dirnames
+            if not config["pm"].hook.pytask_ignore_collect(
+                path=Path(root, name), config=config
+            )
+        ]
+        files |= {Path(root, name) for name in filenames}
+    return directories, files
+
+
+def classify_changes(
+    changed: set[Path],
+    config: dict[str, Any],
+    project: WatchedProject,
+    sources: set[Path],
+) -> tuple[set[Path], set[Path]]:
+    """Split changed paths into task modules and files which are dependencies.
+
+    New modules matching the pattern of task files are treated as changed modules.
+    Since new directories might not be watched when files are created inside them,
+    new directories are searched for new modules. Other files, for example, products
+    written by tasks, are ignored.
+
+    """
+    is_task_file = compile_path_patterns(tuple(config["task_files"]))
+
+    modules = set()
+    paths = set()
+    for path in changed:
+        if path in project.modules:
+            modules.add(path)
+        elif path in sources:
+            paths.add(path)
+        elif config["pm"].hook.pytask_ignore_collect(path=path, config=config):
+            continue
+        elif path.is_dir():
+            modules |= {
+                file
+                for file in _scan_not_ignored(path, config)[1]
+                if file.suffix == ".py"
+                and is_task_file(file)
+                and file not in project.modules
+                and not config["pm"].hook.pytask_ignore_collect(
+                    path=file, config=config
+                )
+            }
+        elif path.suffix == ".py" and is_task_file(path) and path.is_file():
+            modules.add(path)
+    return modules, paths
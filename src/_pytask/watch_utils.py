@@ -0,0 +1,233 @@
+"""Contains utilities to watch the file system for changes."""
+
+from __future__ import annotations
+
+import ctypes
+import os
+import select
+import struct
+import sys
+import time
+from pathlib import Path
+from typing import Iterable
+from typing import Union
+
+from attrs import define
+from attrs import field
+
+__all__ = ["InotifyWatcher", "PollingWatcher", "Watcher", "create_watcher"]
+
+
+_IN_ATTRIB = 0x00000004
+_IN_CLOSE_WRITE = 0x00000008
+_IN_MOVED_FROM = 0x00000040
+_IN_MOVED_TO = 0x00000080
+_IN_CREATE = 0x00000100
+_IN_DELETE = 0x00000200
+_IN_Q_OVERFLOW = 0x00004000
+_IN_IGNORED = 0x00008000
+
+_INOTIFY_MASK = (
+    _IN_ATTRIB
+    | _IN_CLOSE_WRITE
+    | _IN_MOVED_FROM
+    | _IN_MOVED_TO
+    | _IN_CREATE
+    | _IN_DELETE
+)
+"""int: The events of files inside a watched directory which are reported."""
+
+_EVENT_HEADER = struct.Struct("iIII")
+"""struct.Struct: The header of a ``struct inotify_event``."""
+
+
+@define(eq=False, kw_only=True)
+class InotifyWatcher:
+    """Watch directories for changed files with inotify.
+
+    Only Linux provides inotify. Use :func:`create_watcher` to fall back to polling on
+    other platforms.
+
+    Parameters
+    ----------
+    delay
+        After the first change is detected, wait until no more changes arrive for this
+        many seconds. It bundles the many events caused by saving files.
+
+    """
+
+    delay: float = 0.2
+    _libc: ctypes.CDLL
+    _fd: int
+    _directories: dict[Path, int] = field(factory=dict)
+    _descriptors: dict[int, Path] = field(factory=dict)
+
+    @classmethod
+    def create(cls, delay: float = 0.2) -> InotifyWatcher:
+        """Create a watcher and raise :class:`OSError` if inotify is not available."""
+        libc = ctypes.CDLL(None, use_errno=True)
+        fd = libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        if fd < 0:
+            errno = ctypes.get_errno()
+            raise OSError(errno, os.strerror(errno))
+        return cls(delay=delay, libc=libc, fd=fd)
+
+    def watch(self, directories: Iterable[Path]) -> None:
+        """Set the directories which are watched."""
+        directories = set(directories)
+        for directory in set(self._directories) - directories:
+            descriptor = self._directories.pop(directory)
+            self._descriptors.pop(descriptor, None)
+            self._libc.inotify_rm_watch(self._fd, descriptor)
+        for directory in directories - set(self._directories):
+            descriptor = self._libc.inotify_add_watch(
+                self._fd, os.fsencode(directory), _INOTIFY_MASK
+            )
+            # Directories which do not exist (yet) are skipped.
+            if descriptor >= 0:
+                self._directories[directory] = descriptor
+                self._descriptors[descriptor] = directory
+
+    def wait(self, timeout: float | None = None) -> set[Path]:
+        """Wait for changes and return the changed paths.
+
+        An empty set is returned if no change happened until the timeout.
+
+        """
+        changed: set[Path] = set()
+        readable, _, _ = select.select([self._fd], [], [], timeout)
+        while readable:
+            changed |= self._read_events()
+            readable, _, _ = select.select([self._fd], [], [], self.delay)
+        return changed
+
+    def close(self) -> None:
+        """Stop watching."""
+        os.close(self._fd)
+
+    def _read_events(self) -> set[Path]:
+        try:
+            buffer = os.read(self._fd, 64 * 1024)
+        except BlockingIOError:  # pragma: no cover
+            return set()
+
+        changed = set()
+        offset = 0
+        while offset < len(buffer):
+            descriptor, mask, _, length = _EVENT_HEADER.unpack_from(buffer, offset)
+            offset += _EVENT_HEADER.size
+            name = buffer[offset : offset + length].rstrip(b"\0")
+            offset += length
+
+            if mask & _IN_Q_OVERFLOW:  # pragma: no cover
+                # Events were dropped. Report all files in all watched directories.
+                changed |= {
+                    Path(entry.path)
+                    for directory in self._directories
+                    for entry in os.scandir(directory)
+                }
+            elif mask & _IN_IGNORED:
+                directory = self._descriptors.pop(descriptor, None)
+                self._directories.pop(directory, None)  # type: ignore[arg-type]
+            elif name and descriptor in self._descriptors:
+                changed.add(self._descriptors[descriptor] / os.fsdecode(name))
+        return changed
+
+
+@define(eq=False, kw_only=True)
+class PollingWatcher:
+    """Watch directories for changed files by comparing their modification times.
+
+    Parameters
+    ----------
+    delay
+        After the first change is detected, wait until no more changes arrive for this
+        many seconds.
+    interval
+        The number of seconds between two scans of the watched directories.
+
+    """
+
+    delay: float = 0.2
+    interval: float = 0.5
+    _snapshot: dict[Path, dict[Path, tuple[int, int]]] = field(factory=dict)
+
+    def watch(self, directories: Iterable[Path]) -> None:
+        """Set the directories which are watched.
+
+        Directories which are already watched keep their snapshot so that changes made
+        in between are not lost.
+
+        """
+        self._snapshot = {
+            directory: self._snapshot[directory]
+            if directory in self._snapshot
+            else _scan(directory)
+            for directory in directories
+        }
+
+    def wait(self, timeout: float | None = None) -> set[Path]:
+        """Wait for changes and return the changed paths.
+
+        An empty set is returned if no change happened until the timeout.
+
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        changed = self._poll()
+        while not changed:
+            if deadline is not None and time.monotonic() >= deadline:
+                return changed
+            time.sleep(self.interval)
+            changed = self._poll()
+
+        while True:
+            time.sleep(self.delay)
+            new_changes = self._poll()
+            if not new_changes:
+                return changed
+            changed |= new_changes
+
+    def close(self) -> None:
+        """Stop watching."""
+        self._snapshot.clear()
+
+    def _poll(self) -> set[Path]:
+        changed = set()
+        for directory, old in self._snapshot.items():
+            new = _scan(directory)
+            changed |= {
+                path
+                for path in old.keys() | new.keys()
+                if old.get(path) != new.get(path)
+            }
+            self._snapshot[directory] = new
+        return changed
+
+
+def _scan(directory: Path) -> dict[Path, tuple[int, int]]:
+    """Record the modification time and size of all files in a directory."""
+    files = {}
+    try:
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                try:
+                    stat = entry.stat()
+                except OSError:  # pragma: no cover
+                    continue
+                files[Path(entry.path)] = (stat.st_mtime_ns, stat.st_size)
+    except OSError:
+        pass
+    return files
+
+
+Watcher = Union[InotifyWatcher, PollingWatcher]
+
+
+def create_watcher(polling: bool = False, delay: float = 0.2) -> Watcher:
+    """Create a watcher using inotify on Linux and polling otherwise."""
+    if not polling and sys.platform == "linux":
+        try:
+            return InotifyWatcher.create(delay=delay)
+        except (AttributeError, OSError):  # pragma: no cover
+            pass
+    return PollingWatcher(delay=delay)
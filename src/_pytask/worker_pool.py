@@ -0,0 +1,88 @@
+"""Contains hooks to execute tasks in a pool of warm worker processes."""
+
+from __future__ import annotations
+
+import warnings
+from typing import Any
+
+import click
+
+from _pytask.pluginmanager import hookimpl
+from _pytask.worker_pool_utils import is_fork_available
+from _pytask.worker_pool_utils import worker_pool
+
+
+@hookimpl
+def pytask_extend_command_line_interface(cli: click.Group) -> None:
+    """Add the options to configure the worker pool."""
+    cli.commands["build"].params.extend(
+        [
+            click.Option(
+                ["--worker-processes"],
+                type=click.IntRange(min=0),
+                default=0,
+                metavar="N",
+                help="Execute tasks in N worker processes which are forked after the "
+                "tasks are collected. Tasks are executed in the main process with 0.",
+            ),
+            click.Option(
+                ["--max-tasks-per-worker"],
+                type=click.IntRange(min=0),
+                default=0,
+                metavar="N",
+                help="Replace a worker process after it executed N tasks. Workers are "
+                "not replaced with 0.",
+            ),
+            click.Option(
+                ["--max-worker-memory"],
+                type=click.IntRange(min=0),
+                default=0,
+                metavar="MB",
+                help="Replace a worker process after a task if its memory exceeds the "
+                "given size in MB. Workers are not replaced with 0.",
+            ),
+        ]
+    )
+
+
+@hookimpl
+def pytask_parse_config(config: dict[str, Any]) -> None:
+    """Parse the configuration of the worker pool."""
+    for name in ("worker_processes", "max_tasks_per_worker", "max_worker_memory"):
+        config[name] = int(config.get(name) or 0)
+
+    if config["worker_processes"] and not is_fork_available():
+        warnings.warn(
+            "Worker processes are not available on this platform because processes "
+            "cannot be forked. Tasks are executed in the main process.",
+            UserWarning,
+            stacklevel=1,
+        )
+        config["worker_processes"] = 0
+
+    # Threads of the file watcher and the daemon would not exist in forked workers and
+    # might hold locks.
+    if config["worker_processes"] and config.get("command") in ("serve", "watch"):
+        warnings.warn(
+            f"Worker processes are not available with 'pytask {config['command']}' "
+            "since other threads are running. Tasks are executed in the main process.",
+            UserWarning,
+            stacklevel=1,
+        )
+        config["worker_processes"] = 0
+
+
+@hookimpl
+def pytask_post_parse(config: dict[str, Any]) -> None:
+    """Configure the worker pool."""
+    worker_pool.configure(
+        n_workers=config["worker_processes"],
+        max_tasks_per_worker=config["max_tasks_per_worker"],
+        max_rss=config["max_worker_memory"] * 1024**2,
+    )
+
+
+@hookimpl
+def pytask_unconfigure() -> None:
+    """Stop the worker processes."""
+    worker_pool.configure()
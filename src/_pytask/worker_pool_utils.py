@@ -0,0 +1,525 @@
+"""Contains utilities for a pool of warm worker processes.
+
+Local worker processes are forked from a template process which is forked from the main
+process after the tasks are collected. Thus, workers start with all task modules and
+their imports loaded. Objects which exist when the template is created are frozen with
+:func:`gc.freeze` so that the garbage collector does not copy their memory pages into
+each worker. Local workers exit after a number of tasks or when their memory exceeds a
+threshold and are replaced by new workers from the template.
+
+Remote workers are started with ``pytask worker --connect host:port`` on other machines.
+They collect the same project from a shared file system and connect to the main process
+over TCP.
+
+Each worker is owned by a thread in the main process. The threads take tasks from a
+shared queue, send them to their workers, and wait for the results. Both kinds of
+workers execute tasks with :func:`serve_tasks`.
+
+"""
+
+from __future__ import annotations
+
+import gc
+import multiprocessing
+import os
+import pickle
+import queue
+import shutil
+import signal
+import sys
+import tempfile
+import threading
+import traceback
+from concurrent.futures import Future
+from contextlib import suppress
+from multiprocessing import AuthenticationError
+from multiprocessing.connection import Client
+from multiprocessing.connection import Connection
+from multiprocessing.connection import Listener
+from pathlib import Path
+from typing import TYPE_CHECKING
+from typing import Any
+from typing import Callable
+from typing import Tuple
+
+from attrs import define
+from attrs import field
+
+from _pytask.exceptions import WorkerError
+
+if TYPE_CHECKING:
+    from multiprocessing.process import BaseProcess
+
+    from typing_extensions import TypeAlias
+
+    from _pytask.node_protocols import PTask
+
+
+__all__ = [
+    "RemoteTraceback",
+    "WorkerPool",
+    "is_fork_available",
+    "serve_tasks",
+    "worker_pool",
+]
+
+
+_Item: TypeAlias = Tuple[str, Any, "Future[Any]", int]
+"""The signature of a task, its payload, its future, and the number of attempts."""
+
+_MAX_ATTEMPTS = 2
+"""The number of remote workers which may be lost while they execute the same task."""
+
+
+def is_fork_available() -> bool:
+    """Check whether processes can be forked on this platform."""
+    return "fork" in multiprocessing.get_all_start_methods()
+
+
+class RemoteTraceback(Exception):  # noqa: N818
+    """The traceback of an exception which was raised in a worker."""
+
+    def __init__(self, tb: str) -> None:
+        self.tb = tb
+
+    def __str__(self) -> str:
+        return self.tb
+
+
+def get_rss() -> int:
+    """Get the resident set size of the current process in bytes."""
+    try:
+        statm = Path("/proc/self/statm").read_text()
+    except OSError:
+        import resource
+
+        usage = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return usage if sys.platform == "darwin" else usage * 1024
+    return int(statm.split()[1]) * os.sysconf("SC_PAGE_SIZE")
+
+
+@define
+class WorkerPool:
+    """A pool of warm worker processes.
+
+    Attributes
+    ----------
+    n_workers
+        The number of local workers.
+    max_tasks_per_worker
+        The number of tasks after which a local worker is replaced. Workers are not
+        replaced with 0.
+    max_rss
+        The resident set size in bytes above which a local worker is replaced after a
+        task. Workers are not replaced with 0.
+    address
+        The host and port where the pool accepts remote workers. Remote workers are not
+        accepted with ``None``.
+    authkey
+        The key which remote workers need to connect.
+    n_started
+        The number of local workers which were started.
+    n_remote
+        The number of connected remote workers.
+
+    """
+
+    n_workers: int = 0
+    max_tasks_per_worker: int = 0
+    max_rss: int = 0
+    address: tuple[str, int] | None = None
+    authkey: bytes = b""
+    n_started: int = 0
+    n_remote: int = 0
+    _is_started: bool = False
+    _tasks: dict[str, PTask] = field(factory=dict)
+    _function: Callable[[PTask, Any], Any] | None = None
+    _queue: queue.SimpleQueue[_Item | None] = field(factory=queue.SimpleQueue)
+    _futures: dict[str, Future[Any]] = field(factory=dict)
+    _threads: list[threading.Thread] = field(factory=list)
+    _lock: threading.Lock = field(factory=threading.Lock, repr=False)
+    _listener: Listener | None = None
+    _directory: str | None = None
+    _template: BaseProcess | None = None
+    _template_connection: Connection | None = None
+    _remote_listener: Listener | None = None
+    _accept_thread: threading.Thread | None = None
+    _stopping: threading.Event = field(factory=threading.Event, repr=False)
+    _connected: Future[None] = field(factory=Future)
+
+    @property
+    def is_enabled(self) -> bool:
+        return bool(self.n_workers) or self.address is not None
+
+    @property
+    def is_started(self) -> bool:
+        return self._is_started
+
+    def configure(
+        self, n_workers: int = 0, max_tasks_per_worker: int = 0, max_rss: int = 0
+    ) -> None:
+        """Configure the local workers or disable them with ``n_workers=0``."""
+        self.stop()
+        self.n_workers = n_workers
+        self.max_tasks_per_worker = max_tasks_per_worker
+        self.max_rss = max_rss
+
+    def listen(
+        self, address: tuple[str, int] | None = None, authkey: bytes = b""
+    ) -> None:
+        """Accept remote workers at an address or stop accepting them with ``None``."""
+        self.stop()
+        self.address = address
+        self.authkey = authkey
+
+    def start(
+        self, tasks: dict[str, PTask], function: Callable[[PTask, Any], Any]
+    ) -> None:
+        """Start the template process and accept remote workers.
+
+        The main process must not run other threads because they do not exist in the
+        forked template and might hold locks.
+
+        Parameters
+        ----------
+        tasks
+            A mapping from signatures to tasks which can be executed by workers.
+        function
+            The function which executes a task and a payload in a worker.
+
+        """
+        if not self.is_enabled or self._is_started:
+            return
+
+        self._tasks = tasks
+        self._function = function
+        self._is_started = True
+        self._stopping.clear()
+
+        if self.n_workers:
+            self._start_template()
+            for _ in range(self.n_workers):
+                self._start_thread(self._run_local_worker)
+
+        if self.address is not None:
+            self._remote_listener = Listener(
+                self.address, family="AF_INET", authkey=self.authkey
+            )
+            self._accept_thread = threading.Thread(
+                target=self._accept_remote_workers, name="pytask-accept", daemon=True
+            )
+            self._accept_thread.start()
+
+    def stop(self) -> None:
+        """Stop all workers and the template process."""
+        if not self._is_started:
+            return
+
+        self._stopping.set()
+        if self._accept_thread is not None:
+            assert self._remote_listener is not None
+            # Wake up the thread which waits for remote workers.
+            with suppress(OSError, AuthenticationError, EOFError):
+                Client(
+                    self._remote_listener.address,
+                    family="AF_INET",
+                    authkey=self.authkey,
+                ).close()
+            self._accept_thread.join()
+            self._remote_listener.close()
+            self._accept_thread = None
+            self._remote_listener = None
+
+        for _ in self._threads:
+            self._queue.put(None)
+        for thread in self._threads:
+            thread.join()
+        self._threads.clear()
+        self._queue = queue.SimpleQueue()
+        self._futures.clear()
+
+        if self._template is not None:
+            assert self._template_connection is not None
+            assert self._listener is not None
+            assert self._directory is not None
+            self._template_connection.send(None)
+            self._template_connection.close()
+            self._template.join()
+            self._listener.close()
+            shutil.rmtree(self._directory, ignore_errors=True)
+            self._template = None
+            self._template_connection = None
+            self._listener = None
+            self._directory = None
+
+        self._tasks = {}
+        self._function = None
+        self._is_started = False
+
+    def can_execute(self, task: PTask) -> bool:
+        """Check whether a task can be executed by a worker."""
+        return self._is_started and task.signature in self._tasks
+
+    def is_full(self) -> bool:
+        """Check whether all workers are busy.
+
+        Without any workers, one task is queued until a remote worker connects.
+
+        """
+        n_running = sum(not future.done() for future in self._futures.values())
+        return n_running >= max(self.n_workers + self.n_remote, 1)
+
+    def submit(self, task: PTask, payload: Any) -> None:
+        """Execute a task with a payload in the next free worker."""
+        future: Future[Any] = Future()
+        self._futures[task.signature] = future
+        self._queue.put((task.signature, payload, future, 0))
+
+    def is_running(self, task: PTask) -> bool:
+        """Check whether a task is executed by a worker."""
+        future = self._futures.get(task.signature)
+        return future is not None and not future.done()
+
+    def is_complete(self, task: PTask) -> bool:
+        """Check whether a task was executed by a worker and has a result."""
+        future = self._futures.get(task.signature)
+        return future is not None and future.done()
+
+    def futures(self) -> list[Future[Any]]:
+        """Return the futures of all tasks which are executed by workers.
+
+        While remote workers are accepted, the list includes a future which is resolved
+        when the next remote worker connects and more tasks can be submitted.
+
+        """
+        futures = [future for future in self._futures.values() if not future.done()]
+        if futures and self._accept_thread is not None:
+            futures.append(self._connected)
+        return futures
+
+    def result(self, task: PTask) -> Any:
+        """Return the result of a task or raise the exception from the worker."""
+        return self._futures.pop(task.signature).result()
+
+    def _start_thread(
+        self, target: Callable[..., None], *args: Any, name: str = "pytask-worker"
+    ) -> None:
+        thread = threading.Thread(target=target, args=args, name=name, daemon=True)
+        thread.start()
+        self._threads.append(thread)
+
+    def _start_template(self) -> None:
+        """Fork the template process from which local workers are forked."""
+        self._directory = tempfile.mkdtemp(prefix="pytask-")
+        address = Path(self._directory).joinpath("pool").as_posix()
+        authkey = os.urandom(32)
+        self._listener = Listener(address, family="AF_UNIX", authkey=authkey)
+        parent_connection, child_connection = multiprocessing.Pipe()
+        self._template = multiprocessing.get_context("fork").Process(
+            target=_run_template,
+            args=(child_connection, address, authkey, self),
+            daemon=True,
+            name="pytask-template",
+        )
+        self._template.start()
+        child_connection.close()
+        self._template_connection = parent_connection
+
+    def _start_worker(self) -> Connection:
+        """Fork a new local worker from the template and wait until it is connected."""
+        assert self._template_connection is not None
+        assert self._listener is not None
+        with self._lock:
+            self._template_connection.send("fork")
+            connection = self._listener.accept()
+            self.n_started += 1
+        return connection
+
+    def _run_local_worker(self) -> None:
+        """Send tasks to a local worker and replace the worker when it retires."""
+        connection = None
+        try:
+            while (item := self._queue.get()) is not None:
+                if connection is None:
+                    connection = self._start_worker()
+                if not self._dispatch(connection, item, is_remote=False):
+                    connection.close()
+                    connection = None
+        finally:
+            if connection is not None:
+                connection.close()
+
+    def _accept_remote_workers(self) -> None:
+        """Start a thread for every remote worker which connects."""
+        assert self._remote_listener is not None
+        while True:
+            try:
+                connection = self._remote_listener.accept()
+            except (OSError, AuthenticationError, EOFError):
+                if self._stopping.is_set():
+                    return
+                continue
+            if self._stopping.is_set():
+                connection.close()
+                return
+
+            with self._lock:
+                self.n_remote += 1
+            self._start_thread(
+                self._run_remote_worker, connection, name="pytask-remote-worker"
+            )
+            connected, self._connected = self._connected, Future()
+            connected.set_result(None)
+
+    def _run_remote_worker(self, connection: Connection) -> None:
+        """Send tasks to a remote worker until it disconnects."""
+        try:
+            while (item := self._queue.get()) is not None:
+                if not self._dispatch(connection, item, is_remote=True):
+                    break
+        finally:
+            connection.close()
+            with self._lock:
+                self.n_remote -= 1
+
+    def _dispatch(self, connection: Connection, item: _Item, is_remote: bool) -> bool:
+        """Send a task to a worker and set the result of its future.
+
+        Returns
+        -------
+        bool
+            Whether the worker can execute more tasks.
+
+        """
+        signature, payload, future, n_attempts = item
+        if not future.running() and not future.set_running_or_notify_cancel():
+            return True
+
+        try:
+            connection.send((signature, payload))
+            is_success, result, retire = connection.recv()
+        except (EOFError, OSError):
+            # Tasks of lost remote workers are executed by other workers. Local workers
+            # are only lost if the task crashed them.
+            if is_remote and n_attempts + 1 < _MAX_ATTEMPTS:
+                self._queue.put((signature, payload, future, n_attempts + 1))
+            else:
+                msg = "The worker which executed the task exited unexpectedly."
+                future.set_exception(WorkerError(msg))
+            return False
+
+        if is_success:
+            future.set_result(result)
+        else:
+            exception, tb = result
+            exception.__cause__ = RemoteTraceback(tb)
+            future.set_exception(exception)
+        return not retire
+
+
+def serve_tasks(
+    connection: Connection,
+    tasks: dict[str, PTask],
+    function: Callable[[PTask, Any], Any],
+    max_tasks: int = 0,
+    max_rss: int = 0,
+) -> int:
+    """Execute tasks received over a connection until it is closed.
+
+    Parameters
+    ----------
+    connection
+        The connection to the main process.
+    tasks
+        A mapping from signatures to the tasks which can be executed.
+    function
+        The function which executes a task and a payload.
+    max_tasks
+        The number of tasks after which the worker retires. The worker does not retire
+        with 0.
+    max_rss
+        The resident set size in bytes above which the worker retires after a task. The
+        worker does not retire with 0.
+
+    Returns
+    -------
+    int
+        The number of executed tasks.
+
+    """
+    n_tasks = 0
+    while True:
+        try:
+            signature, payload = connection.recv()
+        except (EOFError, OSError):
+            break
+
+        try:
+            if signature not in tasks:
+                msg = (
+                    f"The task with the signature {signature!r} is unknown to the "
+                    "worker. Workers must collect the same project at the same path."
+                )
+                raise WorkerError(msg)
+            result = (True, function(tasks[signature], payload))
+        except Exception as e:  # noqa: BLE001
+            result = (False, (e, traceback.format_exc()))
+        n_tasks += 1
+
+        retire = (max_tasks and n_tasks >= max_tasks) or (
+            max_rss and get_rss() > max_rss
+        )
+        try:
+            connection.send((*result, bool(retire)))
+        except (EOFError, OSError):
+            break
+        except (AttributeError, TypeError, pickle.PicklingError) as e:
+            # Results or exceptions which cannot be pickled are sent as errors.
+            error = WorkerError(f"The result of the task cannot be sent: {e!r}")
+            connection.send((False, (error, traceback.format_exc()), bool(retire)))
+        if retire:
+            break
+    return n_tasks
+
+
+def _run_template(
+    connection: Connection, address: str, authkey: bytes, pool: WorkerPool
+) -> None:
+    """Fork workers on request until the pool is stopped."""
+    # Workers are reaped automatically.
+    signal.signal(signal.SIGCHLD, signal.SIG_IGN)
+    gc.freeze()
+    while True:
+        try:
+            message = connection.recv()
+        except EOFError:
+            break
+        if message is None:
+            break
+        if os.fork() == 0:
+            connection.close()
+            try:
+                _run_worker(address, authkey, pool)
+            finally:
+                os._exit(0)
+
+
+def _run_worker(address: str, authkey: bytes, pool: WorkerPool) -> None:
+    """Execute tasks sent by the main process."""
+    assert pool._function is not None
+    signal.signal(signal.SIGCHLD, signal.SIG_DFL)
+    # The main process handles interruptions.
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    connection = Client(address, family="AF_UNIX", authkey=authkey)
+    serve_tasks(
+        connection,
+        pool._tasks,
+        pool._function,
+        max_tasks=pool.max_tasks_per_worker,
+        max_rss=pool.max_rss,
+    )
+    connection.close()
+
+
+worker_pool = WorkerPool()
+"""WorkerPool: The pool of worker processes which execute tasks."""
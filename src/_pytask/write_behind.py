@@ -0,0 +1,44 @@
+"""Contains hooks to save products of tasks in the background."""
+
+from __future__ import annotations
+
+from typing import Any
+
+import click
+
+from _pytask.pluginmanager import hookimpl
+from _pytask.write_behind_utils import product_writer
+
+
+@hookimpl
+def pytask_extend_command_line_interface(cli: click.Group) -> None:
+    """Add the option to enable the write-behind mode."""
+    cli.commands["build"].params.append(
+        click.Option(
+            ["--write-behind"],
+            type=click.IntRange(min=0),
+            default=0,
+            metavar="N",
+            help="Save products returned by tasks with N threads in the background "
+            "while tasks which do not depend on them are executed. Products are saved "
+            "immediately with 0.",
+        )
+    )
+
+
+@hookimpl
+def pytask_parse_config(config: dict[str, Any]) -> None:
+    """Parse the number of writer threads."""
+    config["write_behind"] = int(config.get("write_behind") or 0)
+
+
+@hookimpl
+def pytask_post_parse(config: dict[str, Any]) -> None:
+    """Start the writer threads."""
+    product_writer.configure(n_workers=config["write_behind"])
+
+
+@hookimpl
+def pytask_unconfigure() -> None:
+    """Stop the writer threads."""
+    product_writer.configure()
@@ -0,0 +1,103 @@
+"""Contains utilities to save products of tasks in the background.
+
+Values returned by tasks are saved by a pool of writer threads while the next tasks are
+executed. A task is only finished when all of its products are written. Until then, the
+tasks depending on its products are not ready to be executed.
+
+"""
+
+from __future__ import annotations
+
+from concurrent.futures import Future
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import wait
+from typing import TYPE_CHECKING
+from typing import Any
+
+from attrs import define
+from attrs import field
+
+from _pytask.exceptions import NodeSaveError
+from _pytask.node_protocols import PPathNode
+
+if TYPE_CHECKING:
+    from _pytask.node_protocols import PNode
+    from _pytask.node_protocols import PTask
+
+
+__all__ = ["ProductWriter", "product_writer"]
+
+
+@define
+class ProductWriter:
+    """Save products of tasks in background threads.
+
+    Only nodes with paths are saved in the background. All other nodes, like
+    :class:`~pytask.PythonNode`, are saved immediately.
+
+    Attributes
+    ----------
+    n_workers
+        The number of writer threads. Products are saved immediately with 0.
+
+    """
+
+    n_workers: int = 0
+    _executor: ThreadPoolExecutor | None = None
+    _writes: dict[str, list[tuple[PNode, Future[Any]]]] = field(factory=dict)
+
+    def configure(self, n_workers: int = 0) -> None:
+        """Start the writer threads or stop them after all products are written."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+        self.n_workers = n_workers
+        self._writes.clear()
+        if n_workers:
+            self._executor = ThreadPoolExecutor(
+                max_workers=n_workers, thread_name_prefix="pytask-writer"
+            )
+
+    def save(self, task: PTask, node: PNode, value: Any) -> None:
+        """Save the value of a product of a task."""
+        if self._executor is None or not isinstance(node, PPathNode):
+            node.save(value)
+        else:
+            future = self._executor.submit(node.save, value)
+            self._writes.setdefault(task.signature, []).append((node, future))
+
+    def is_writing(self, task: PTask) -> bool:
+        """Check whether products of a task are still saved."""
+        return any(
+            not future.done() for _, future in self._writes.get(task.signature, [])
+        )
+
+    def futures(self) -> list[Future[Any]]:
+        """Return the futures of all products which are still saved."""
+        return [
+            future
+            for writes in self._writes.values()
+            for _, future in writes
+            if not future.done()
+        ]
+
+    def result(self, task: PTask) -> None:
+        """Wait until all products of a task are written.
+
+        Raises
+        ------
+        NodeSaveError
+            If a product could not be saved.
+
+        """
+        writes = self._writes.pop(task.signature, [])
+        wait([future for _, future in writes])
+        for node, future in writes:
+            exception = future.exception()
+            if exception is not None:
+                msg = f"Exception while saving node {node.name!r} of task {task.name!r}"
+                raise NodeSaveError(msg) from exception
+
+
+product_writer = ProductWriter()
+"""ProductWriter: The writer which saves products of tasks in the background."""
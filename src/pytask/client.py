@@ -0,0 +1,15 @@
+"""Publishes the client of :mod:`_pytask.client` for the ``pytask serve`` daemon."""
+
+from __future__ import annotations
+
+import sys
+
+from _pytask.client import find_socket
+from _pytask.client import main
+from _pytask.client import request
+
+__all__ = ["find_socket", "main", "request"]
+
+
+if __name__ == "__main__":
+    sys.exit(main())
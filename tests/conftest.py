@@ -1,24 +1,55 @@
 from __future__ import annotations
 
 import re
+import shutil
 import sys
+import tempfile
 from contextlib import contextmanager
+from contextlib import suppress
 from pathlib import Path
 from typing import Any
 
+import _pytask.database_utils  # noqa: F401
+import networkx  # noqa: F401
 import pytest
+import upath  # noqa: F401
 from click.testing import CliRunner
 from nbmake.pytest_items import NotebookItem
 from packaging import version
 from pytask import console
 from pytask import storage
 
+with suppress(ImportError):
+    import numpy as np  # noqa: F401
+
+with suppress(ImportError):
+    import pyarrow.dataset
+    import pyarrow.parquet  # noqa: F401
+
 
 @pytest.fixture(autouse=True)
 def _add_objects_to_doctest_namespace(doctest_namespace):
     doctest_namespace["Path"] = Path
 
 
+def pytest_configure(config: pytest.Config) -> None:
+    """Store the cache of entry points in a temporary directory.
+
+    The cache is moved before test modules are collected since modules which import
+    the CLI create a plugin manager. The environment variable is inherited by
+    subprocesses which invoke pytask.
+
+    """
+    cache = Path(tempfile.mkdtemp(prefix="pytask-cache-"))
+    monkeypatch = pytest.MonkeyPatch()
+    monkeypatch.setattr(
+        "_pytask.pluginmanager._get_cache_directory", lambda: cache / "pytask"
+    )
+    monkeypatch.setenv("XDG_CACHE_HOME", str(cache))
+    config.add_cleanup(monkeypatch.undo)
+    config.add_cleanup(lambda: shutil.rmtree(cache, ignore_errors=True))
+
+
 @pytest.fixture(autouse=True, scope="session")
 def _path_for_snapshots():
     console.width = 80
@@ -91,6 +122,10 @@ def _restore_sys_path_and_module_after_test_execution():
 
     The changes to `sys.path` might not be necessary to restore, but we do it anyways.
 
+    Dependencies which pytask imports lazily, like sqlalchemy, numpy, or pyarrow, are
+    imported at the top of this module. Otherwise, restoring `sys.modules` would remove
+    them and importing their extension modules a second time fails.
+
     """
     with restore_sys_path_and_module_after_test_execution():
         yield
@@ -0,0 +1,120 @@
+from __future__ import annotations
+
+import asyncio
+import textwrap
+
+import pytest
+from _pytask.async_utils import AsyncTaskRunner
+from _pytask.async_utils import is_async_task
+from pytask import ExitCode
+from pytask import Task
+from pytask import cli
+
+
+async def _double(x):
+    await asyncio.sleep(0)
+    return 2 * x
+
+
+@pytest.mark.unit()
+def test_run_coroutines_of_tasks(tmp_path):
+    task = Task(base_name="task", path=tmp_path, function=_double)
+    assert is_async_task(task)
+    assert not is_async_task(Task(base_name="task", path=tmp_path, function=print))
+
+    runner = AsyncTaskRunner(max_concurrency=1)
+    runner.start()
+    try:
+        runner.submit(task, _double(2))
+        assert runner.is_full() or runner.is_complete(task)
+        for future in runner.futures():
+            future.result()
+        assert runner.is_complete(task)
+        assert runner.result(task) == 4
+        assert not runner.is_full()
+    finally:
+        runner.stop()
+    assert not runner.is_started
+
+
+_SOURCE = """
+import asyncio
+import time
+from pathlib import Path
+from typing_extensions import Annotated
+
+async def task_first() -> Annotated[str, Path("first.txt")]:
+    start = time.time()
+    await asyncio.sleep(0.5)
+    return f"{start} {time.time()}"
+
+async def task_second() -> Annotated[str, Path("second.txt")]:
+    start = time.time()
+    await asyncio.sleep(0.5)
+    return f"{start} {time.time()}"
+
+def task_combine(
+    first: Path = Path("first.txt"), second: Path = Path("second.txt")
+) -> Annotated[str, Path("combined.txt")]:
+    return first.read_text() + " " + second.read_text()
+"""
+
+
+@pytest.mark.end_to_end()
+@pytest.mark.parametrize(
+    ("args", "overlapping"), [([], True), (["--max-async-tasks", "1"], False)]
+)
+def test_execute_async_tasks_concurrently(runner, tmp_path, args, overlapping):
+    tmp_path.joinpath("task_example.py").write_text(textwrap.dedent(_SOURCE))
+
+    result = runner.invoke(cli, [tmp_path.as_posix(), *args])
+    assert result.exit_code == ExitCode.OK
+    assert "3  Succeeded" in result.output
+
+    times = [float(x) for x in tmp_path.joinpath("combined.txt").read_text().split()]
+    first, second = sorted([times[:2], times[2:]])
+    assert (second[0] < first[1]) is overlapping
+
+    result = runner.invoke(cli, [tmp_path.as_posix()])
+    assert result.exit_code == ExitCode.OK
+    assert "3  Skipped because unchanged" in result.output
+
+
+@pytest.mark.end_to_end()
+def test_report_failing_async_task(runner, tmp_path):
+    source = """
+    from pathlib import Path
+    from typing_extensions import Annotated
+
+    async def task_fail() -> Annotated[str, Path("out.txt")]:
+        raise ValueError("async error")
+
+    def task_use(path: Path = Path("out.txt")) -> Annotated[str, Path("used.txt")]:
+        return path.read_text()
+    """
+    tmp_path.joinpath("task_example.py").write_text(textwrap.dedent(source))
+
+    result = runner.invoke(cli, [tmp_path.as_posix()])
+    assert result.exit_code == ExitCode.FAILED
+    assert "Task task_example.py::task_fail failed" in result.output
+    assert "async error" in result.output
+    assert "1  Skipped because previous failed" in result.output
+
+
+@pytest.mark.end_to_end()
+def test_output_of_async_tasks_is_not_captured(runner, tmp_path):
+    source = """
+    import asyncio
+
+    async def task_example():
+        # Print after pytask stopped capturing the output of the submitted task.
+        await asyncio.sleep(0.5)
+        print("Output of the coroutine.")
+    """
+    tmp_path.joinpath("task_example.py").write_text(textwrap.dedent(source))
+
+    result = runner.invoke(cli, [tmp_path.as_posix()])
+
+    assert result.exit_code == ExitCode.OK
+    assert "Output of the coroutine." in result.output
+    assert "Captured stdout" not in result.output
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import subprocess
+import sys
 
 import pytest
 from pytask import ExitCode
@@ -26,6 +27,8 @@ def test_version_option():
         ("dag",),
         ("markers",),
         ("profile",),
+        ("serve",),
+        ("watch",),
     ],
 )
 def test_help_pages(runner, commands, help_option):
@@ -45,3 +48,34 @@ def test_help_texts_are_modified_by_config(runner, tmp_path):
     )
 
     assert "[default: stdout]" in result.output
+
+
+@pytest.mark.end_to_end()
+def test_import_pytask_does_not_import_heavy_dependencies():
+    code = (
+        "import sys; import pytask; "
+        "print(','.join(m for m in ('sqlalchemy', 'networkx', 'upath', 'rich') "
+        "if m in sys.modules))"
+    )
+    process = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, check=True
+    )
+    assert process.stdout.decode().strip() == ""
+
+
+@pytest.mark.end_to_end()
+def test_import_time_of_pytask():
+    process = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import pytask"],
+        capture_output=True,
+        check=True,
+    )
+    lines = process.stderr.decode().splitlines()
+    cumulative = next(
+        int(line.split("|")[1])
+        for line in lines
+        if line.split("|")[-1].strip() == "pytask"
+    )
+    # The budget in microseconds is generous to avoid flaky failures on slow CI
+    # runners. Importing all submodules eagerly takes about a second.
+    assert cumulative < 250_000
@@ -10,7 +10,9 @@ from _pytask.dag_utils import _extract_priorities_from_tasks
 from _pytask.dag_utils import descending_tasks
 from _pytask.dag_utils import node_and_neighbors
 from _pytask.dag_utils import task_and_descending_tasks
+from _pytask.dag_utils import tasks_and_preceding_tasks
 from pytask import Mark
+from pytask import PathNode
 from pytask import Task
 
 
@@ -66,6 +68,18 @@ def test_task_and_descending_tasks(dag):
         assert descendant_names == [f".::{i}" for i in range(i, 5)]
 
 
+@pytest.mark.unit()
+def test_tasks_and_preceding_tasks(dag):
+    signatures = {dag.nodes[sig]["task"].name: sig for sig in dag.nodes}
+    node = PathNode.from_path(Path("in.txt").resolve())
+    dag.add_node(node.signature, node=node)
+    dag.add_edge(node.signature, signatures[".::0"])
+
+    tasks = tasks_and_preceding_tasks([signatures[".::1"], signatures[".::3"]], dag)
+    assert tasks == {signatures[f".::{i}"] for i in range(4)}
+    assert tasks_and_preceding_tasks([], dag) == set()
+
+
 @pytest.mark.unit()
 def test_node_and_neighbors(dag):
     for i in range(1, 4):
@@ -170,6 +184,18 @@ def test_ask_for_invalid_number_of_ready_tasks(dag):
         scheduler.get_ready(0)
 
 
+@pytest.mark.unit()
+def test_peek_ready_tasks(dag):
+    scheduler = TopologicalSorter.from_dag(dag)
+    assert scheduler.peek_ready() == scheduler.peek_ready()
+
+    task_name = scheduler.get_ready()[0]
+    assert scheduler.peek_ready() == []
+
+    scheduler.done(task_name)
+    assert scheduler.peek_ready() == scheduler.get_ready()
+
+
 @pytest.mark.unit()
 def test_instantiate_sorter_from_other_sorter(dag):
     name_to_sig = {dag.nodes[sig]["task"].name: sig for sig in dag.nodes}
@@ -1,10 +1,12 @@
 from __future__ import annotations
 
+import pickle
 import sys
 import textwrap
 from pathlib import Path
 
 import pytest
+from _pytask.data_catalog_utils import MANIFEST_NAME
 from pytask import DataCatalog
 from pytask import ExitCode
 from pytask import PathNode
@@ -186,6 +188,7 @@ def test_use_data_catalog_with_different_path(runner, tmp_path):
     result = runner.invoke(cli, [tmp_path.as_posix()])
     assert result.exit_code == ExitCode.OK
     assert len(list(tmp_path.joinpath(".data").iterdir())) == 2
+    assert list(DataCatalog(path=tmp_path / ".data")) == ["new_content"]
 
 
 @pytest.mark.unit()
@@ -234,3 +237,41 @@ def test_use_data_catalog_with_provisional_node(runner, tmp_path):
     result = runner.invoke(cli, [tmp_path.as_posix()])
     assert result.exit_code == ExitCode.OK
     assert tmp_path.joinpath("output.txt").read_text() == "Hello, World!"
+
+
+@pytest.mark.unit()
+def test_persisted_entries_are_loaded_lazily(tmp_path):
+    data_catalog = DataCatalog(path=tmp_path)
+    node = data_catalog["node"]
+    data_catalog._manifest.flush()
+
+    new_data_catalog = DataCatalog(path=tmp_path)
+    assert new_data_catalog.entries == {}
+    assert "node" in new_data_catalog
+    assert list(new_data_catalog) == ["node"]
+    assert new_data_catalog["node"] == node
+    assert list(tmp_path.iterdir()) == [tmp_path / MANIFEST_NAME]
+
+
+@pytest.mark.unit()
+def test_new_entries_are_written_in_batches(tmp_path):
+    data_catalog = DataCatalog(path=tmp_path)
+    data_catalog._manifest.batch_size = 3
+
+    data_catalog["a"]
+    data_catalog["b"]
+    assert list(DataCatalog(path=tmp_path)) == []
+
+    data_catalog["c"]
+    assert list(DataCatalog(path=tmp_path)) == ["a", "b", "c"]
+
+
+@pytest.mark.unit()
+def test_move_node_files_of_previous_versions_into_manifest(tmp_path):
+    node = PickleNode(name="node", path=tmp_path / "node.pkl")
+    tmp_path.joinpath("abc-node.pkl").write_bytes(pickle.dumps(node))
+
+    data_catalog = DataCatalog(path=tmp_path)
+
+    assert data_catalog["node"] == node
+    assert not tmp_path.joinpath("abc-node.pkl").exists()
@@ -2,10 +2,15 @@ from __future__ import annotations
 
 import textwrap
 
+import networkx as nx
 import pytest
+from _pytask.database_utils import update_states_in_database
 from pytask import DatabaseSession
 from pytask import ExitCode
+from pytask import PathNode
+from pytask import Session
 from pytask import State
+from pytask import Task
 from pytask import build
 from pytask import cli
 from pytask import create_database
@@ -74,3 +79,23 @@ def test_rename_database_w_cli(tmp_path, runner):
     )
     assert result.exit_code == ExitCode.OK
     assert path_to_db.exists()
+
+
+@pytest.mark.unit()
+def test_update_states_skips_nodes_without_state(tmp_path):
+    create_database(make_url("sqlite:///" + tmp_path.joinpath("db.sqlite3").as_posix()))
+    task = Task(
+        base_name="task_example", path=tmp_path / "task_example.py", function=None
+    )
+    tmp_path.joinpath("task_example.py").touch()
+    missing = PathNode(name="missing", path=tmp_path / "missing.txt")
+
+    dag = nx.DiGraph()
+    dag.add_node(task.signature, task=task)
+    dag.add_node(missing.signature, node=missing)
+    dag.add_edge(task.signature, missing.signature)
+    update_states_in_database(Session(dag=dag), task.signature)
+
+    with DatabaseSession() as db_session:
+        assert db_session.get(State, (task.signature, task.signature)) is not None
+        assert db_session.get(State, (task.signature, missing.signature)) is None
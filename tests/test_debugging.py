@@ -372,7 +372,11 @@ def test_pdb_with_injected_do_debug(tmp_path):
 
     child = pexpect.spawn(
         f"pytask --pdbcls=task_module:CustomPdb {tmp_path.as_posix()}",
-        env={"PATH": os.environ["PATH"], "PYTHONPATH": f"{tmp_path.as_posix()}"},
+        env={
+            "PATH": os.environ["PATH"],
+            "PYTHONPATH": f"{tmp_path.as_posix()}",
+            "XDG_CACHE_HOME": os.environ["XDG_CACHE_HOME"],
+        },
     )
 
     child.expect(["PDB", "set_trace", r"\(IO-capturing", "turned", r"off\)"])
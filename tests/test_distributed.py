@@ -0,0 +1,208 @@
+from __future__ import annotations
+
+import os
+import socket
+import subprocess
+import sys
+import textwrap
+import threading
+from multiprocessing import Pipe
+from multiprocessing.connection import Client
+
+import pytest
+from _pytask.distributed_utils import AUTHKEY_VARIABLE
+from _pytask.distributed_utils import get_authkey
+from _pytask.distributed_utils import parse_address
+from _pytask.exceptions import WorkerError
+from _pytask.worker_pool_utils import WorkerPool
+from _pytask.worker_pool_utils import serve_tasks
+from pytask import ExitCode
+from pytask import Task
+from pytask import cli
+
+
+def _get_free_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+@pytest.mark.unit()
+@pytest.mark.parametrize(
+    ("address", "expected"),
+    [
+        ("localhost:5000", ("localhost", 5000)),
+        ("10.0.0.1:80", ("10.0.0.1", 80)),
+        ("[::1]:5000", ("::1", 5000)),
+    ],
+)
+def test_parse_address(address, expected):
+    assert parse_address(address) == expected
+
+
+@pytest.mark.unit()
+@pytest.mark.parametrize("address", ["localhost", ":5000", "localhost:port"])
+def test_parse_invalid_address(address):
+    with pytest.raises(ValueError, match="Cannot parse the address"):
+        parse_address(address)
+
+
+@pytest.mark.unit()
+def test_get_authkey(monkeypatch):
+    monkeypatch.delenv(AUTHKEY_VARIABLE, raising=False)
+    with pytest.raises(ValueError, match=AUTHKEY_VARIABLE):
+        get_authkey()
+
+    monkeypatch.setenv(AUTHKEY_VARIABLE, "secret")
+    assert get_authkey() == b"secret"
+
+
+def _double(x):
+    return 2 * x
+
+
+def _execute(task, payload):
+    return task.function(payload)
+
+
+def _connect_worker(address, authkey, tasks, max_tasks=0):
+    def _run():
+        with Client(address, family="AF_INET", authkey=authkey) as connection:
+            serve_tasks(connection, tasks, _execute, max_tasks=max_tasks)
+
+    thread = threading.Thread(target=_run, daemon=True)
+    thread.start()
+    return thread
+
+
+@pytest.mark.unit()
+def test_execute_tasks_in_remote_workers(tmp_path):
+    task = Task(base_name="task_double", path=tmp_path, function=_double)
+    tasks = {task.signature: task}
+    address = ("127.0.0.1", _get_free_port())
+
+    pool = WorkerPool()
+    pool.listen(address, b"secret")
+    pool.start(tasks=tasks, function=_execute)
+    try:
+        # Tasks wait in the queue until a worker connects.
+        pool.submit(task, 2)
+        assert pool.is_full()
+
+        # A worker which disconnects after it received a task loses the task. The
+        # task is executed by the next worker.
+        with Client(address, family="AF_INET", authkey=b"secret") as connection:
+            connection.recv()
+        _connect_worker(address, b"secret", tasks)
+
+        for future in pool.futures():
+            future.result()
+        assert pool.result(task) == 4
+    finally:
+        pool.stop()
+    assert not pool.is_started
+
+
+@pytest.mark.unit()
+def test_results_which_cannot_be_pickled_are_sent_as_errors(tmp_path):
+    task = Task(base_name="task_lambda", path=tmp_path, function=lambda x: lambda: x)
+    coordinator, worker = Pipe()
+    thread = threading.Thread(
+        target=serve_tasks, args=(worker, {task.signature: task}, _execute)
+    )
+    thread.start()
+
+    coordinator.send((task.signature, 1))
+    is_success, (error, _), _ = coordinator.recv()
+    coordinator.close()
+    thread.join()
+
+    assert not is_success
+    assert isinstance(error, WorkerError)
+    assert "cannot be sent" in str(error)
+
+
+_SOURCE = """
+import os
+from pathlib import Path
+from typing_extensions import Annotated
+from pytask import Product
+from pytask import PythonNode
+
+node = PythonNode(name="pid")
+
+def task_first(path: Annotated[Path, Product] = Path("first.txt")) -> None:
+    path.write_text(str(os.getpid()))
+
+def task_second(path: Path = Path("first.txt")) -> Annotated[int, node]:
+    return os.getpid()
+
+def task_third(
+    pid: Annotated[int, node], path: Annotated[Path, Product] = Path("third.txt")
+) -> None:
+    path.write_text(f"{pid} {os.getpid()}")
+
+def task_fail():
+    print("Output of the failing task.")
+    raise ValueError("Failed in the worker.")
+"""
+
+
+@pytest.mark.end_to_end()
+def test_execute_tasks_in_workers_on_localhost(runner, tmp_path, monkeypatch):
+    tmp_path.joinpath("task_example.py").write_text(textwrap.dedent(_SOURCE))
+    monkeypatch.setenv(AUTHKEY_VARIABLE, "secret")
+    address = f"127.0.0.1:{_get_free_port()}"
+
+    workers = [
+        subprocess.Popen(
+            [
+                sys.executable,
+                "-m",
+                "pytask",
+                "worker",
+                "--connect",
+                address,
+                tmp_path.as_posix(),
+            ],
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+            env={**os.environ, AUTHKEY_VARIABLE: "secret"},
+        )
+        for _ in range(2)
+    ]
+    try:
+        result = runner.invoke(cli, [tmp_path.as_posix(), "--coordinator", address])
+        outputs = [worker.communicate(timeout=60)[0].decode() for worker in workers]
+    finally:
+        for worker in workers:
+            worker.kill()
+
+    assert result.exit_code == ExitCode.FAILED
+    assert "3  Succeeded" in result.output
+    assert "ValueError: Failed in the worker." in result.output
+    assert "Output of the failing task." in result.output
+
+    pids = {worker.pid for worker in workers}
+    first = int(tmp_path.joinpath("first.txt").read_text())
+    second, third = map(int, tmp_path.joinpath("third.txt").read_text().split())
+    assert {first, second, third} <= pids
+    assert all(worker.returncode == 0 for worker in workers)
+    assert all("Connected to the coordinator" in output for output in outputs)
+
+    # The coordinator records the states in the database.
+    result = runner.invoke(cli, [tmp_path.as_posix(), "-k", "not fail"])
+    assert result.exit_code == ExitCode.OK
+    assert "3  Skipped because unchanged" in result.output
+
+
+@pytest.mark.end_to_end()
+def test_coordinator_requires_authkey(runner, tmp_path, monkeypatch):
+    monkeypatch.delenv(AUTHKEY_VARIABLE, raising=False)
+    tmp_path.joinpath("task_example.py").write_text("def task_example(): pass")
+
+    result = runner.invoke(
+        cli, [tmp_path.as_posix(), "--coordinator", "127.0.0.1:5000"]
+    )
+    assert result.exit_code == ExitCode.CONFIGURATION_FAILED
+    assert AUTHKEY_VARIABLE in result.output
@@ -1144,3 +1144,82 @@ def test_use_provisional_node_as_product_in_generator_without_rerun(runner, tmp_
     assert "3  Collected task" in result.output
     assert "1  Succeeded" in result.output
     assert "2  Skipped because unchanged" in result.output
+
+
+@pytest.mark.end_to_end()
+def test_tasks_load_selected_columns_of_parquet_nodes(runner, tmp_path):
+    pytest.importorskip("pyarrow")
+    source = """
+    from pathlib import Path
+    from typing import Any
+    from typing_extensions import Annotated
+    from pytask import ParquetNode, Product
+
+    path = Path(__file__).parent / "table.parquet"
+
+    def task_create() -> Annotated[Any, ParquetNode(path=path)]:
+        return {"a": [1, 2, 3], "b": ["x", "y", "z"]}
+
+    def task_select(
+        table: Annotated[Any, ParquetNode(path=path, columns=["b"])],
+        produces: Annotated[Path, Product] = Path("out.txt"),
+    ) -> None:
+        produces.write_text(" ".join(table.column_names + table["b"].to_pylist()))
+    """
+    tmp_path.joinpath("task_module.py").write_text(textwrap.dedent(source))
+
+    result = runner.invoke(cli, [tmp_path.as_posix()])
+
+    assert result.exit_code == ExitCode.OK
+    assert tmp_path.joinpath("out.txt").read_text() == "b x y z"
+
+
+@pytest.mark.end_to_end()
+@pytest.mark.parametrize(
+    "args", [[], ["--write-behind", "1"], ["--worker-processes", "1"]]
+)
+def test_plugins_wrap_protocol_of_pending_tasks(tmp_path, args):
+    hooks = """
+    from pathlib import Path
+    from pytask import PendingReport, hookimpl
+
+    @hookimpl(wrapper=True)
+    def pytask_execute_task_protocol(task):
+        report = yield
+        if isinstance(report, PendingReport):
+            outcome = "pending"
+        else:
+            outcome = report.outcome.name
+        with Path(__file__).parent.joinpath("protocol.txt").open("a") as f:
+            f.write(f"{task.base_name} {outcome}\\n")
+        return report
+    """
+    source = """
+    from pathlib import Path
+    from typing_extensions import Annotated
+
+    async def task_first() -> Annotated[str, Path("first.txt")]:
+        return "first"
+
+    def task_second(path: Path = Path("first.txt")) -> Annotated[str, Path("out.txt")]:
+        return path.read_text()
+    """
+    tmp_path.joinpath("hooks.py").write_text(textwrap.dedent(hooks))
+    tmp_path.joinpath("task_example.py").write_text(textwrap.dedent(source))
+
+    result = subprocess.run(
+        ("pytask", "--hook-module", "hooks.py", *args),
+        cwd=tmp_path,
+        capture_output=True,
+        check=False,
+    )
+
+    assert result.returncode == ExitCode.OK
+    assert tmp_path.joinpath("out.txt").read_text() == "first"
+    protocol = tmp_path.joinpath("protocol.txt").read_text().splitlines()
+    # Pending tasks are finished by calling the protocol again, and tasks whose
+    # products are written in the background might be pending again.
+    finished = protocol.index("task_first SUCCESS")
+    assert protocol[0] == "task_first pending"
+    assert set(protocol[:finished]) == {"task_first pending"}
+    assert protocol[-1] == "task_second SUCCESS"
@@ -0,0 +1,158 @@
+from __future__ import annotations
+
+import textwrap
+
+import pytest
+from _pytask.fusion_utils import find_fused_nodes
+from pytask import ExitCode
+from pytask import build
+from pytask import cli
+
+
+@pytest.mark.end_to_end()
+def test_fused_tasks_hand_over_values_in_memory(runner, tmp_path):
+    source = """
+    from pathlib import Path
+    from typing_extensions import Annotated
+    import pytask
+    from pytask import PickleNode
+
+    VALUES = {}
+    LOG = Path(__file__).parent / "log.txt"
+
+    def _log(name):
+        with LOG.open("a") as f:
+            f.write(name + "\\n")
+
+    @pytask.mark.fuse
+    def task_a() -> Annotated[list, PickleNode(path=Path("a.pkl"))]:
+        _log("a")
+        VALUES["a"] = [1, 2, 3]
+        return VALUES["a"]
+
+    @pytask.mark.fuse
+    def task_b(
+        a: Annotated[list, PickleNode(path=Path("a.pkl"))]
+    ) -> Annotated[list, PickleNode(path=Path("b.pkl"))]:
+        _log("b")
+        assert a is VALUES["a"]
+        return [*a, 4]
+
+    @pytask.mark.try_first
+    def task_other(path: Path = Path("in.txt")) -> None:
+        _log("other")
+
+    def task_c(b: Annotated[list, PickleNode(path=Path("b.pkl"))]) -> None:
+        _log("c")
+        assert b == [1, 2, 3, 4]
+    """
+    tmp_path.joinpath("task_example.py").write_text(textwrap.dedent(source))
+    tmp_path.joinpath("in.txt").touch()
+
+    result = runner.invoke(cli, [tmp_path.as_posix()])
+    assert result.exit_code == ExitCode.OK
+    log = tmp_path.joinpath("log.txt").read_text().split()
+    assert log.index("b") == log.index("a") + 1
+    assert tmp_path.joinpath("a.pkl").exists()
+
+    # States are recorded and unchanged tasks are skipped.
+    result = runner.invoke(cli, [tmp_path.as_posix()])
+    assert result.exit_code == ExitCode.OK
+    assert "4  Skipped because unchanged" in result.output
+
+
+@pytest.mark.end_to_end()
+def test_find_fused_nodes_with_single_consumers(tmp_path):
+    source = """
+    from pathlib import Path
+    from typing_extensions import Annotated
+    import pytask
+    from pytask import PickleNode, PythonNode
+
+    @pytask.mark.fuse
+    def task_a() -> Annotated[list, PickleNode(path=Path("a.pkl"))]:
+        return [1]
+
+    @pytask.mark.fuse
+    def task_b(
+        a: Annotated[list, PickleNode(path=Path("a.pkl"))]
+    ) -> Annotated[list, PickleNode(path=Path("b.pkl"))]:
+        return a
+
+    @pytask.mark.fuse
+    def task_c(b: Annotated[list, PickleNode(path=Path("b.pkl"))]) -> None: ...
+
+    def task_d(b: Annotated[list, PickleNode(path=Path("b.pkl"))]) -> None: ...
+    """
+    tmp_path.joinpath("task_example.py").write_text(textwrap.dedent(source))
+
+    session = build(paths=tmp_path, dry_run=True)
+
+    tasks = {task.base_name: task for task in session.tasks}
+    products = {
+        task.base_name: task.produces["return"].signature
+        for task in session.tasks
+        if "return" in task.produces
+    }
+    assert find_fused_nodes(session.dag) == {
+        products["task_a"]: tasks["task_b"].signature
+    }
+
+
+@pytest.mark.end_to_end()
+def test_fused_tasks_load_path_nodes(runner, tmp_path):
+    source = """
+    from pathlib import Path
+    from typing_extensions import Annotated
+    import pytask
+    from pytask import PathNode, Product
+
+    @pytask.mark.fuse
+    def task_a() -> Annotated[str, PathNode(path=Path("a.txt"))]:
+        return "a"
+
+    @pytask.mark.fuse
+    def task_b(
+        path: Annotated[Path, PathNode(path=Path("a.txt"))],
+        produces: Annotated[Path, Product] = Path("b.txt"),
+    ) -> None:
+        produces.write_text(path.read_text() + "b")
+    """
+    tmp_path.joinpath("task_example.py").write_text(textwrap.dedent(source))
+
+    result = runner.invoke(cli, [tmp_path.as_posix()])
+
+    assert result.exit_code == ExitCode.OK
+    assert tmp_path.joinpath("b.txt").read_text() == "ab"
+
+
+@pytest.mark.end_to_end()
+def test_fused_tasks_load_parquet_nodes(runner, tmp_path):
+    pytest.importorskip("pyarrow")
+    source = """
+    from pathlib import Path
+    from typing import Any
+    from typing_extensions import Annotated
+    import pytask
+    from pytask import ParquetNode, Product
+
+    @pytask.mark.fuse
+    def task_a() -> Annotated[Any, ParquetNode(path=Path("a.parquet"))]:
+        return {"a": [1, 2, 3], "b": ["x", "y", "z"]}
+
+    @pytask.mark.fuse
+    def task_b(
+        scanner: Annotated[
+            Any, ParquetNode(path=Path("a.parquet"), columns=["b"], lazy=True)
+        ],
+        produces: Annotated[Path, Product] = Path("b.txt"),
+    ) -> None:
+        table = scanner.to_table()
+        produces.write_text(" ".join(table.column_names + table["b"].to_pylist()))
+    """
+    tmp_path.joinpath("task_example.py").write_text(textwrap.dedent(source))
+
+    result = runner.invoke(cli, [tmp_path.as_posix()])
+
+    assert result.exit_code == ExitCode.OK
+    assert tmp_path.joinpath("b.txt").read_text() == "b x y z"
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import subprocess
+import textwrap
 from pathlib import Path
 
 import pytest
@@ -49,3 +51,45 @@ def test_ignore_paths(tmp_path, ignore, new_line):
 def test_pytask_ignore_collect(path, ignored_paths, expected):
     is_ignored = pytask_ignore_collect(path, {"ignore": ignored_paths})
     assert is_ignored == expected
+
+
+@pytest.mark.end_to_end()
+def test_ignore_nested_folders_and_files(tmp_path):
+    tmp_path.joinpath("data", "raw", ".git").mkdir(parents=True)
+    tmp_path.joinpath("data", "raw", ".git", "task_module.py").write_text(
+        "def task_a(): pass"
+    )
+    tmp_path.joinpath("data", "raw", "task_module.py").write_text("def task_b(): pass")
+    tmp_path.joinpath("data", "ignored").mkdir()
+    tmp_path.joinpath("data", "ignored", "task_module.py").write_text(
+        "def task_c(): pass"
+    )
+
+    session = build(paths=tmp_path, ignore=["ignored"])
+    assert session.exit_code == ExitCode.OK
+    assert [task.base_name for task in session.tasks] == ["task_b"]
+
+
+@pytest.mark.end_to_end()
+def test_ignore_collect_hook_of_plugins_is_called(tmp_path):
+    hooks = """
+    from pytask import hookimpl
+
+    @hookimpl(tryfirst=True)
+    def pytask_ignore_collect(path):
+        if path.name == "task_ignored.py":
+            return True
+        return None
+    """
+    tmp_path.joinpath("hooks.py").write_text(textwrap.dedent(hooks))
+    tmp_path.joinpath("task_ignored.py").write_text("def task_a(): pass")
+    tmp_path.joinpath("task_module.py").write_text("def task_b(): pass")
+
+    result = subprocess.run(
+        ("pytask", "--hook-module", "hooks.py"),
+        cwd=tmp_path,
+        capture_output=True,
+        check=False,
+    )
+    assert result.returncode == ExitCode.OK
+    assert "Collected 1 task." in result.stdout.decode()
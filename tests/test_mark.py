@@ -5,8 +5,10 @@ import textwrap
 
 import pytask
 import pytest
+from _pytask.mark import KeywordIndex
 from pytask import ExitCode
 from pytask import MarkGenerator
+from pytask import Task
 from pytask import build
 from pytask import cli
 
@@ -241,6 +243,25 @@ def test_keyword_option_wrong_arguments(
     ) or expected_error in captured.out.replace("\n", "")
 
 
+@pytest.mark.unit()
+def test_keyword_index_matches_substrings_of_keywords(tmp_path):
+    def function(): ...
+
+    function.custom_keyword = True
+
+    tasks = [
+        Task(base_name="task_first", path=tmp_path / "task_a.py", function=function),
+        Task(base_name="task_second", path=tmp_path / "task_b.py", function=lambda: 0),
+    ]
+    index = KeywordIndex.from_tasks(tasks)
+
+    assert index("FIRST") == {tasks[0].signature}
+    assert index("task") == {tasks[0].signature, tasks[1].signature}
+    assert index("task_b.py::") == {tasks[1].signature}
+    assert index("custom") == {tasks[0].signature}
+    assert index("third") == set()
+
+
 @pytest.mark.end_to_end()
 def test_configuration_failed(runner, tmp_path):
     result = runner.invoke(
@@ -327,6 +348,35 @@ def test_selecting_task_with_marker_ignores_other_task(runner, tmp_path):
     assert "Warnings" in result.output
 
 
+@pytest.mark.end_to_end()
+def test_deselected_tasks_are_recorded_in_session(tmp_path):
+    source = """
+    import pytask
+    from pathlib import Path
+    from typing_extensions import Annotated
+
+    def task_first(path: Annotated[Path, pytask.Product] = Path("first.txt")):
+        path.touch()
+
+    @pytask.mark.wip
+    def task_second(path: Path = Path("first.txt")): ...
+
+    def task_third(path: Path = Path("first.txt")): ...
+    """
+    tmp_path.joinpath("task_module.py").write_text(textwrap.dedent(source))
+
+    session = build(paths=tmp_path, marker_expression="wip")
+
+    assert session.exit_code == ExitCode.OK
+    assert {
+        session.dag.nodes[signature]["task"].base_name
+        for signature in session.deselected
+    } == {"task_third"}
+    assert not any(
+        task.markers for task in session.tasks if task.base_name != "task_second"
+    )
+
+
 @pytest.mark.end_to_end()
 def test_selecting_task_with_unknown_marker_raises_warning(runner, tmp_path):
     source = """
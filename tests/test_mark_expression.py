@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import itertools
 from typing import Callable
 
 import pytest
@@ -204,3 +205,33 @@ def test_backslash_not_treated_specially() -> None:
     assert not evaluate(r"foo", matcher)
     with pytest.raises(ParseError):
         evaluate("\nfoo\n", matcher)
+
+
+@pytest.mark.unit()
+@pytest.mark.parametrize(
+    "expr",
+    [
+        "",
+        "a",
+        "not a",
+        "a and b",
+        "a or b",
+        "not (a or b) and c",
+        "a or not (b and c)",
+        "not not c",
+    ],
+)
+def test_select_agrees_with_evaluate(expr: str) -> None:
+    universe = {
+        frozenset(name for name, is_set in zip("abc", bits) if is_set)
+        for bits in itertools.product([False, True], repeat=3)
+    }
+    expression = Expression.compile_(expr)
+
+    selected = expression.select(
+        universe, lambda ident: {item for item in universe if ident in item}
+    )
+
+    assert selected == {
+        item for item in universe if expression.evaluate(item.__contains__)
+    }
@@ -0,0 +1,110 @@
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Any
+
+import pytest
+from _pytask.node_utils import get_batched_states
+from _pytask.node_utils import get_states
+from _pytask.node_utils import load_values
+from attrs import define
+from pytask import ExitCode
+from pytask import PathNode
+from pytask import Product
+from pytask import PythonNode
+from pytask import build
+from typing_extensions import Annotated
+
+CALLS: list[tuple[str, tuple[str, ...]]] = []
+
+
+@define
+class BatchNode:
+    name: str
+    value: str = ""
+
+    @property
+    def signature(self) -> str:
+        return self.name
+
+    def state(self) -> str | None:
+        CALLS.append(("state", (self.name,)))
+        return self.value
+
+    def load(self, is_product: bool = False) -> Any:  # noqa: ARG002
+        CALLS.append(("load", (self.name,)))
+        return self.value
+
+    def save(self, value: Any) -> None:
+        self.value = value
+
+    @classmethod
+    def state_many(cls, nodes: list[BatchNode]) -> list[str | None]:
+        CALLS.append(("state_many", tuple(node.name for node in nodes)))
+        return [node.value for node in nodes]
+
+    @classmethod
+    def load_many(cls, nodes: list[BatchNode], is_product: bool) -> list[Any]:  # noqa: ARG003
+        CALLS.append(("load_many", tuple(node.name for node in nodes)))
+        return [node.value for node in nodes]
+
+
+@pytest.fixture(autouse=True)
+def _clear_calls():
+    CALLS.clear()
+
+
+@pytest.mark.unit()
+def test_get_batched_states_skips_local_paths(tmp_path):
+    path = tmp_path / "in.txt"
+    path.touch()
+    nodes = [BatchNode("a", "1"), PathNode.from_path(path)]
+
+    assert get_batched_states(nodes) == {"a": "1"}
+
+
+@pytest.mark.unit()
+def test_get_states_groups_nodes_by_type():
+    nodes = [BatchNode("a", "1"), PythonNode(name="b", value=1), BatchNode("c", "2")]
+    states = get_states(nodes)
+
+    assert states == {"a": "1", nodes[1].signature: nodes[1].state(), "c": "2"}
+    assert CALLS == [("state_many", ("a", "c"))]
+
+
+@pytest.mark.unit()
+def test_load_values_falls_back_to_load():
+    nodes = [BatchNode("a", "1"), PythonNode(name="b", value=2)]
+    values = load_values(nodes)
+
+    assert values == {id(nodes[0]): "1", id(nodes[1]): 2}
+    assert CALLS == [("load_many", ("a",))]
+
+
+@pytest.mark.unit()
+def test_batch_method_must_return_one_value_per_node():
+    class BrokenNode(BatchNode):
+        @classmethod
+        def state_many(cls, nodes: list[BatchNode]) -> list[str | None]:  # noqa: ARG003
+            return []
+
+    with pytest.raises(ValueError, match="returned 0 values for 1 nodes"):
+        get_states([BrokenNode("a")])
+
+
+@pytest.mark.end_to_end()
+def test_execution_uses_batch_methods(tmp_path):
+    def task_example(
+        first: str = BatchNode("first", "a"),  # type: ignore[assignment]
+        second: str = BatchNode("second", "b"),  # type: ignore[assignment]
+        path: Annotated[Path, Product] = tmp_path / "out.txt",
+    ) -> None:
+        path.write_text(first + second)
+
+    session = build(tasks=[task_example], paths=tmp_path)
+
+    assert session.exit_code == ExitCode.OK
+    assert tmp_path.joinpath("out.txt").read_text() == "ab"
+    assert ("load_many", ("first", "second")) in CALLS
+    assert ("state_many", ("first", "second")) in CALLS
+    assert not [call for call in CALLS if call[0] in ("load", "state")]
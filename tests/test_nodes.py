@@ -4,7 +4,9 @@ import pickle
 from pathlib import Path
 
 import pytest
+from pytask import ArrayNode
 from pytask import NodeInfo
+from pytask import ParquetNode
 from pytask import PathNode
 from pytask import PickleNode
 from pytask import PNode
@@ -121,7 +123,73 @@ def test_hash_of_pickle_node(tmp_path, value, exists, expected):
         (PythonNode, PPathNode, False),
         (PickleNode, PNode, True),
         (PickleNode, PPathNode, True),
+        (ArrayNode, PNode, True),
+        (ArrayNode, PPathNode, True),
+        (ParquetNode, PNode, True),
+        (ParquetNode, PPathNode, True),
     ],
 )
 def test_comply_with_protocol(node, protocol, expected):
     assert isinstance(node, protocol) is expected
+
+
+@pytest.mark.unit()
+def test_array_node_loads_memory_mapped_arrays(tmp_path):
+    np = pytest.importorskip("numpy")
+    node = ArrayNode.from_path(tmp_path / "array.npy")
+    assert node.state() is None
+
+    node.save(np.arange(12).reshape(3, 4))
+
+    assert node.state() is not None
+    assert node.load(is_product=True) is node
+    array = node.load()
+    assert isinstance(array, np.memmap)
+    assert not array.flags.writeable
+    assert array[1].tolist() == [4, 5, 6, 7]
+
+    array = ArrayNode(path=node.path, mmap_mode=None).load()
+    assert not isinstance(array, np.memmap)
+    assert array.sum() == 66
+
+
+@pytest.mark.unit()
+def test_array_node_save_does_not_change_mapped_arrays(tmp_path):
+    np = pytest.importorskip("numpy")
+    node = ArrayNode.from_path(tmp_path / "array.npy")
+    node.save(np.zeros(4))
+    array = node.load()
+
+    node.save(np.ones(4)[::2])
+
+    assert array.tolist() == [0, 0, 0, 0]
+    assert node.load().tolist() == [1, 1]
+    assert [path.name for path in tmp_path.iterdir()] == ["array.npy"]
+
+
+@pytest.mark.unit()
+def test_parquet_node_loads_selected_columns_and_rows(tmp_path):
+    pytest.importorskip("pyarrow")
+    import pyarrow.dataset as ds
+    import pyarrow.parquet as pq
+
+    node = ParquetNode.from_path(tmp_path / "table.parquet")
+    assert node.state() is None
+
+    node.save({"a": [1, 2, 3], "b": ["x", "y", "z"]})
+
+    assert node.state() is not None
+    assert node.load(is_product=True) is node
+    assert node.load().column_names == ["a", "b"]
+    metadata = pq.ParquetFile(node.path).metadata
+    assert metadata.row_group(0).column(0).compression == "ZSTD"
+
+    node = ParquetNode(path=node.path, columns=["a"], filters=[("a", ">=", 2)])
+    assert node.load().to_pydict() == {"a": [2, 3]}
+
+    node = ParquetNode(
+        path=node.path, columns=["b"], filters=[("a", "<", 2)], lazy=True
+    )
+    scanner = node.load()
+    assert isinstance(scanner, ds.Scanner)
+    assert scanner.to_table().to_pydict() == {"b": ["x"]}
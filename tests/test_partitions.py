@@ -0,0 +1,100 @@
+from __future__ import annotations
+
+import textwrap
+
+import pytest
+from pytask import ExitCode
+from pytask import PartitionedNode
+from pytask import cli
+
+
+@pytest.mark.unit()
+def test_partition_states(tmp_path):
+    node = PartitionedNode(root_dir=tmp_path / "data", pattern="year=*")
+    assert node.state() is None
+
+    tmp_path.joinpath("data", "year=2023").mkdir(parents=True)
+    tmp_path.joinpath("data", "year=2023", "part-0.csv").write_text("a")
+    tmp_path.joinpath("data", "year=2024").mkdir()
+    tmp_path.joinpath("data", "other").mkdir()
+
+    states = node.partition_states()
+    state = node.state()
+    assert list(states) == ["year=2023", "year=2024"]
+    assert state is not None
+
+    tmp_path.joinpath("data", "year=2023", "part-1.csv").write_text("b")
+    new_states = node.partition_states()
+    assert new_states["year=2023"] != states["year=2023"]
+    assert new_states["year=2024"] == states["year=2024"]
+    assert node.state() != state
+
+    partitions = node.load()
+    assert partitions.added == partitions.paths
+    assert not partitions.is_incremental
+
+    node.previous_states = states
+    partitions = node.load()
+    assert partitions.added == []
+    assert partitions.changed == [tmp_path / "data" / "year=2023"]
+    assert partitions.is_incremental
+
+
+@pytest.mark.unit()
+def test_partitioned_node_cannot_save_return_values(tmp_path):
+    node = PartitionedNode(root_dir=tmp_path / "data")
+    with pytest.raises(TypeError, match="cannot store return values"):
+        node.save("a")
+
+
+@pytest.mark.end_to_end()
+def test_task_receives_changed_partitions(runner, tmp_path):
+    source = """
+    from pathlib import Path
+    from typing_extensions import Annotated
+    from pytask import PartitionedNode, Partitions, Product
+
+    def task_aggregate(
+        partitions: Annotated[
+            Partitions, PartitionedNode(root_dir=Path("data"), pattern="*.txt")
+        ],
+        path: Annotated[Path, Product] = Path("log.txt"),
+    ) -> None:
+        entry = [str(partitions.is_incremental)] + [
+            kind + ":" + ",".join(path.name for path in getattr(partitions, kind))
+            for kind in ("added", "changed", "removed")
+        ]
+        log = path.read_text() if partitions.is_incremental else ""
+        path.write_text(log + " ".join(entry) + "\\n")
+    """
+    tmp_path.joinpath("task_example.py").write_text(textwrap.dedent(source))
+    data = tmp_path.joinpath("data")
+    data.mkdir()
+    data.joinpath("a.txt").write_text("a")
+    data.joinpath("b.txt").write_text("b")
+    log = tmp_path.joinpath("log.txt")
+
+    result = runner.invoke(cli, [tmp_path.as_posix()])
+    assert result.exit_code == ExitCode.OK
+    assert log.read_text() == "False added:a.txt,b.txt changed: removed:\n"
+
+    data.joinpath("a.txt").write_text("A")
+    data.joinpath("b.txt").unlink()
+    data.joinpath("c.txt").write_text("c")
+    result = runner.invoke(cli, [tmp_path.as_posix()])
+    assert result.exit_code == ExitCode.OK
+    assert (
+        log.read_text().splitlines()[-1]
+        == "True added:c.txt changed:a.txt removed:b.txt"
+    )
+
+    result = runner.invoke(cli, [tmp_path.as_posix()])
+    assert result.exit_code == ExitCode.OK
+    assert "1  Skipped because unchanged" in result.output
+
+    # Products which are changed by others are created from scratch.
+    log.write_text("")
+    data.joinpath("d.txt").write_text("d")
+    result = runner.invoke(cli, [tmp_path.as_posix()])
+    assert result.exit_code == ExitCode.OK
+    assert log.read_text() == "False added:a.txt,c.txt,d.txt changed: removed:\n"
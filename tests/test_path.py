@@ -10,6 +10,7 @@ from types import ModuleType
 from typing import Any
 
 import pytest
+from _pytask.path import PathPatternMatcher
 from _pytask.path import _insert_missing_modules
 from _pytask.path import _module_name_from_path
 from _pytask.path import find_case_sensitive_path
@@ -358,3 +359,50 @@ def test_importlib_package(monkeypatch: pytest.MonkeyPatch, tmp_path: Path):
 
     mod = import_path(init, root=tmp_path)
     assert len(mod.instance.INSTANCES) == 1
+
+
+@pytest.mark.unit()
+@pytest.mark.parametrize(
+    "pattern",
+    [
+        "example",
+        "example/*",
+        "*.egg-info/*",
+        "task_*.py",
+        "a?c/[bx]*/d",
+        "/abs/*",
+        "/abs",
+    ],
+)
+@pytest.mark.parametrize(
+    "path",
+    [
+        Path("example"),
+        Path("example", "file.py"),
+        Path("pkg.egg-info", "PKG-INFO"),
+        Path("src", "task_example.py"),
+        Path("abc", "bx", "d"),
+        Path("abc", "y", "d"),
+        Path("/abs"),
+        Path("/abs", "file.py"),
+        Path("/other", "abs", "file.py"),
+    ],
+)
+def test_path_pattern_matcher_is_equal_to_path_match(path, pattern):
+    matcher = PathPatternMatcher.from_patterns([pattern])
+    assert matcher(path) is path.match(pattern)
+
+
+@pytest.mark.unit()
+@pytest.mark.parametrize(
+    ("parts", "patterns", "expected"),
+    [
+        ((".git",), [".git/*"], True),
+        (("project", ".git"), [".git/*"], True),
+        ((".git",), [".git"], False),
+        (("src",), [".git/*", "*.py"], False),
+    ],
+)
+def test_path_pattern_matcher_matches_all_children(parts, patterns, expected):
+    matcher = PathPatternMatcher.from_patterns(patterns)
+    assert matcher.matches_all_children(parts) is expected
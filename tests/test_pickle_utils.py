@@ -0,0 +1,163 @@
+from __future__ import annotations
+
+import pickle
+import textwrap
+
+import pytest
+from _pytask.pickle_utils import OUT_OF_BAND_MAGIC
+from _pytask.pickle_utils import ValueCache
+from _pytask.pickle_utils import resolve_compression
+from _pytask.pickle_utils import value_cache
+from pytask import ExitCode
+from pytask import PickleNode
+from pytask import build
+
+_MAGIC_NUMBERS = {
+    None: b"\x80",
+    "gzip": b"\x1f\x8b",
+    "lz4": b"\x04\x22\x4d\x18",
+    "zstd": b"\x28\xb5\x2f\xfd",
+}
+
+
+@pytest.mark.unit()
+@pytest.mark.parametrize("compression", [None, "gzip", "lz4", "zstd"])
+@pytest.mark.parametrize("out_of_band", [False, True])
+def test_save_and_load_pickle_node(tmp_path, compression, out_of_band):
+    value = {"buffer": bytearray(b"pytask" * 100_000), "list": [1, 2, 3]}
+    node = PickleNode(
+        path=tmp_path / "value.pkl", compression=compression, out_of_band=out_of_band
+    )
+
+    node.save(value)
+
+    assert PickleNode(path=node.path).load() == value
+    head = node.path.read_bytes()[:4]
+    if out_of_band and compression is None:
+        assert head == OUT_OF_BAND_MAGIC[:4]
+    else:
+        assert head.startswith(_MAGIC_NUMBERS[resolve_compression(compression)])
+    if compression is not None:
+        assert node.path.stat().st_size < 10_000
+
+
+@pytest.mark.unit()
+def test_missing_compression_packages_fall_back_to_gzip(monkeypatch):
+    monkeypatch.setattr("_pytask.pickle_utils._import_zstd", lambda: None)
+    monkeypatch.setattr("_pytask.pickle_utils._import_lz4", lambda: None)
+    assert resolve_compression("zstd") == "gzip"
+    assert resolve_compression("lz4") == "gzip"
+    assert resolve_compression(None) is None
+
+
+@pytest.mark.unit()
+def test_invalid_options_raise_errors(tmp_path):
+    with pytest.raises(ValueError, match="Compression 'zip' is not supported"):
+        PickleNode(path=tmp_path / "value.pkl", compression="zip").save(1)
+
+    node = PickleNode(path=tmp_path / "value.pkl", protocol=4, out_of_band=True)
+    with pytest.raises(ValueError, match="require pickle protocol 5"):
+        node.save(1)
+
+
+@pytest.mark.unit()
+def test_load_arrays_from_out_of_band_buffers_without_copies(tmp_path):
+    np = pytest.importorskip("numpy")
+    node = PickleNode(path=tmp_path / "value.pkl", out_of_band=True)
+    node.save({"array": np.arange(100_000), "small": np.arange(3)})
+
+    array = node.load()["array"]
+
+    assert not array.flags.owndata
+    assert array.flags.writeable
+    assert array[-1] == 99_999
+
+    # Changes of the array are not written to the file.
+    array[:] = 0
+    assert node.load()["array"][-1] == 99_999
+
+
+@pytest.mark.unit()
+def test_unpickle_nodes_stored_without_options(tmp_path):
+    node = PickleNode.__new__(PickleNode)
+    node.__setstate__({"path": tmp_path / "value.pkl", "name": "value"})
+    assert node == PickleNode(path=tmp_path / "value.pkl", name="value")
+    assert pickle.loads(pickle.dumps(node)) == node  # noqa: S301
+
+
+@pytest.mark.unit()
+def test_value_cache_evicts_least_recently_used_values():
+    cache = ValueCache(max_size=10)
+    cache.put("a", "1", "A", size=4)
+    cache.put("b", "1", "B", size=4)
+    assert cache.get("a", "1") == "A"
+
+    cache.put("c", "1", "C", size=4)
+    assert cache.size == 8
+    with pytest.raises(KeyError):
+        cache.get("b", "1")
+    assert cache.get("c", "1") == "C"
+
+    # Values with an outdated state and values larger than the cache are dropped.
+    with pytest.raises(KeyError):
+        cache.get("a", "2")
+    cache.put("a", "2", "A", size=11)
+    with pytest.raises(KeyError):
+        cache.get("a", "2")
+    assert (cache.hits, cache.misses, cache.size) == (2, 3, 4)
+
+
+@pytest.mark.unit()
+def test_pickle_node_loads_values_from_value_cache(tmp_path):
+    node = PickleNode(name="value", path=tmp_path / "value.pkl")
+    value = {"list": [1, 2, 3]}
+    try:
+        value_cache.configure(max_size=1024**2)
+        node.save(value)
+        loaded = node.load()
+        assert loaded == value
+        assert loaded is not value
+
+        # Tasks receive copies and cannot modify the cached value.
+        loaded["list"].append(4)
+        assert node.load() == {"list": [1, 2, 3]}
+
+        # Values are read again if the file changed.
+        node.path.write_bytes(pickle.dumps([2, 3]))
+        assert node.load() == [2, 3]
+        assert node.load() == [2, 3]
+        assert (value_cache.hits, value_cache.misses) == (3, 1)
+    finally:
+        value_cache.configure(max_size=0)
+
+
+@pytest.mark.end_to_end()
+def test_consumers_share_value_from_value_cache(tmp_path):
+    source = """
+    from typing_extensions import Annotated
+    from pytask import DataCatalog
+
+    data_catalog = DataCatalog()
+
+    def task_produce() -> Annotated[list, data_catalog["value"]]:
+        return [1, 2, 3]
+
+    def task_consume_1(value: Annotated[list, data_catalog["value"]]) -> None:
+        assert value == [1, 2, 3]
+        value.append(4)
+
+    def task_consume_2(value: Annotated[list, data_catalog["value"]]) -> None:
+        assert value == [1, 2, 3]
+    """
+    tmp_path.joinpath("task_example.py").write_text(textwrap.dedent(source))
+
+    session = build(paths=tmp_path, value_cache_size=1)
+
+    assert session.exit_code == ExitCode.OK
+    statistics = {
+        report.task.base_name: report.task.attributes["value_cache"]
+        for report in session.execution_reports
+    }
+    assert statistics["task_consume_1"] == {"hits": 1, "misses": 0}
+    assert statistics["task_consume_2"] == {"hits": 1, "misses": 0}
+    assert value_cache.max_size == 0
@@ -0,0 +1,104 @@
+from __future__ import annotations
+
+import importlib.metadata
+import os
+import sys
+import textwrap
+
+import pytest
+from _pytask.pluginmanager import get_plugin_manager
+from _pytask.pluginmanager import list_plugin_distributions
+
+
+@pytest.fixture()
+def site_with_plugin(tmp_path, monkeypatch):
+    site = tmp_path / "site"
+    site.mkdir()
+    site.joinpath("pytask_fake.py").write_text("FAKE = True\n")
+    dist_info = site / "pytask_fake-0.1.0.dist-info"
+    dist_info.mkdir()
+    dist_info.joinpath("METADATA").write_text(
+        "Metadata-Version: 2.1\nName: pytask-fake\nVersion: 0.1.0\n"
+    )
+    dist_info.joinpath("entry_points.txt").write_text(
+        textwrap.dedent(
+            """
+            [pytask]
+            fake = pytask_fake
+            """
+        )
+    )
+
+    cache = tmp_path / "cache"
+    monkeypatch.setattr("_pytask.pluginmanager._get_cache_directory", lambda: cache)
+    monkeypatch.syspath_prepend(site)
+    monkeypatch.delitem(sys.modules, "pytask_fake", raising=False)
+    monkeypatch.delenv("PYTASK_DISABLE_PLUGIN_CACHE", raising=False)
+    return site, cache
+
+
+def _fail(*args, **kwargs):  # noqa: ARG001
+    msg = "Distributions should not be scanned."
+    raise AssertionError(msg)
+
+
+@pytest.mark.unit()
+def test_entry_points_are_cached(site_with_plugin, monkeypatch):
+    _, cache = site_with_plugin
+
+    pm = get_plugin_manager()
+    assert pm.get_plugin("fake").FAKE
+    assert len(list(cache.glob("entry_points-pytask-*.json"))) == 1
+
+    monkeypatch.setattr(importlib.metadata, "distributions", _fail)
+    pm = get_plugin_manager()
+    assert pm.get_plugin("fake").FAKE
+    assert [
+        (dist.project_name, dist.version) for _, dist in list_plugin_distributions(pm)
+    ] == [("pytask-fake", "0.1.0")]
+
+
+@pytest.mark.unit()
+def test_cache_is_invalidated_when_environment_changes(site_with_plugin):
+    site, _ = site_with_plugin
+
+    pm = get_plugin_manager()
+    assert pm.get_plugin("fake")
+
+    site.joinpath("pytask_fake-0.1.0.dist-info", "entry_points.txt").unlink()
+    site.joinpath("pytask_fake-0.1.0.dist-info").rename(site / "pytask_fake.dist-old")
+    # Ensure the modification time changes even on file systems with coarse timestamps.
+    stat = site.stat()
+    os.utime(site, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+    pm = get_plugin_manager()
+    assert pm.get_plugin("fake") is None
+
+
+@pytest.mark.unit()
+def test_stale_cache_is_dropped(site_with_plugin, monkeypatch):
+    site, cache = site_with_plugin
+
+    pm = get_plugin_manager()
+    assert pm.get_plugin("fake")
+
+    # Remove the distribution without changing the modification time of the site.
+    stat = site.stat()
+    site.joinpath("pytask_fake.py").unlink()
+    site.joinpath("pytask_fake-0.1.0.dist-info", "entry_points.txt").unlink()
+    os.utime(site, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+    monkeypatch.delitem(sys.modules, "pytask_fake")
+
+    pm = get_plugin_manager()
+    assert pm.get_plugin("fake") is None
+    assert "fake" not in next(cache.glob("entry_points-pytask-*.json")).read_text()
+
+
+@pytest.mark.unit()
+def test_cache_can_be_disabled(site_with_plugin, monkeypatch):
+    _, cache = site_with_plugin
+    monkeypatch.setenv("PYTASK_DISABLE_PLUGIN_CACHE", "1")
+
+    pm = get_plugin_manager()
+    assert pm.get_plugin("fake").FAKE
+    assert not cache.exists()
@@ -0,0 +1,142 @@
+from __future__ import annotations
+
+import textwrap
+
+import pytest
+from _pytask.prefetch_utils import Prefetcher
+from attrs import define
+from pytask import ExitCode
+from pytask import PathNode
+from pytask import PickleNode
+from pytask import cli
+
+
+@define
+class Buffer:
+    nbytes: int
+
+
+@pytest.mark.unit()
+def test_prefetch_values_within_size(tmp_path):
+    nodes = [PickleNode(name=str(i), path=tmp_path / f"{i}.pkl") for i in range(3)]
+    for i, node in enumerate(nodes):
+        node.save(bytes(100 * i))
+    tmp_path.joinpath("data.txt").write_text("a" * 1000)
+    path_node = PathNode(path=tmp_path.joinpath("data.txt"))
+
+    prefetcher = Prefetcher()
+    prefetcher.configure(max_size=200)
+    try:
+        prefetcher.submit("task", [*nodes, path_node])
+        # The last pickle does not fit anymore.
+        assert prefetcher.size <= 200
+        assert nodes[2].signature not in prefetcher._entries
+
+        values = prefetcher.pop_many("task", [nodes[0], nodes[1], path_node])
+        assert values == {id(nodes[0]): b"", id(nodes[1]): bytes(100)}
+        assert prefetcher.hits == 3
+        assert prefetcher.size == 0
+
+        # Values which failed to load are loaded again by the task.
+        nodes[2].path.write_bytes(b"broken")
+        prefetcher.submit("task", [nodes[2]])
+        assert prefetcher.pop_many("task", [nodes[2]]) == {}
+    finally:
+        prefetcher.configure()
+
+
+@pytest.mark.unit()
+def test_discard_prefetched_values(tmp_path):
+    node = PickleNode(name="node", path=tmp_path / "node.pkl")
+    node.save(1)
+
+    prefetcher = Prefetcher()
+    prefetcher.configure(max_size=1024)
+    try:
+        prefetcher.submit("task", [node, PathNode(path=tmp_path / "missing.txt")])
+        assert list(prefetcher._entries) == [node.signature]
+        prefetcher.discard("task", [node])
+        assert prefetcher.pop_many("task", [node]) == {}
+        assert prefetcher.size == 0
+    finally:
+        prefetcher.configure()
+
+
+@pytest.mark.unit()
+def test_keep_prefetched_values_needed_by_other_tasks(tmp_path):
+    node = PickleNode(name="node", path=tmp_path / "node.pkl")
+    node.save([1])
+
+    prefetcher = Prefetcher()
+    prefetcher.configure(max_size=1024)
+    try:
+        for consumer in ("skipped", "first", "second"):
+            prefetcher.submit(consumer, [node])
+        size = prefetcher.size
+        assert size > 0
+
+        # A skipped task does not drop values which other tasks need.
+        prefetcher.discard("skipped", [node])
+        assert prefetcher.size == size
+
+        # Consumers which are not the last one receive a copy.
+        first = prefetcher.pop_many("first", [node])[id(node)]
+        first.append(2)
+        assert prefetcher.pop_many("second", [node]) == {id(node): [1]}
+        assert prefetcher.size == 0
+        assert prefetcher.hits == 2
+    finally:
+        prefetcher.configure()
+
+
+@pytest.mark.unit()
+def test_prefetched_values_are_sized_after_loading(tmp_path):
+    compressed = PickleNode(name="a", path=tmp_path / "a.pkl", compression="gzip")
+    compressed.save(bytes(1000))
+    node = PickleNode(name="b", path=tmp_path / "b.pkl")
+    node.save(Buffer(nbytes=800))
+
+    prefetcher = Prefetcher()
+    prefetcher.configure(max_size=2000)
+    try:
+        # Compressed pickles are not prefetched since their size is unknown.
+        prefetcher.submit("task", [compressed, node])
+        assert list(prefetcher._entries) == [node.signature]
+
+        prefetcher._entries[node.signature].future.result()
+        prefetcher.submit("task", [])
+        assert prefetcher.size == 800
+    finally:
+        prefetcher.configure()
+
+
+@pytest.mark.end_to_end()
+def test_prefetch_dependencies_of_upcoming_tasks(runner, tmp_path):
+    source = """
+    from pathlib import Path
+    from typing_extensions import Annotated
+    from pytask import PickleNode, Product
+
+    first = PickleNode(name="first", path=Path("first.pkl"))
+    second = PickleNode(name="second", path=Path("second.pkl"))
+
+    def task_create() -> Annotated[list[int], first]:
+        return list(range(10))
+
+    def task_double(values: Annotated[list[int], first]) -> Annotated[list, second]:
+        return [2 * value for value in values]
+
+    def task_sum(
+        values: Annotated[list[int], first], doubled: Annotated[list[int], second]
+    ) -> Annotated[str, Path("sum.txt")]:
+        return str(sum(values) + sum(doubled))
+    """
+    tmp_path.joinpath("task_example.py").write_text(textwrap.dedent(source))
+
+    result = runner.invoke(cli, [tmp_path.as_posix(), "--prefetch-size", "1"])
+    assert result.exit_code == ExitCode.OK
+    assert tmp_path.joinpath("sum.txt").read_text() == "135"
+
+    result = runner.invoke(cli, [tmp_path.as_posix(), "--prefetch-size", "1"])
+    assert result.exit_code == ExitCode.OK
+    assert "3  Skipped because unchanged" in result.output
@@ -0,0 +1,221 @@
+from __future__ import annotations
+
+import hashlib
+import os
+import textwrap
+
+import pytest
+from _pytask.remote_utils import RemoteFileCache
+from _pytask.remote_utils import get_infos
+from _pytask.remote_utils import is_remote_path
+from fsspec.asyn import AsyncFileSystem
+from fsspec.implementations.memory import MemoryFileSystem
+from pytask import ExitCode
+from pytask import PathNode
+from pytask import PickleNode
+from pytask import build
+from pytask import cli
+from upath import UPath
+
+
+@pytest.fixture()
+def bucket(tmp_path):
+    path = UPath(f"memory://{tmp_path.name}")
+    path.mkdir(parents=True, exist_ok=True)
+    for name in ("a.txt", "b.txt", "c.txt"):
+        path.joinpath(name).write_text(name)
+    yield path
+    path.fs.rm(path.path, recursive=True)
+
+
+@pytest.fixture()
+def etags(monkeypatch):
+    """Add ETags to the information about files in memory like object stores do."""
+    info = MemoryFileSystem.info
+
+    def info_with_etag(self, path, **kwargs):
+        result = info(self, path, **kwargs)
+        if result["type"] == "file":
+            data = self.cat_file(path)
+            result["ETag"] = hashlib.md5(data).hexdigest()  # noqa: S324
+        return result
+
+    monkeypatch.setattr(MemoryFileSystem, "info", info_with_etag)
+
+
+class CountingMemoryFileSystem(MemoryFileSystem):
+    calls: list[str] = []  # noqa: RUF012
+
+    def info(self, path, **kwargs):
+        self.calls.append("info")
+        return super().info(path, **kwargs)
+
+    def ls(self, path, detail=True, **kwargs):
+        self.calls.append("ls")
+        return super().ls(path, detail=detail, **kwargs)
+
+
+class AsyncMemoryFileSystem(AsyncFileSystem):
+    async def _info(self, path, **kwargs):
+        return MemoryFileSystem().info(path, **kwargs)
+
+
+@pytest.mark.unit()
+def test_is_remote_path(tmp_path, bucket):
+    assert is_remote_path(bucket)
+    assert not is_remote_path(tmp_path)
+    assert not is_remote_path(UPath(tmp_path.as_uri()))
+
+
+@pytest.mark.unit()
+def test_get_infos_requests_files_concurrently(bucket):
+    paths = [bucket.joinpath(name).path for name in ("a.txt", "missing.txt", "b.txt")]
+
+    infos = get_infos(bucket.fs, paths)
+
+    assert [info and info["name"] for info in infos] == [paths[0], None, paths[2]]
+
+
+@pytest.mark.unit()
+def test_get_infos_lists_directories(monkeypatch, bucket):
+    monkeypatch.setattr("_pytask.remote_utils.MIN_FILES_FOR_LISTING", 2)
+    fs = CountingMemoryFileSystem()
+    fs.calls.clear()
+    paths = [bucket.joinpath(name).path for name in ("a.txt", "b.txt", "missing.txt")]
+
+    infos = get_infos(fs, paths)
+
+    assert [info and info["size"] for info in infos] == [5, 5, None]
+    assert sorted(fs.calls) == ["info", "ls"]
+
+
+@pytest.mark.unit()
+def test_get_infos_with_async_file_system(bucket):
+    fs = AsyncMemoryFileSystem()
+    paths = [bucket.joinpath(name).path for name in ("c.txt", "missing.txt")]
+
+    infos = get_infos(fs, paths)
+
+    assert infos[0]["name"] == paths[0]
+    assert infos[1] is None
+
+
+@pytest.mark.unit()
+@pytest.mark.parametrize("node_type", [PathNode, PickleNode])
+def test_state_many_of_remote_paths(tmp_path, bucket, node_type):
+    local = tmp_path / "local.txt"
+    local.write_text("local")
+    nodes = [
+        node_type(name="a", path=bucket / "a.txt"),
+        node_type(name="local", path=local),
+        node_type(name="missing", path=bucket / "missing.txt"),
+    ]
+
+    assert node_type.state_many(nodes) == [node.state() for node in nodes]
+    assert node_type.state_many(nodes)[2] is None
+
+
+@pytest.mark.unit()
+def test_remote_file_cache_downloads_files_once(tmp_path, bucket, etags):  # noqa: ARG001
+    cache = RemoteFileCache()
+    assert cache.get(bucket / "a.txt") == bucket / "a.txt"
+
+    cache.configure(tmp_path / "cache", max_size=1024)
+    local_path = cache.get(bucket / "a.txt")
+    assert local_path.parent == tmp_path / "cache"
+    assert local_path.suffix == ".txt"
+    assert local_path.read_text() == "a.txt"
+
+    assert cache.get(bucket / "a.txt") == local_path
+    assert (cache.hits, cache.misses) == (1, 1)
+
+    bucket.joinpath("a.txt").write_text("changed")
+    new_local_path = cache.get(bucket / "a.txt")
+    assert new_local_path != local_path
+    assert new_local_path.read_text() == "changed"
+    assert (cache.hits, cache.misses) == (1, 2)
+
+    assert cache.get(tmp_path) == tmp_path
+    assert cache.get(bucket / "missing.txt") == bucket / "missing.txt"
+
+
+@pytest.mark.unit()
+@pytest.mark.usefixtures("etags")
+@pytest.mark.parametrize(
+    "get_state", [PathNode.state, lambda node: PathNode.state_many([node])]
+)
+def test_remote_file_cache_uses_recorded_etags(
+    monkeypatch, tmp_path, bucket, get_state
+):
+    cache = RemoteFileCache()
+    monkeypatch.setattr("_pytask.nodes.remote_file_cache", cache)
+    cache.configure(tmp_path / "cache", max_size=1024)
+    get_state(PathNode(name="a", path=bucket / "a.txt"))
+    local_path = cache.get(bucket / "a.txt")
+
+    def fail(*args, **kwargs):  # noqa: ARG001
+        raise AssertionError
+
+    # Loading the file after its state was computed does not request the ETag again.
+    with monkeypatch.context() as m:
+        m.setattr(MemoryFileSystem, "info", fail)
+        assert cache.get(bucket / "a.txt") == local_path
+    assert (cache.hits, cache.misses) == (1, 1)
+
+    cache.configure(tmp_path / "cache", max_size=1024)
+    assert not cache.etags
+
+
+@pytest.mark.unit()
+def test_remote_file_cache_ignores_files_without_etag(tmp_path, bucket):
+    cache = RemoteFileCache()
+    cache.configure(tmp_path / "cache", max_size=1024)
+    assert cache.get(bucket / "a.txt") == bucket / "a.txt"
+    assert (cache.hits, cache.misses) == (0, 0)
+
+
+@pytest.mark.unit()
+def test_remote_file_cache_evicts_least_recently_used_files(tmp_path, bucket, etags):  # noqa: ARG001
+    cache = RemoteFileCache()
+    cache.configure(tmp_path / "cache", max_size=10)
+    path_a = cache.get(bucket / "a.txt")
+    path_b = cache.get(bucket / "b.txt")
+    os.utime(path_a, (1, 1))
+    os.utime(path_b, (2, 2))
+
+    # Using the older file makes the other one the least recently used file.
+    assert cache.get(bucket / "a.txt") == path_a
+    path_c = cache.get(bucket / "c.txt")
+
+    assert path_a.exists()
+    assert not path_b.exists()
+    assert path_c.exists()
+
+
+@pytest.mark.end_to_end()
+def test_remote_dependencies_are_cached(runner, tmp_path, bucket, etags):  # noqa: ARG001
+    source = f"""
+    from pathlib import Path
+    from typing_extensions import Annotated
+    from upath import UPath
+    from pytask import Product
+
+    def task_example(
+        path: UPath = UPath("{bucket}/a.txt"),
+        produces: Annotated[Path, Product] = Path("out.txt"),
+    ) -> None:
+        produces.write_text(f"{{isinstance(path, UPath)}} {{path.read_text()}}")
+    """
+    tmp_path.joinpath("task_example.py").write_text(textwrap.dedent(source))
+
+    session = build(paths=tmp_path, remote_cache_size=1)
+
+    assert session.exit_code == ExitCode.OK
+    assert tmp_path.joinpath("out.txt").read_text() == "False a.txt"
+    assert len(list(tmp_path.joinpath(".pytask", "remote_cache").iterdir())) == 1
+
+    result = runner.invoke(cli, ["profile", tmp_path.as_posix()])
+
+    assert result.exit_code == ExitCode.OK
+    assert "Remote Cache" in result.output
+    assert "0/1" in result.output
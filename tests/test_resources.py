@@ -0,0 +1,120 @@
+from __future__ import annotations
+
+import textwrap
+from pathlib import Path
+
+import networkx as nx
+import pytest
+from _pytask.dag_utils import TopologicalSorter
+from _pytask.resources_utils import get_resources_of_task
+from _pytask.resources_utils import parse_memory
+from _pytask.resources_utils import parse_resources
+from pytask import ExitCode
+from pytask import Mark
+from pytask import Task
+from pytask import cli
+
+
+@pytest.mark.unit()
+@pytest.mark.parametrize(
+    ("value", "expected"),
+    [(512, 512 * 1024**2), ("2GB", 2 * 1024**3), ("1.5 gib", 1.5 * 1024**3)],
+)
+def test_parse_memory(value, expected):
+    assert parse_memory(value) == expected
+
+
+@pytest.mark.unit()
+def test_parse_resources():
+    assert parse_resources("cpus=8, memory=1GB,db=2") == {
+        "cpus": 8,
+        "memory": 1024**3,
+        "db": 2,
+    }
+    assert parse_resources({"cpus": 2}) == {"cpus": 2}
+    with pytest.raises(ValueError, match="Cannot parse the resources"):
+        parse_resources("cpus")
+    with pytest.raises(ValueError, match="must be a number"):
+        parse_resources({"db": "many"})
+    with pytest.raises(ValueError, match="Cannot parse the amount of memory"):
+        parse_resources({"memory": "a lot"})
+
+
+@pytest.mark.unit()
+def test_get_resources_of_task():
+    task = Task(
+        base_name="task",
+        path=Path(),
+        function=None,
+        markers=[Mark("resources", (), {"cpus": 2, "memory": "1GB"})],
+    )
+    assert get_resources_of_task(task) == {"cpus": 2, "memory": 1024**3}
+
+    task.markers.append(Mark("resources", (4,), {}))
+    with pytest.raises(ValueError, match="keyword arguments"):
+        get_resources_of_task(task)
+
+
+@pytest.mark.unit()
+def test_schedule_tasks_within_capacities():
+    dag = nx.DiGraph()
+    dag.add_nodes_from(["large_0", "large_1", "huge", "db_0", "db_1", "free"])
+    resources = {
+        "large_0": {"memory": 40},
+        "large_1": {"memory": 40},
+        "huge": {"memory": 100},
+        "db_0": {"db": 1},
+        "db_1": {"db": 1},
+    }
+    scheduler = TopologicalSorter(
+        dag=dag,
+        priorities={"huge": 1},
+        resources=resources,
+        capacities={"memory": 64, "db": 1},
+    )
+
+    # The task which exceeds the capacities runs without other tasks needing memory.
+    ready = scheduler.get_ready(6)
+    assert ready[-1] == "huge"
+    assert sorted(name.split("_")[0] for name in ready) == ["db", "free", "huge"]
+    assert scheduler.peek_ready(6) == []
+    scheduler.done(*ready)
+
+    ready = scheduler.get_ready(6)
+    assert sorted(name.split("_")[0] for name in ready) == ["db", "large"]
+    assert scheduler.peek_ready(6) == []
+
+    scheduler.done(*ready)
+    assert [name.split("_")[0] for name in scheduler.get_ready(6)] == ["large"]
+
+
+@pytest.mark.end_to_end()
+def test_limit_concurrent_tasks_with_custom_resources(runner, tmp_path):
+    source = """
+    import asyncio
+    import time
+    from pathlib import Path
+
+    import pytask
+    from typing_extensions import Annotated
+
+    for i in range(2):
+
+        @pytask.mark.resources(db=1)
+        @pytask.task(id=str(i))
+        async def task_query() -> Annotated[str, Path(f"{i}.txt")]:
+            start = time.time()
+            await asyncio.sleep(0.3)
+            return f"{start} {time.time()}"
+    """
+    tmp_path.joinpath("task_example.py").write_text(textwrap.dedent(source))
+
+    result = runner.invoke(cli, [tmp_path.as_posix(), "--resources", "db=1"])
+    assert result.exit_code == ExitCode.OK
+    assert "2  Succeeded" in result.output
+
+    first, second = sorted(
+        [float(x) for x in tmp_path.joinpath(f"{i}.txt").read_text().split()]
+        for i in range(2)
+    )
+    assert second[0] >= first[1]
@@ -0,0 +1,237 @@
+from __future__ import annotations
+
+import os
+import socket
+import subprocess
+import sys
+import textwrap
+import time
+from pathlib import Path
+
+import pytest
+from _pytask.client import find_socket
+from _pytask.client import get_socket_path
+from _pytask.client import main
+from _pytask.client import request
+
+
+@pytest.mark.unit()
+@pytest.mark.skipif(sys.platform == "win32", reason="Requires UNIX domain sockets.")
+def test_find_socket(tmp_path):
+    with pytest.raises(FileNotFoundError, match="No running daemon"):
+        find_socket(tmp_path)
+
+    socket_path = get_socket_path(tmp_path)
+    socket_path.parent.mkdir(exist_ok=True)
+    tmp_path.joinpath("src", "project").mkdir(parents=True)
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as server:
+        server.bind(str(socket_path))
+        server.listen()
+        assert find_socket(tmp_path / "src" / "project") == socket_path
+
+    # Sockets of daemons which did not shut down properly are removed.
+    assert socket_path.exists()
+    with pytest.raises(FileNotFoundError, match="No running daemon"):
+        find_socket(tmp_path)
+    assert not socket_path.exists()
+
+
+@pytest.mark.unit()
+def test_get_socket_path_of_deep_project(tmp_path):
+    root = Path("/project")
+    assert get_socket_path(root) == root / ".pytask" / "pytask.sock"
+
+    root = tmp_path.joinpath(*["directory"] * 10)
+    path = get_socket_path(root)
+    assert len(os.fsencode(path)) < 100
+    assert path.name.startswith("pytask-")
+    assert path == get_socket_path(root)
+    assert path != get_socket_path(root.parent)
+
+
+@pytest.mark.unit()
+def test_client_fails_without_daemon(tmp_path, capsys):
+    assert main(["status", "--socket", str(tmp_path / "pytask.sock")]) == 1
+    assert capsys.readouterr().err
+
+
+@pytest.mark.end_to_end()
+@pytest.mark.skipif(sys.platform == "win32", reason="Requires UNIX domain sockets.")
+@pytest.mark.parametrize("polling", [False, True])
+def test_serve_answers_requests(tmp_path, polling):
+    source = """
+    from pathlib import Path
+    from typing_extensions import Annotated
+    from pytask import Product
+
+    def task_example(
+        path: Path = Path("in.txt"),
+        produces: Annotated[Path, Product] = Path("out.txt"),
+    ) -> None:
+        produces.write_text(path.read_text() + "!")
+    """
+    tmp_path.joinpath("task_example.py").write_text(textwrap.dedent(source))
+    tmp_path.joinpath("in.txt").write_text("Hello")
+    socket_path = get_socket_path(tmp_path)
+
+    args = ["pytask", "serve"] + (["--polling"] if polling else [])
+    process = subprocess.Popen(
+        args, cwd=tmp_path, stdout=subprocess.PIPE, stderr=subprocess.STDOUT
+    )
+    try:
+        start = time.monotonic()
+        while not socket_path.exists():
+            assert time.monotonic() - start < 30
+            assert process.poll() is None
+            time.sleep(0.1)
+
+        status = request("status", socket_path, timeout=30)
+        assert status["exit_code"] == 0
+        assert status["n_tasks"] == 1
+
+        response = request("build", socket_path, timeout=30)
+        assert response == {"exit_code": 0, "reports": []}
+
+        # Ensure the modification time changes on file systems with coarse timestamps.
+        time.sleep(0.05)
+        tmp_path.joinpath("in.txt").write_text("Hi")
+        response = request("build", socket_path, timeout=30)
+        assert response["reports"] == [
+            {"task": "task_example.py::task_example", "outcome": "success"}
+        ]
+        assert tmp_path.joinpath("out.txt").read_text() == "Hi!"
+
+        response = request("collect", socket_path, timeout=30)
+        assert [task["name"] for task in response["tasks"]] == [
+            "task_example.py::task_example"
+        ]
+
+        response = request("dag", socket_path, timeout=30)
+        assert len(response["nodes"]) == 3
+        assert len(response["edges"]) == 2
+
+        assert "error" in request("unknown", socket_path, timeout=30)
+        assert request("shutdown", socket_path, timeout=30) == {"exit_code": 0}
+        assert process.wait(timeout=30) == 0
+        assert not socket_path.exists()
+    finally:
+        process.kill()
+        process.communicate()
+
+
+@pytest.mark.end_to_end()
+@pytest.mark.skipif(sys.platform == "win32", reason="Requires UNIX domain sockets.")
+def test_serve_retries_failed_build(tmp_path):
+    source = """
+    from pathlib import Path
+
+    def task_example() -> None:
+        if not Path(__file__).parent.joinpath("flag.txt").exists():
+            raise ValueError("Missing flag.")
+    """
+    tmp_path.joinpath("task_example.py").write_text(textwrap.dedent(source))
+    socket_path = get_socket_path(tmp_path)
+
+    process = subprocess.Popen(
+        ["pytask", "serve"],
+        cwd=tmp_path,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.STDOUT,
+    )
+    try:
+        start = time.monotonic()
+        while not socket_path.exists():
+            assert time.monotonic() - start < 30
+            assert process.poll() is None
+            time.sleep(0.1)
+
+        # The failed task is executed again although no watched file has changed.
+        response = request("build", socket_path, timeout=30)
+        assert response == {
+            "exit_code": 1,
+            "reports": [{"task": "task_example.py::task_example", "outcome": "fail"}],
+        }
+
+        tmp_path.joinpath("flag.txt").touch()
+        response = request("build", socket_path, timeout=30)
+        assert response == {
+            "exit_code": 0,
+            "reports": [
+                {"task": "task_example.py::task_example", "outcome": "success"}
+            ],
+        }
+
+        # The successful build is reused.
+        response = request("build", socket_path, timeout=30)
+        assert response == {"exit_code": 0, "reports": []}
+        assert request("shutdown", socket_path, timeout=30) == {"exit_code": 0}
+        assert process.wait(timeout=30) == 0
+    finally:
+        process.kill()
+        process.communicate()
+
+
+@pytest.mark.end_to_end()
+@pytest.mark.skipif(sys.platform == "win32", reason="Requires UNIX domain sockets.")
+def test_serve_keeps_values_of_python_nodes(tmp_path):
+    tmp_path.joinpath("shared_nodes.py").write_text(
+        "from pytask import PythonNode\nintermediate = PythonNode(name='intermediate')"
+    )
+    source_produce = """
+    from typing_extensions import Annotated
+    from shared_nodes import intermediate
+
+    def task_produce() -> Annotated[str, intermediate]:
+        return "value"
+    """
+    source_consume = """
+    from pathlib import Path
+    from typing_extensions import Annotated
+    from pytask import Product
+    from shared_nodes import intermediate
+
+    def task_consume(
+        value: Annotated[str, intermediate],
+        produces: Annotated[Path, Product] = Path("out.txt"),
+    ) -> None:
+        produces.write_text(value + "{suffix}")
+    """
+    tmp_path.joinpath("task_produce.py").write_text(textwrap.dedent(source_produce))
+    tmp_path.joinpath("task_consume.py").write_text(
+        textwrap.dedent(source_consume).format(suffix="!")
+    )
+    socket_path = get_socket_path(tmp_path)
+
+    process = subprocess.Popen(
+        ["pytask", "serve"],
+        cwd=tmp_path,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.STDOUT,
+        env={**os.environ, "PYTHONPATH": tmp_path.as_posix()},
+    )
+    try:
+        start = time.monotonic()
+        while not socket_path.exists():
+            assert time.monotonic() - start < 30
+            assert process.poll() is None
+            time.sleep(0.1)
+        assert tmp_path.joinpath("out.txt").read_text() == "value!"
+
+        # The producer is skipped and the consumer receives the value of the first
+        # build.
+        time.sleep(0.05)
+        tmp_path.joinpath("task_consume.py").write_text(
+            textwrap.dedent(source_consume).format(suffix="?")
+        )
+        response = request("build", socket_path, timeout=30)
+        assert response == {
+            "exit_code": 0,
+            "reports": [
+                {"task": "task_consume.py::task_consume", "outcome": "success"}
+            ],
+        }
+        assert tmp_path.joinpath("out.txt").read_text() == "value?"
+        assert request("shutdown", socket_path, timeout=30) == {"exit_code": 0}
+    finally:
+        process.kill()
+        process.communicate()
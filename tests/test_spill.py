@@ -0,0 +1,103 @@
+from __future__ import annotations
+
+import textwrap
+
+import pytest
+from _pytask.spill_utils import SpilledValue
+from _pytask.spill_utils import SpillStore
+from _pytask.spill_utils import estimate_size
+from pytask import ExitCode
+from pytask import PythonNode
+from pytask import cli
+
+
+@pytest.mark.unit()
+def test_estimate_size():
+    assert estimate_size(b"a" * 1000) > 1000
+    assert estimate_size([bytes(1000), {"b": bytes(1000)}]) > 2000
+
+    value = bytes(1000)
+    assert estimate_size([value, value]) < 2000
+
+    np = pytest.importorskip("numpy")
+    assert estimate_size(np.zeros(1000)) == 8000
+
+
+@pytest.mark.unit()
+def test_spill_least_recently_used_values_and_restore_them(tmp_path):
+    store = SpillStore()
+    store.configure(directory=tmp_path, max_size=2500)
+    nodes = [PythonNode(name=str(i)) for i in range(3)]
+
+    with pytest.MonkeyPatch.context() as monkeypatch:
+        monkeypatch.setattr("_pytask.nodes.spill_store", store)
+        nodes[0].save(b"0" * 1000)
+        nodes[1].save(b"1" * 1000)
+        assert nodes[0].load() == b"0" * 1000
+        nodes[2].save(b"2" * 1000)
+
+        assert isinstance(nodes[1].value, SpilledValue)
+        assert len(list(tmp_path.iterdir())) == 1
+        assert (store.n_spilled, store.n_restored) == (1, 0)
+
+        assert nodes[1].load() == b"1" * 1000
+        assert isinstance(nodes[0].value, SpilledValue)
+        assert (store.n_spilled, store.n_restored) == (2, 1)
+        assert store.size <= store.max_size
+
+    # Files of spilled values are removed when the values are garbage collected.
+    nodes[0].value = None
+    assert list(tmp_path.iterdir()) == []
+
+
+@pytest.mark.unit()
+def test_values_which_cannot_be_pickled_stay_in_memory(tmp_path):
+    store = SpillStore()
+    store.configure(directory=tmp_path, max_size=1)
+    node = PythonNode(name="node", value=lambda: 1)
+    store.add(node)
+    store.add(PythonNode(name="other", value=1))
+
+    assert callable(node.value)
+    assert store.n_spilled == 0
+    assert list(tmp_path.iterdir()) == []
+
+
+@pytest.mark.end_to_end()
+@pytest.mark.parametrize("python_node_budget", [0, 1])
+def test_values_are_released_after_all_dependents_finished(
+    runner, tmp_path, python_node_budget
+):
+    source = """
+    from typing_extensions import Annotated
+    from pytask import PythonNode
+    from _pytask.typing import no_default
+
+    intermediate = PythonNode(name="intermediate")
+    size = PythonNode(name="size")
+    first = PythonNode(name="first")
+
+    def task_create_data() -> Annotated[bytes, intermediate]:
+        return b"a" * 1024 ** 2
+
+    def task_compute_size(data: Annotated[bytes, intermediate]) -> Annotated[int, size]:
+        return len(data)
+
+    def task_get_first(data: Annotated[bytes, intermediate]) -> Annotated[bytes, first]:
+        return data[:1]
+
+    def task_check(
+        size: Annotated[int, size], first: Annotated[bytes, first]
+    ) -> None:
+        assert intermediate.value is no_default
+        assert size == 1024 ** 2
+        assert first == b"a"
+    """
+    tmp_path.joinpath("task_example.py").write_text(textwrap.dedent(source))
+
+    result = runner.invoke(
+        cli, [tmp_path.as_posix(), "--python-node-budget", str(python_node_budget)]
+    )
+
+    assert result.exit_code == ExitCode.OK
+    assert "4  Succeeded" in result.output
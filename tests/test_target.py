@@ -0,0 +1,185 @@
+from __future__ import annotations
+
+import textwrap
+
+import pytest
+from _pytask.target_utils import ProductIndex
+from _pytask.target_utils import parse_target
+from pytask import ExitCode
+from pytask import build
+from pytask import cli
+
+_TASK_A = """
+from pathlib import Path
+from typing_extensions import Annotated
+from pytask import Product
+
+def task_a(produces: Annotated[Path, Product] = Path("a.txt")) -> None:
+    produces.write_text("a")
+"""
+
+_TASK_B = """
+from pathlib import Path
+from typing_extensions import Annotated
+from pytask import Product
+
+def task_b(
+    path: Path = Path("a.txt"), produces: Annotated[Path, Product] = Path("b.txt")
+) -> None:
+    produces.write_text(path.read_text() + "b")
+"""
+
+_TASK_C = """
+from pathlib import Path
+from typing_extensions import Annotated
+from pytask import Product
+
+def task_c(produces: Annotated[Path, Product] = Path("c.txt")) -> None:
+    produces.write_text("c")
+"""
+
+
+@pytest.fixture()
+def project(tmp_path):
+    tmp_path.joinpath("task_a.py").write_text(textwrap.dedent(_TASK_A))
+    tmp_path.joinpath("task_b.py").write_text(textwrap.dedent(_TASK_B))
+    tmp_path.joinpath("task_c.py").write_text(textwrap.dedent(_TASK_C))
+    return tmp_path
+
+
+@pytest.mark.unit()
+def test_parse_target(tmp_path):
+    assert parse_target(tmp_path.joinpath("out.txt").as_posix()) == (
+        tmp_path.joinpath("out.txt"),
+        None,
+    )
+    assert parse_target(f"{tmp_path.joinpath('task_a.py').as_posix()}::task_a") == (
+        tmp_path.joinpath("task_a.py"),
+        "task_a",
+    )
+
+
+@pytest.mark.end_to_end()
+def test_build_product_as_target(runner, project):
+    result = runner.invoke(
+        cli, [project.as_posix(), "--target", project.joinpath("b.txt").as_posix()]
+    )
+
+    assert result.exit_code == ExitCode.OK
+    assert "2  Succeeded" in result.output
+    assert project.joinpath("b.txt").read_text() == "ab"
+    assert not project.joinpath("c.txt").exists()
+
+    index = ProductIndex.from_root(project)
+    assert index.find_module_of_product(project / "b.txt") == project / "task_b.py"
+    assert not index.is_stale(project / "task_c.py")
+
+
+@pytest.mark.end_to_end()
+def test_build_task_as_target(runner, project):
+    target = f"{project.joinpath('task_a.py').as_posix()}::task_a"
+    result = runner.invoke(cli, [project.as_posix(), "--target", target])
+
+    assert result.exit_code == ExitCode.OK
+    assert "1  Succeeded" in result.output
+    assert project.joinpath("a.txt").exists()
+    assert not project.joinpath("b.txt").exists()
+
+
+def _collected_modules(session):
+    return {report.node.path.name for report in session.collection_reports}
+
+
+@pytest.mark.end_to_end()
+def test_target_collects_only_needed_modules(project):
+    # Without an index, all modules are collected.
+    target = project.joinpath("b.txt").as_posix()
+    session = build(paths=project, target=target)
+    assert session.exit_code == ExitCode.OK
+    assert _collected_modules(session) == {"task_a.py", "task_b.py", "task_c.py"}
+    project.joinpath("b.txt").unlink()
+
+    session = build(paths=project, target=target)
+
+    assert session.exit_code == ExitCode.OK
+    assert project.joinpath("b.txt").read_text() == "ab"
+    assert _collected_modules(session) == {"task_a.py", "task_b.py"}
+    assert {task.name for task in session.tasks} == {
+        "task_a.py::task_a",
+        "task_b.py::task_b",
+    }
+
+
+@pytest.mark.end_to_end()
+def test_target_collects_modified_modules(project):
+    target = project.joinpath("a.txt").as_posix()
+    assert build(paths=project, target=target).exit_code == ExitCode.OK
+    project.joinpath("task_c.py").write_text(textwrap.dedent(_TASK_C) + "\n")
+
+    session = build(paths=project, target=target)
+
+    assert session.exit_code == ExitCode.OK
+    assert _collected_modules(session) == {"task_a.py", "task_c.py"}
+    assert [task.name for task in session.tasks] == ["task_a.py::task_a"]
+
+
+@pytest.mark.end_to_end()
+def test_index_is_only_updated_with_targets(project):
+    assert build(paths=project).exit_code == ExitCode.OK
+    assert not project.joinpath(".pytask", "product_index.json").exists()
+
+
+@pytest.mark.end_to_end()
+def test_target_skips_unchanged_modules_without_tasks(project):
+    project.joinpath("task_empty.py").write_text("import os\n")
+    target = project.joinpath("a.txt").as_posix()
+    assert build(paths=project, target=target).exit_code == ExitCode.OK
+    assert not ProductIndex.from_root(project).is_stale(project / "task_empty.py")
+
+    session = build(paths=project, target=target)
+
+    assert session.exit_code == ExitCode.OK
+    assert _collected_modules(session) == {"task_a.py"}
+
+
+_CONFIG = """
+from pathlib import Path
+
+PATH_A = Path(__file__).parent / "{name}"
+"""
+
+
+@pytest.mark.end_to_end()
+def test_target_collects_all_modules_if_imported_module_changes(project, monkeypatch):
+    # Task modules import the paths of products from another module.
+    monkeypatch.syspath_prepend(project)
+    project.joinpath("config_of_target_test.py").write_text(
+        textwrap.dedent(_CONFIG).format(name="a.txt")
+    )
+    source = _TASK_A.replace('Path("a.txt")', "PATH_A")
+    project.joinpath("task_a.py").write_text(
+        "from config_of_target_test import PATH_A\n" + textwrap.dedent(source)
+    )
+    target = project.joinpath("b.txt").as_posix()
+    assert build(paths=project, target=target).exit_code == ExitCode.OK
+    assert not ProductIndex.from_root(project).is_outdated()
+
+    project.joinpath("config_of_target_test.py").write_text(
+        textwrap.dedent(_CONFIG).format(name="other.txt")
+    )
+    assert ProductIndex.from_root(project).is_outdated()
+
+    session = build(paths=project, target=target)
+
+    assert _collected_modules(session) == {"task_a.py", "task_b.py", "task_c.py"}
+    assert not ProductIndex.from_root(project).is_outdated()
+
+
+@pytest.mark.end_to_end()
+def test_unknown_target(runner, project):
+    result = runner.invoke(
+        cli, [project.as_posix(), "--target", project.joinpath("d.txt").as_posix()]
+    )
+
+    assert result.exit_code == ExitCode.DAG_FAILED
+    assert "isneitheraproduct" in result.output.replace(" ", "").replace("\n", "")
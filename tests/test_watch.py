@@ -0,0 +1,182 @@
+from __future__ import annotations
+
+import subprocess
+import sys
+import textwrap
+import time
+
+import networkx as nx
+import pytest
+from _pytask.watch import find_affected_tasks
+from _pytask.watch_utils import InotifyWatcher
+from _pytask.watch_utils import PollingWatcher
+from pytask import PathNode
+from pytask import Task
+
+
+@pytest.mark.unit()
+def test_find_affected_tasks(tmp_path):
+    """Create a DAG with ``in.txt -> task_a -> out.txt -> task_b`` and ``task_c``."""
+    source = PathNode.from_path(tmp_path / "in.txt")
+    product = PathNode.from_path(tmp_path / "out.txt")
+    task_a = Task(base_name="task_a", path=tmp_path / "task_a.py", function=None)
+    task_b = Task(base_name="task_b", path=tmp_path / "task_b.py", function=None)
+    task_c = Task(base_name="task_c", path=tmp_path / "task_c.py", function=None)
+
+    dag = nx.DiGraph()
+    for task in (task_a, task_b, task_c):
+        dag.add_node(task.signature, task=task)
+    for node in (source, product):
+        dag.add_node(node.signature, node=node)
+    dag.add_edge(source.signature, task_a.signature)
+    dag.add_edge(task_a.signature, product.signature)
+    dag.add_edge(product.signature, task_b.signature)
+
+    affected = find_affected_tasks(dag, modules=(), paths=[source.path])
+    assert affected == {task_a.signature, task_b.signature}
+
+    affected = find_affected_tasks(dag, modules=[task_b.path], paths=())
+    assert affected == {task_b.signature}
+
+    affected = find_affected_tasks(dag, modules=[task_c.path], paths=())
+    assert affected == {task_c.signature}
+
+
+@pytest.mark.unit()
+@pytest.mark.parametrize(
+    "create_watcher",
+    [
+        pytest.param(
+            lambda: InotifyWatcher.create(delay=0.05),
+            marks=pytest.mark.skipif(
+                sys.platform != "linux", reason="inotify is only available on Linux."
+            ),
+            id="inotify",
+        ),
+        pytest.param(lambda: PollingWatcher(delay=0.05, interval=0.05), id="polling"),
+    ],
+)
+def test_watcher_reports_changed_files(tmp_path, create_watcher):
+    tmp_path.joinpath("in.txt").write_text("Hello")
+
+    watcher = create_watcher()
+    watcher.watch([tmp_path])
+    try:
+        assert watcher.wait(timeout=0.1) == set()
+
+        # Ensure the modification time changes on file systems with coarse timestamps.
+        time.sleep(0.05)
+        tmp_path.joinpath("in.txt").write_text("Hello, World!")
+        tmp_path.joinpath("new.txt").write_text("New")
+        assert watcher.wait(timeout=5) == {
+            tmp_path.joinpath("in.txt"),
+            tmp_path.joinpath("new.txt"),
+        }
+    finally:
+        watcher.close()
+
+
+def _wait_for(condition, timeout=30):
+    start = time.monotonic()
+    while not condition():
+        if time.monotonic() - start > timeout:
+            msg = "Condition was not met in time."
+            raise TimeoutError(msg)
+        time.sleep(0.1)
+
+
+@pytest.mark.end_to_end()
+@pytest.mark.parametrize("polling", [False, True])
+def test_watch_executes_affected_tasks(tmp_path, polling):
+    source = """
+    from pathlib import Path
+    from typing_extensions import Annotated
+    from pytask import Product
+
+    def task_first(
+        path: Path = Path("in.txt"),
+        produces: Annotated[Path, Product] = Path("out.txt"),
+    ) -> None:
+        produces.write_text(path.read_text() + "!")
+
+    def task_second(
+        path: Path = Path("out.txt"),
+        produces: Annotated[Path, Product] = Path("out_2.txt"),
+    ) -> None:
+        produces.write_text(path.read_text() + "?")
+    """
+    tmp_path.joinpath("task_module.py").write_text(textwrap.dedent(source))
+    tmp_path.joinpath("in.txt").write_text("Hello")
+    product = tmp_path.joinpath("out_2.txt")
+
+    args = ["pytask", "watch", "--delay", "0.1"] + (["--polling"] if polling else [])
+    process = subprocess.Popen(
+        args,
+        cwd=tmp_path,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.STDOUT,
+    )
+    try:
+        # Wait until the states of a build are stored before the next change.
+        _wait_for(lambda: product.exists() and product.read_text() == "Hello!?")
+        time.sleep(0.5)
+
+        tmp_path.joinpath("in.txt").write_text("Hi")
+        _wait_for(lambda: product.read_text() == "Hi!?")
+        time.sleep(0.5)
+
+        tmp_path.joinpath("task_module.py").write_text(
+            textwrap.dedent(source.replace('"?"', '"?!"'))
+        )
+        _wait_for(lambda: product.read_text() == "Hi!?!")
+    finally:
+        process.terminate()
+        output = process.communicate(timeout=30)[0].decode()
+
+    assert output.count("Start pytask session") == 1
+    assert "Waiting for changes" in output
+
+
+@pytest.mark.end_to_end()
+@pytest.mark.parametrize("polling", [False, True])
+def test_watch_collects_modules_in_new_directories(tmp_path, polling):
+    source = """
+    from pathlib import Path
+    from typing_extensions import Annotated
+    from pytask import Product
+
+    def task_nested(produces: Annotated[Path, Product] = Path("out.txt")) -> None:
+        produces.write_text("Hello")
+    """
+
+    tmp_path.joinpath("task_first.py").write_text(textwrap.dedent(source))
+
+    args = ["pytask", "watch", "--delay", "0.1"] + (["--polling"] if polling else [])
+    process = subprocess.Popen(
+        args,
+        cwd=tmp_path,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.STDOUT,
+    )
+    try:
+        # Wait until the first build is finished and directories are watched.
+        _wait_for(lambda: tmp_path.joinpath("out.txt").exists())
+        time.sleep(0.5)
+
+        # Task modules in new nested directories.
+        tmp_path.joinpath("src").mkdir()
+        time.sleep(0.5)
+        nested = tmp_path.joinpath("src", "nested")
+        nested.mkdir()
+        nested.joinpath("task_nested.py").write_text(textwrap.dedent(source))
+        _wait_for(lambda: nested.joinpath("out.txt").exists())
+        time.sleep(0.5)
+
+        # A new module in a directory which existed before without task modules.
+        tmp_path.joinpath("src", "task_other.py").write_text(
+            textwrap.dedent(source.replace("task_nested", "task_other"))
+        )
+        _wait_for(lambda: tmp_path.joinpath("src", "out.txt").exists())
+    finally:
+        process.terminate()
+        process.communicate(timeout=30)
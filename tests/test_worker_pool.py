@@ -0,0 +1,186 @@
+from __future__ import annotations
+
+import os
+import textwrap
+
+import pytest
+from _pytask.worker_pool import pytask_parse_config
+from _pytask.worker_pool_utils import RemoteTraceback
+from _pytask.worker_pool_utils import WorkerPool
+from _pytask.worker_pool_utils import is_fork_available
+from pytask import ExitCode
+from pytask import Task
+from pytask import build
+from pytask import cli
+
+pytestmark = pytest.mark.skipif(
+    not is_fork_available(), reason="Processes cannot be forked."
+)
+
+
+def _get_pid() -> int:
+    return os.getpid()
+
+
+def _fail() -> None:
+    raise ValueError
+
+
+def _execute(task, payload):
+    return task.function(), payload
+
+
+@pytest.mark.unit()
+def test_execute_tasks_in_worker_pool(tmp_path):
+    task = Task(base_name="task_pid", path=tmp_path, function=_get_pid)
+    failing_task = Task(base_name="task_fail", path=tmp_path, function=_fail)
+    other_task = Task(base_name="task_other", path=tmp_path, function=_get_pid)
+
+    pool = WorkerPool()
+    pool.configure(n_workers=1, max_tasks_per_worker=2)
+    pool.start(
+        tasks={task.signature: task, failing_task.signature: failing_task},
+        function=_execute,
+    )
+    try:
+        assert pool.can_execute(task)
+        assert not pool.can_execute(other_task)
+
+        pool.submit(task, 1)
+        assert pool.is_full() or pool.is_complete(task)
+        for future in pool.futures():
+            future.result()
+        assert pool.is_complete(task)
+        pid, payload = pool.result(task)
+        assert pid != os.getpid()
+        assert payload == 1
+
+        pool.submit(failing_task, None)
+        for future in pool.futures():
+            future.exception()
+        with pytest.raises(ValueError) as exc_info:
+            pool.result(failing_task)
+        assert isinstance(exc_info.value.__cause__, RemoteTraceback)
+        assert "_fail" in str(exc_info.value.__cause__)
+
+        # The worker retired after two tasks and is replaced.
+        pool.submit(task, 2)
+        for future in pool.futures():
+            future.result()
+        other_pid, _ = pool.result(task)
+        assert other_pid != pid
+        assert pool.n_started == 2
+    finally:
+        pool.stop()
+    assert not pool.is_started
+
+
+@pytest.mark.unit()
+@pytest.mark.parametrize("command", ["serve", "watch"])
+def test_worker_processes_are_disabled_while_other_threads_run(command):
+    config = {"command": command, "worker_processes": 2}
+    with pytest.warns(UserWarning, match="Worker processes are not available"):
+        pytask_parse_config(config)
+    assert config["worker_processes"] == 0
+
+
+_SOURCE = """
+import os
+from pathlib import Path
+from typing_extensions import Annotated
+from pytask import Product
+from pytask import PythonNode
+
+node = PythonNode(name="pid")
+
+def task_first(path: Annotated[Path, Product] = Path("first.txt")) -> None:
+    print("Hello from the worker.")
+    path.write_text(str(os.getpid()))
+
+def task_second(path: Path = Path("first.txt")) -> Annotated[int, node]:
+    return os.getpid()
+
+def task_third(
+    pid: Annotated[int, node], path: Annotated[Path, Product] = Path("third.txt")
+) -> None:
+    path.write_text(f"{pid} {os.getpid()}")
+"""
+
+
+@pytest.mark.end_to_end()
+@pytest.mark.parametrize("max_tasks_per_worker", [0, 1])
+def test_execute_tasks_in_worker_processes(runner, tmp_path, max_tasks_per_worker):
+    tmp_path.joinpath("task_example.py").write_text(textwrap.dedent(_SOURCE))
+
+    result = runner.invoke(
+        cli,
+        [
+            tmp_path.as_posix(),
+            "--worker-processes",
+            "2",
+            "--max-tasks-per-worker",
+            str(max_tasks_per_worker),
+        ],
+    )
+    assert result.exit_code == ExitCode.OK
+    assert "3  Succeeded" in result.output
+
+    first = int(tmp_path.joinpath("first.txt").read_text())
+    second, third = map(int, tmp_path.joinpath("third.txt").read_text().split())
+    assert os.getpid() not in (first, second, third)
+    if max_tasks_per_worker:
+        assert len({first, second, third}) == 3
+
+    result = runner.invoke(cli, [tmp_path.as_posix(), "--worker-processes", "2"])
+    assert result.exit_code == ExitCode.OK
+    assert "3  Skipped because unchanged" in result.output
+
+
+@pytest.mark.end_to_end()
+def test_show_errors_and_output_of_tasks_in_worker_processes(runner, tmp_path):
+    source = """
+    def task_example():
+        print("Output of the failing task.")
+        raise ValueError("Failed in the worker.")
+    """
+    tmp_path.joinpath("task_example.py").write_text(textwrap.dedent(source))
+
+    result = runner.invoke(cli, [tmp_path.as_posix(), "--worker-processes", "1"])
+    assert result.exit_code == ExitCode.FAILED
+    assert "ValueError: Failed in the worker." in result.output
+    assert "Output of the failing task." in result.output
+    assert "_pytask" not in result.output
+
+
+@pytest.mark.end_to_end()
+def test_exception_info_of_tasks_in_worker_processes(tmp_path):
+    source = """
+    def task_example():
+        raise ValueError("Failed in the worker.")
+    """
+    tmp_path.joinpath("task_example.py").write_text(textwrap.dedent(source))
+
+    session = build(paths=tmp_path, worker_processes=1)
+    assert session.exit_code == ExitCode.FAILED
+
+    exc_type, exception, tb = session.execution_reports[0].exc_info
+    assert exc_type is ValueError
+    assert tb is None
+    assert isinstance(exception.__cause__, RemoteTraceback)
+    assert "in task_example" in str(exception.__cause__)
+
+
+@pytest.mark.end_to_end()
+def test_execute_tasks_in_worker_processes_with_build(tmp_path):
+    source = """
+    from pathlib import Path
+    from typing_extensions import Annotated
+
+    def task_example() -> Annotated[str, Path("out.txt")]:
+        return "Hello"
+    """
+    tmp_path.joinpath("task_example.py").write_text(textwrap.dedent(source))
+
+    session = build(paths=tmp_path, worker_processes=2)
+    assert session.exit_code == ExitCode.OK
+    assert tmp_path.joinpath("out.txt").read_text() == "Hello"
@@ -0,0 +1,106 @@
+from __future__ import annotations
+
+import textwrap
+
+import pytest
+from _pytask.exceptions import NodeSaveError
+from _pytask.write_behind_utils import ProductWriter
+from pytask import ExitCode
+from pytask import PickleNode
+from pytask import PythonNode
+from pytask import Task
+from pytask import cli
+
+
+@pytest.mark.unit()
+def test_save_products_in_background(tmp_path):
+    task = Task(base_name="task", path=tmp_path, function=None)
+    node = PickleNode(name="node", path=tmp_path / "node.pkl")
+    python_node = PythonNode(name="python_node")
+
+    writer = ProductWriter()
+    writer.configure(n_workers=1)
+    try:
+        writer.save(task, python_node, 1)
+        assert python_node.load() == 1
+        assert not writer.is_writing(task)
+
+        writer.save(task, node, [1, 2])
+        writer.result(task)
+        assert node.load() == [1, 2]
+        assert not writer.is_writing(task)
+        assert writer.futures() == []
+    finally:
+        writer.configure()
+
+
+@pytest.mark.unit()
+def test_raise_errors_while_saving_products(tmp_path):
+    task = Task(base_name="task", path=tmp_path, function=None)
+    node = PickleNode(name="node", path=tmp_path / "node.pkl")
+
+    writer = ProductWriter()
+    writer.configure(n_workers=1)
+    try:
+        writer.save(task, node, lambda x: x)
+        with pytest.raises(NodeSaveError, match="Exception while saving node 'node'"):
+            writer.result(task)
+    finally:
+        writer.configure()
+
+
+@pytest.mark.end_to_end()
+def test_execute_tasks_with_write_behind(runner, tmp_path):
+    source = """
+    from pathlib import Path
+    from typing_extensions import Annotated
+    from pytask import PickleNode
+
+    node = PickleNode(name="node", path=Path("data.pkl"))
+
+    def task_create() -> Annotated[list, node]:
+        return list(range(10))
+
+    def task_other() -> Annotated[str, Path("other.txt")]:
+        return "other"
+
+    def task_sum(values: Annotated[list, node]) -> Annotated[str, Path("sum.txt")]:
+        return str(sum(values))
+    """
+    tmp_path.joinpath("task_example.py").write_text(textwrap.dedent(source))
+
+    result = runner.invoke(cli, [tmp_path.as_posix(), "--write-behind", "2"])
+    assert result.exit_code == ExitCode.OK
+    assert "3  Succeeded" in result.output
+    assert tmp_path.joinpath("sum.txt").read_text() == "45"
+    assert tmp_path.joinpath("other.txt").read_text() == "other"
+
+    result = runner.invoke(cli, [tmp_path.as_posix(), "--write-behind", "2"])
+    assert result.exit_code == ExitCode.OK
+    assert "3  Skipped because unchanged" in result.output
+
+
+@pytest.mark.end_to_end()
+def test_report_errors_while_saving_against_producer(runner, tmp_path):
+    source = """
+    from pathlib import Path
+    from typing import Any
+    from typing_extensions import Annotated
+    from pytask import PickleNode
+
+    node = PickleNode(name="node", path=Path("data.pkl"))
+
+    def task_create() -> Annotated[Any, node]:
+        return lambda x: x
+
+    def task_use(value: Annotated[Any, node]) -> Annotated[str, Path("out.txt")]:
+        return "out"
+    """
+    tmp_path.joinpath("task_example.py").write_text(textwrap.dedent(source))
+
+    result = runner.invoke(cli, [tmp_path.as_posix(), "--write-behind", "1"])
+    assert result.exit_code == ExitCode.FAILED
+    assert "Task task_example.py::task_create failed" in result.output
+    assert "Exception while saving node 'node'" in result.output
+    assert "1  Skipped because previous failed" in result.output
+    assert not tmp_path.joinpath("out.txt").exists()